@@ -191,7 +191,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         # SOTA: EXCEPTION_LOGGED means exception was already logged - ack message (no retry)
         success_statuses = ("OK", "ALREADY_PROCESSED", "EXCEPTION_LOGGED")
         return func.HttpResponse(
-            json.dumps(result.model_dump()),
+            result.model_dump_json(),
             status_code=200 if result.status in success_statuses else 422,
             mimetype="application/json"
         )
@@ -164,7 +164,7 @@ def handle_delivery_ingest(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="POST",
             url="/api/deliveries/ingest",
-            body=json.dumps(request.model_dump()).encode(),
+            body=request.model_dump_json().encode(),
             headers={"Content-Type": "application/json"},
         )
 
@@ -286,7 +286,7 @@ def handle_delivery_update(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="PUT",
             url="/api/deliveries/ingest",
-            body=json.dumps(request.model_dump(exclude_none=True)).encode(),
+            body=request.model_dump_json(exclude_none=True).encode(),
             headers={"Content-Type": "application/json"},
         )
 
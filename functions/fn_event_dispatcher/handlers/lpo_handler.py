@@ -203,7 +203,7 @@ def handle_lpo_ingest(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="POST",
             url="/api/lpos/ingest",
-            body=json.dumps(request.model_dump()).encode(),
+            body=request.model_dump_json().encode(),
             headers={"Content-Type": "application/json"}
         )
         
@@ -316,7 +316,7 @@ def handle_lpo_update(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="PUT",
             url="/api/lpos/update",
-            body=json.dumps(request.model_dump(exclude_none=True)).encode(),
+            body=request.model_dump_json(exclude_none=True).encode(),
             headers={"Content-Type": "application/json"}
         )
         
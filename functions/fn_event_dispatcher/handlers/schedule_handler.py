@@ -170,7 +170,7 @@ def handle_schedule_ingest(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="POST",
             url="/api/production/schedule",
-            body=json.dumps(request.model_dump()).encode(),
+            body=request.model_dump_json().encode(),
             headers={"Content-Type": "application/json"}
         )
         
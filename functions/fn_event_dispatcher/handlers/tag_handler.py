@@ -174,7 +174,7 @@ def handle_tag_ingest(event: RowEvent) -> DispatchResult:
         mock_req = func.HttpRequest(
             method="POST",
             url="/api/tags/ingest",
-            body=json.dumps(request.model_dump()).encode(),
+            body=request.model_dump_json().encode(),
             headers={"Content-Type": "application/json"}
         )
         
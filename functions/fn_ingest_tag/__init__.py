@@ -123,10 +123,12 @@ from shared import (
     # User resolution (v1.6.8)
     resolve_user_email,
     # Audit (shared - DRY principle)
+    AuditBuffer,
     create_exception,
     log_user_action,
     # LPO Service (v1.6.6 DRY)
     find_lpo_flexible,
+    lpo_lookup_scope,
     # v1.6.9: Generic file upload to SharePoint
     trigger_upload_files_flow,
     FileUploadItem,
@@ -164,10 +166,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     trace_id = generate_trace_id()
     logger.info(f"[{trace_id}] Tag ingest request received")
     
+    # LPO lookups are cached and audit rows written together, per invocation
+    with lpo_lookup_scope(), AuditBuffer(trace_id=trace_id) as audit:
+        return _handle_ingest(req, trace_id, audit)
+
+
+def _handle_ingest(req: func.HttpRequest, trace_id: str, audit: AuditBuffer) -> func.HttpResponse:
+    """Run the tag ingest flow described in main()."""
     try:
         # 1. Parse request
-        request_data = req.get_json()
-        request = TagIngestRequest(**request_data)
+        request = TagIngestRequest.model_validate_json(req.get_body())
         logger.info(f"[{trace_id}] Processing request: client_request_id={request.client_request_id}")
         
         # Get Smartsheet client
@@ -240,7 +248,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     severity=ExceptionSeverity.MEDIUM,
                     related_tag_id=str(existing_tag_id) if existing_tag_id else None,
                     message=f"Duplicate file upload. Existing tag: {existing_tag_id}",
-                    client_request_id=request.client_request_id  # DEDUP (v1.6.5)
+                    client_request_id=request.client_request_id,  # DEDUP (v1.6.5)
+                    buffer=audit
                 )
                 log_user_action(
                     client=client,
@@ -249,7 +258,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     target_table=Sheet.TAG_REGISTRY,
                     target_id="N/A",
                     notes=f"Duplicate file upload rejected. Exception: {exception_id}",
-                    trace_id=trace_id
+                    trace_id=trace_id,
+                    buffer=audit
                 )
                 return func.HttpResponse(
                     json.dumps({
@@ -273,7 +283,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 reason_code=ReasonCode.LPO_NOT_FOUND,
                 severity=ExceptionSeverity.HIGH,
                 message=f"LPO not found: {request.lpo_sap_reference or request.customer_lpo_ref or request.lpo_id}",
-                client_request_id=request.client_request_id  # DEDUP (v1.6.5)
+                client_request_id=request.client_request_id,  # DEDUP (v1.6.5)
+                buffer=audit
             )
             log_user_action(
                 client=client,
@@ -282,7 +293,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 target_table=Sheet.TAG_REGISTRY,
                 target_id="N/A",
                 notes=f"LPO not found. Exception: {exception_id}",
-                trace_id=trace_id
+                trace_id=trace_id,
+                buffer=audit
             )
             return func.HttpResponse(
                 json.dumps({
@@ -308,7 +320,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 reason_code=ReasonCode.LPO_ON_HOLD,
                 severity=ExceptionSeverity.HIGH,
                 message=f"LPO {lpo.get(customer_lpo_ref_col)} is currently on hold",
-                client_request_id=request.client_request_id  # DEDUP (v1.6.5)
+                client_request_id=request.client_request_id,  # DEDUP (v1.6.5)
+                buffer=audit
             )
             log_user_action(
                 client=client,
@@ -317,7 +330,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 target_table=Sheet.TAG_REGISTRY,
                 target_id="N/A",
                 notes=f"LPO on hold. Exception: {exception_id}",
-                trace_id=trace_id
+                trace_id=trace_id,
+                buffer=audit
             )
             return func.HttpResponse(
                 json.dumps({
@@ -355,7 +369,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 severity=ExceptionSeverity.HIGH,
                 quantity=request.required_area_m2,
                 message=f"Required: {request.required_area_m2} m², Available: {remaining} m²",
-                client_request_id=request.client_request_id  # DEDUP (v1.6.5)
+                client_request_id=request.client_request_id,  # DEDUP (v1.6.5)
+                buffer=audit
             )
             log_user_action(
                 client=client,
@@ -364,7 +379,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 target_table=Sheet.TAG_REGISTRY,
                 target_id="N/A",
                 notes=f"Insufficient PO balance. Exception: {exception_id}",
-                trace_id=trace_id
+                trace_id=trace_id,
+                buffer=audit
             )
             return func.HttpResponse(
                 json.dumps({
@@ -489,7 +505,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             target_id=tag_id,
             new_value=json.dumps({"tag_name": tag_name, "required_area_m2": request.required_area_m2}),
             notes=f"Tag uploaded via API. Trace: {trace_id}",
-            trace_id=trace_id
+            trace_id=trace_id,
+            buffer=audit
         )
         
         # 8. Return success
@@ -102,6 +102,7 @@ from shared import (
     resolve_user_email,
     
     # Audit (shared - DRY)
+    AuditBuffer,
     create_exception,
     log_user_action,
     
@@ -137,11 +138,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     """
     trace_id = generate_trace_id()
     
+    with AuditBuffer(trace_id=trace_id) as audit:  # Audit rows written together on exit
+        return _handle_ingest(req, trace_id, audit)
+
+
+def _handle_ingest(req: func.HttpRequest, trace_id: str, audit: AuditBuffer) -> func.HttpResponse:
+    """Run the LPO ingest flow described in main()."""
     try:
         # 1. Parse request
         try:
-            body = req.get_json()
-            request = LPOIngestRequest(**body)
+            request = LPOIngestRequest.model_validate_json(req.get_body())
         except ValueError as e:
             logger.error(f"[{trace_id}] Request validation failed: {e}")
             
@@ -153,7 +159,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 reason_code=ReasonCode.LPO_INVALID_DATA,
                 severity=ExceptionSeverity.MEDIUM,
                 source=ExceptionSource.INGEST,
-                message=f"Validation error: {str(e)}"
+                message=f"Validation error: {str(e)}",
+                buffer=audit
             )
             
             return func.HttpResponse(
@@ -230,7 +237,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 reason_code=ReasonCode.DUPLICATE_SAP_REF,
                 severity=ExceptionSeverity.MEDIUM,
                 message=f"SAP Reference {request.sap_reference} already exists",
-                client_request_id=request.client_request_id  # Include for dedup
+                client_request_id=request.client_request_id,  # Include for dedup
+                buffer=audit
             )
             log_user_action(
                 client=client,
@@ -239,7 +247,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 target_table=Sheet.LPO_MASTER,
                 target_id="N/A",
                 notes=f"Duplicate SAP Reference. Exception: {exception_id}",
-                trace_id=trace_id
+                trace_id=trace_id,
+                buffer=audit
             )
             return func.HttpResponse(
                 json.dumps({
@@ -278,7 +287,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     trace_id=trace_id,
                     reason_code=ReasonCode.DUPLICATE_LPO_FILE,
                     severity=ExceptionSeverity.MEDIUM,
-                    message=f"Duplicate LPO file(s). Existing SAP: {existing_by_hash.get(_get_physical_column_name('LPO_MASTER', 'SAP_REFERENCE'))}"
+                    message=f"Duplicate LPO file(s). Existing SAP: {existing_by_hash.get(_get_physical_column_name('LPO_MASTER', 'SAP_REFERENCE'))}",
+                    buffer=audit
                 )
                 log_user_action(
                     client=client,
@@ -287,7 +297,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     target_table=Sheet.LPO_MASTER,
                     target_id="N/A",
                     notes=f"Duplicate LPO file(s). Exception: {exception_id}",
-                    trace_id=trace_id
+                    trace_id=trace_id,
+                    buffer=audit
                 )
                 return func.HttpResponse(
                     json.dumps({
@@ -308,7 +319,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 trace_id=trace_id,
                 reason_code=ReasonCode.LPO_INVALID_DATA,
                 severity=ExceptionSeverity.MEDIUM,
-                message=f"Invalid brand: {request.brand}. Must be KIMMCO or WTI."
+                message=f"Invalid brand: {request.brand}. Must be KIMMCO or WTI.",
+                buffer=audit
             )
             log_user_action(
                 client=client,
@@ -317,7 +329,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 target_table=Sheet.LPO_MASTER,
                 target_id="N/A",
                 notes=f"Invalid brand. Exception: {exception_id}",
-                trace_id=trace_id
+                trace_id=trace_id,
+                buffer=audit
             )
             return func.HttpResponse(
                 json.dumps({
@@ -410,7 +423,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             target_table=Sheet.LPO_MASTER,
             target_id=request.sap_reference,
             notes=f"LPO created via API. Folder: {folder_path}",
-            trace_id=trace_id
+            trace_id=trace_id,
+            buffer=audit
         )
         
         # 9. Trigger Power Automate flow for folder creation (fire-and-forget)
@@ -506,7 +520,8 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                 reason_code=ReasonCode.LPO_INVALID_DATA,
                 severity=ExceptionSeverity.HIGH,
                 source=ExceptionSource.INGEST,
-                message=f"Unexpected error: {str(e)}"
+                message=f"Unexpected error: {str(e)}",
+                buffer=audit
             )
         except Exception:
             exception_id = None  # Fallback if exception logging also fails
@@ -74,6 +74,11 @@ from shared import (
     # Audit (shared - DRY principle)
     create_exception,
     log_user_action,
+    
+    # LPO Service
+    find_lpo_by_sap_reference,
+    invalidate_lpo_cache,
+    lpo_lookup_scope,
 )
 
 
@@ -98,11 +103,16 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     """
     trace_id = generate_trace_id()
     
+    with lpo_lookup_scope():  # LPO lookups cached for this invocation only
+        return _handle_update(req, trace_id)
+
+
+def _handle_update(req: func.HttpRequest, trace_id: str) -> func.HttpResponse:
+    """Run the LPO update flow described in main()."""
     try:
         # 1. Parse request
         try:
-            body = req.get_json()
-            request = LPOUpdateRequest(**body)
+            request = LPOUpdateRequest.model_validate_json(req.get_body())
         except ValueError as e:
             logger.error(f"[{trace_id}] Request validation failed: {e}")
             return func.HttpResponse(
@@ -121,11 +131,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         client = get_smartsheet_client()
         
         # 2. Find LPO by SAP Reference
-        existing_lpo = client.find_row(
-            Sheet.LPO_MASTER,
-            Column.LPO_MASTER.SAP_REFERENCE,
-            request.sap_reference
-        )
+        existing_lpo = find_lpo_by_sap_reference(client, request.sap_reference)
         
         if not existing_lpo:
             logger.warning(f"[{trace_id}] LPO not found: {request.sap_reference}")
@@ -282,6 +288,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         
         # 5. Update the row
         client.update_row(Sheet.LPO_MASTER, row_id, updates)
+        invalidate_lpo_cache(sap_ref=request.sap_reference)
         logger.info(f"[{trace_id}] LPO updated: {request.sap_reference}")
         
         # 6. Log user action with old/new values
@@ -17,6 +17,7 @@ import json
 import base64
 import traceback
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple, Dict, Any
 
 from shared import (
@@ -517,48 +518,54 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         }
         
         # 8a. Upload Files to Blob Storage (v1.6.7)
-        json_blob_url = None
-        excel_blob_url = None
-        
-        try:
-            # v1.6.9: Imports moved to module level
-            # Upload JSON Output
-            json_blob_url = upload_nesting_json(
+        # v1.6.9: Imports moved to module level
+        # JSON output and original Excel are independent uploads - run them
+        # side by side, and resolve each on its own so a failed upload does
+        # not discard the other one's URL
+        blob_urls = {}
+        with ThreadPoolExecutor(max_workers=2) as upload_pool:
+            uploads = [("json", upload_pool.submit(
+                upload_nesting_json,
                 record_data=record.model_dump_rounded(),
                 nest_session_id=nest_session_id,
                 sap_lpo_reference=sap_lpo_reference,
                 trace_id=trace_id
-            )
-            if json_blob_url:
-                response_data["json_blob_url"] = json_blob_url
-                logger.info(f"JSON uploaded to blob: {json_blob_url}", extra={"trace_id": trace_id})
-                
-            # Upload Original Excel Input
+            ))]
             if file_bytes:
-                excel_blob_url = upload_content_blob(
+                # Upload Original Excel Input
+                uploads.append(("excel", upload_pool.submit(
+                    upload_content_blob,
                     content=file_bytes,
                     blob_name=filename,
                     trace_id=trace_id,
                     folder_path=sap_lpo_reference,
                     content_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-                )
-                if excel_blob_url:
-                    response_data["excel_blob_url"] = excel_blob_url
-                    logger.info(f"Excel uploaded to blob: {excel_blob_url}", extra={"trace_id": trace_id})
-                    
-        except Exception as blob_err:
-            logger.error(f"Failed to upload files to blob: {blob_err}", extra={"trace_id": trace_id})
-            # v1.6.9 SOTA: Create exception for tracking
-            create_exception(
-                client=client,
-                trace_id=trace_id,
-                source=ExceptionSource.PARSER,
-                reason_code=ReasonCode.FILE_UPLOAD_ERROR,
-                severity=ExceptionSeverity.LOW,
-                related_tag_id=tag_id,
-                message=f"Failed to upload files to blob storage: {blob_err}"
-            )
-            warnings.append({"code": "BLOB_UPLOAD_FAILED", "message": str(blob_err)})
+                )))
+            
+            for kind, future in uploads:
+                try:
+                    blob_url = future.result()
+                except Exception as blob_err:
+                    logger.error(f"Failed to upload {kind} file to blob: {blob_err}", extra={"trace_id": trace_id})
+                    # v1.6.9 SOTA: Create exception for tracking
+                    create_exception(
+                        client=client,
+                        trace_id=trace_id,
+                        source=ExceptionSource.PARSER,
+                        reason_code=ReasonCode.SYSTEM_ERROR,
+                        severity=ExceptionSeverity.LOW,
+                        related_tag_id=tag_id,
+                        message=f"Failed to upload {kind} file to blob storage: {blob_err}"
+                    )
+                    warnings.append({"code": "BLOB_UPLOAD_FAILED", "message": f"{kind}: {blob_err}"})
+                    continue
+                if blob_url:
+                    blob_urls[kind] = blob_url
+                    response_data[f"{kind}_blob_url"] = blob_url
+                    logger.info(f"{kind} file uploaded to blob: {blob_url}", extra={"trace_id": trace_id})
+        
+        json_blob_url = blob_urls.get("json")
+        excel_blob_url = blob_urls.get("excel")
         
         # 8b. Trigger Power Automate flow (v1.6.7)
         # v1.6.9 SOTA: consumed_area already calculated above (DRY fix)
@@ -98,6 +98,8 @@ from shared import (
     find_lpo_by_sap_reference,
     get_lpo_quantities,
     get_lpo_status,
+    invalidate_lpo_cache,
+    lpo_lookup_scope,
 )
 
 logger = logging.getLogger(__name__)
@@ -130,6 +132,12 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
     trace_id = generate_trace_id()
     logger.info(f"[{trace_id}] fn_schedule_tag invoked")
     
+    with lpo_lookup_scope():  # LPO lookups cached for this invocation only
+        return _handle_schedule(req, trace_id)
+
+
+def _handle_schedule(req: func.HttpRequest, trace_id: str) -> func.HttpResponse:
+    """Run the scheduling flow described in main()."""
     try:
         # 1. Parse request
         try:
@@ -224,13 +232,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
         if not lpo_ref:
             lpo_ref = tag.get(_get_physical_column_name("TAG_REGISTRY", "LPO_SAP_REFERENCE_LINK"))
         
-        lpo = None
-        if lpo_ref:
-            lpo = client.find_row(
-                Sheet.LPO_MASTER,
-                Column.LPO_MASTER.SAP_REFERENCE,
-                lpo_ref
-            )
+        lpo = find_lpo_by_sap_reference(client, lpo_ref)
         
         if not lpo:
             logger.warning(f"[{trace_id}] LPO not found for tag {request.tag_id}")
@@ -406,6 +408,7 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
                     Column.LPO_MASTER.UPDATED_AT: now,
                     Column.LPO_MASTER.UPDATED_BY: requested_by_email,
                 })
+                invalidate_lpo_cache(sap_ref=lpo_ref)
             except Exception as lpo_update_err:
                 logger.warning(f"[{trace_id}] Could not update LPO planned quantity: {lpo_update_err}")
         
@@ -48,6 +48,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from shared import (
+    AuditBuffer,
     get_smartsheet_client,
     generate_trace_id,
     ConsumptionSubmission,
@@ -106,8 +107,10 @@ def main(req: func.HttpRequest) -> func.HttpResponse:
             f"for {len(submission.allocation_ids)} allocations"
         )
         
-        # 3. Submit consumption (handles locking, validation, writes)
-        result = submit_consumption(client, submission, trace_id)
+        # 3. Submit consumption (handles locking, validation, writes).
+        # Its audit rows are written in bulk once the submission is done.
+        with AuditBuffer(client, trace_id=trace_id) as audit:
+            result = submit_consumption(client, submission, trace_id, buffer=audit)
         
         # 4. Map to HTTP status code
         status_code = 200
@@ -81,9 +81,6 @@ from .models import (
     TagIngestRequest,
     TagIngestResponse,
     ExceptionRecord,
-    UserActionRecord,
-    LPORecord,
-    TagRecord,
     # LPO models (v1.1.0+)
     Brand,
     TermsOfPayment,
@@ -98,7 +95,6 @@ from .models import (
     ScheduleStatus,
     MachineStatus,
     ScheduleTagRequest,
-    ScheduleTagRequest,
     ScheduleTagResponse,
     # Delivery models
     DeliveryStatus,
@@ -108,17 +104,6 @@ from .models import (
     FileUploadItem,
 )
 
-# Smartsheet client and exceptions
-from .smartsheet_client import (
-    SmartsheetClient,
-    get_smartsheet_client,
-    reset_smartsheet_client,
-    SmartsheetError,
-    SmartsheetRateLimitError,
-    SmartsheetSaveCollisionError,
-    SmartsheetNotFoundError,
-)
-
 # Manifest (ID-first architecture)
 from .manifest import (
     WorkspaceManifest,
@@ -142,11 +127,16 @@ from .logical_names import (
 from .id_generator import (
     SequenceGenerator,
     SequenceCollisionError,
+    BlockIdAllocator,
+    get_block_allocator,
+    get_sequence_generator,
     generate_next_tag_id,
     generate_next_lpo_id,  # v1.6.8
     generate_next_exception_id,
+    generate_next_exception_ids,
     generate_next_allocation_id,
     generate_next_consumption_id,
+    generate_next_consumption_ids,
     generate_next_delivery_id,
     generate_next_nesting_id,
     generate_next_remnant_id,
@@ -190,42 +180,12 @@ from .helpers import (
 
 # Audit utilities (DRY - shared across functions)
 from .audit import (
+    AuditBuffer,
+    ExceptionIdPool,
     create_exception,
     log_user_action,
 )
 
-# LPO Service (v1.6.6 - DRY compliance)
-from .lpo_service import (
-    # Lookup functions
-    find_lpo_by_sap_reference,
-    find_lpo_by_customer_ref,
-    find_lpo_flexible,
-    # Data extraction
-    get_lpo_quantities,
-    get_lpo_status,
-    get_lpo_sap_reference,
-    # Validation
-    validate_lpo_status,
-    validate_po_balance,
-    # Data classes
-    LPOQuantities,
-    LPOValidationResult,
-    LPOValidationStatus,
-)
-
-# Power Automate client (v1.3.1+)
-from .power_automate import (
-    FlowClient,
-    FlowClientConfig,
-    FlowTriggerResult,
-    FlowType,
-    get_flow_client,
-    get_flow_client,
-    trigger_create_lpo_folders,
-    trigger_nesting_complete_flow,  # v1.6.7
-    trigger_upload_files_flow,      # v1.6.9
-)
-
 # Atomic update helpers (v1.6.9 - SOTA fix for race conditions)
 from .atomic_update import (
     atomic_increment,
@@ -280,7 +240,70 @@ from .queue_lock import (
     LockHandle,
 )
 
-__all__ = [
+# Lazily imported modules
+# -----------------------
+# smartsheet_client, power_automate and lpo_service pull in the HTTP client
+# stacks and are not needed by every function, so their names are resolved
+# on first access (PEP 562) instead of at package import / cold start. The
+# record models are deferred the same way: no handler builds them.
+_LAZY_IMPORTS = {
+    # Record models
+    "UserActionRecord": ".record_models",
+    "LPORecord": ".record_models",
+    "TagRecord": ".record_models",
+    # Smartsheet client and exceptions
+    "SmartsheetClient": ".smartsheet_client",
+    "get_smartsheet_client": ".smartsheet_client",
+    "reset_smartsheet_client": ".smartsheet_client",
+    "SmartsheetError": ".smartsheet_client",
+    "SmartsheetRateLimitError": ".smartsheet_client",
+    "SmartsheetSaveCollisionError": ".smartsheet_client",
+    "SmartsheetNotFoundError": ".smartsheet_client",
+    # LPO Service (v1.6.6 - DRY compliance)
+    "find_lpo_by_sap_reference": ".lpo_service",
+    "find_lpo_by_customer_ref": ".lpo_service",
+    "find_lpo_flexible": ".lpo_service",
+    "lpo_lookup_scope": ".lpo_service",
+    "invalidate_lpo_cache": ".lpo_service",
+    "get_lpo_quantities": ".lpo_service",
+    "get_lpo_quantities_bulk": ".lpo_service",
+    "get_lpo_status": ".lpo_service",
+    "get_lpo_sap_reference": ".lpo_service",
+    "validate_lpo_status": ".lpo_service",
+    "validate_po_balance": ".lpo_service",
+    "LPOQuantities": ".lpo_service",
+    "LPOValidationResult": ".lpo_service",
+    "LPOValidationStatus": ".lpo_service",
+    # Power Automate client (v1.3.1+)
+    "FlowClient": ".power_automate",
+    "FlowClientConfig": ".power_automate",
+    "FlowTriggerResult": ".power_automate",
+    "FlowType": ".power_automate",
+    "get_flow_client": ".power_automate",
+    "trigger_create_lpo_folders": ".power_automate",
+    "trigger_nesting_complete_flow": ".power_automate",  # v1.6.7
+    "trigger_upload_files_flow": ".power_automate",      # v1.6.9
+}
+
+
+def __getattr__(name):
+    """Resolve lazily imported names on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so __getattr__ is not hit again
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# Public names: eager exports listed here, lazy ones come from _LAZY_IMPORTS,
+# so each name is registered exactly once.
+_EXPORTS = frozenset([
     # Sheet config (legacy - use logical_names for new code)
     "SheetName",
     "ColumnName",
@@ -299,9 +322,6 @@ __all__ = [
     "TagIngestRequest",
     "TagIngestResponse",
     "ExceptionRecord",
-    "UserActionRecord",
-    "LPORecord",
-    "TagRecord",
     # LPO models (v1.1.0+)
     "Brand",
     "TermsOfPayment",
@@ -309,21 +329,12 @@ __all__ = [
     "LPOUpdateRequest",
     "LPOIngestResponse",
     "LPOUpdateResponse",
-    "LPOUpdateResponse",
     # Delivery models
     "DeliveryStatus",
     "DeliveryIngestRequest",
     "DeliveryUpdateRequest",
     # Generic File Upload (v1.6.9)
     "FileUploadItem",
-    # Client and exceptions
-    "SmartsheetClient",
-    "get_smartsheet_client",
-    "reset_smartsheet_client",
-    "SmartsheetError",
-    "SmartsheetRateLimitError",
-    "SmartsheetSaveCollisionError",
-    "SmartsheetNotFoundError",
     # Manifest (ID-first)
     "WorkspaceManifest",
     "get_manifest",
@@ -340,10 +351,15 @@ __all__ = [
     # ID generation
     "SequenceGenerator",
     "SequenceCollisionError",
+    "BlockIdAllocator",
+    "get_block_allocator",
+    "get_sequence_generator",
     "generate_next_tag_id",
     "generate_next_exception_id",
+    "generate_next_exception_ids",
     "generate_next_allocation_id",
     "generate_next_consumption_id",
+    "generate_next_consumption_ids",
     "generate_next_delivery_id",
     "generate_next_nesting_id",
     "generate_next_remnant_id",
@@ -370,30 +386,13 @@ __all__ = [
     "UAE_TZ",
     "now_uae",
     # Audit utilities (DRY - v1.2.0+)
+    "AuditBuffer",
+    "ExceptionIdPool",
     "create_exception",
     "log_user_action",
-    # Power Automate (v1.3.1+)
-    "FlowClient",
-    "FlowClientConfig",
-    "FlowTriggerResult",
-    "FlowType",
-    "get_flow_client",
-    "trigger_create_lpo_folders",
-    "trigger_nesting_complete_flow", # v1.6.7
-    "trigger_upload_files_flow",     # v1.6.9
     # Event utils (v1.4.0+)
     "get_cell_value_by_column_id",
     "get_cell_value_by_logical_name",
-    # LPO Service (v1.6.6+ DRY)
-    "find_lpo_by_sap_reference",
-    "find_lpo_by_customer_ref",
-    "find_lpo_flexible",
-    "get_lpo_quantities",
-    "get_lpo_status",
-    "get_lpo_sap_reference",
-    "validate_lpo_status",
-    "validate_po_balance",
-    "LPOQuantities",
-    "LPOValidationResult",
-    "LPOValidationStatus",
-]
+]) | frozenset(_LAZY_IMPORTS)
+
+__all__ = sorted(_EXPORTS)
@@ -30,15 +30,18 @@ Usage:
         print(f"Failed: {result.error_message}")
 """
 
+import functools
 import logging
+import math
 import time
 import random
-from typing import Optional, Union
+from typing import Callable, Optional, Tuple, Union
 from dataclasses import dataclass
+from enum import Enum
 
 from .logical_names import Sheet, Column
-from .manifest import get_manifest
-from .helpers import parse_float_safe
+from .manifest import get_manifest, register_derived_cache
+from .helpers import DATACLASS_SLOTS, is_save_collision, parse_float_safe
 
 logger = logging.getLogger(__name__)
 
@@ -49,10 +52,25 @@ BASE_DELAY_MS = 100  # Starting delay
 MAX_DELAY_MS = 3000  # Maximum delay
 JITTER_MS = 50
 
+# Module-local RNG for backoff jitter (not shared with the global random state)
+_rng = random.Random()
 
-@dataclass
+
+@register_derived_cache
+@functools.lru_cache(maxsize=512)
+def _resolve_physical_col(sheet_name: str, column_name: str) -> Optional[str]:
+    """
+    Physical column name for a (sheet, column) logical pair.
+    
+    The mapping is fixed for the life of the manifest, so it is cached;
+    reset_manifest() clears this cache.
+    """
+    return get_manifest().get_column_name(sheet_name, column_name)
+
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class AtomicUpdateResult:
-    """Result of an atomic update operation."""
+    """Result of an atomic update operation (immutable)."""
     
     success: bool
     old_value: Optional[float] = None
@@ -65,42 +83,47 @@ class AtomicUpdateResult:
         return self.success
 
 
-def atomic_increment(
+def _values_match(current: float, expected: float, quantum: Optional[float] = None) -> bool:
+    """Compare two sheet values, tolerating float noise from the JSON round trip."""
+    if quantum:
+        return round(current / quantum) == round(expected / quantum)
+    return math.isclose(current, expected, rel_tol=1e-9, abs_tol=1e-6)
+
+
+def _atomic_cas(
     client,
     sheet_ref: Union[str, Sheet],
     row_id: int,
     column_ref: Union[str, Column],
-    increment_by: float,
+    apply: Callable[[float], Tuple[bool, Union[float, str]]],
+    operation: str,
     trace_id: str = "",
     max_retries: int = MAX_RETRIES
 ) -> AtomicUpdateResult:
     """
-    Atomically increment a numeric column value with retry on collision.
+    Shared read-compute-write loop with retry on save collision (4004).
     
-    Implements optimistic locking pattern:
-    1. Read current value
-    2. Compute new value
-    3. Attempt update
-    4. On collision (4004): retry with fresh read
+    `apply(current)` returns (True, new_value) to write new_value, or
+    (False, reason) to abort with VALUE_CHANGED without writing.
     
     Args:
         client: SmartsheetClient instance
         sheet_ref: Sheet logical name or Sheet enum
         row_id: Row ID to update
         column_ref: Column logical name or Column enum
-        increment_by: Amount to add (can be negative for decrement)
+        apply: Computes the new value from the freshly read current value
+        operation: Label for log lines (e.g. "Atomic increment", "CAS")
         trace_id: Trace ID for logging
-        max_retries: Maximum retry attempts
+        max_retries: Maximum retry attempts on collision
         
     Returns:
         AtomicUpdateResult with success status and old/new values
     """
-    sheet_name = sheet_ref.value if hasattr(sheet_ref, 'value') else sheet_ref
-    column_name = column_ref.value if hasattr(column_ref, 'value') else column_ref
+    sheet_name = sheet_ref.value if isinstance(sheet_ref, Enum) else sheet_ref
+    column_name = column_ref.value if isinstance(column_ref, Enum) else column_ref
     
     # Get physical column name via manifest
-    manifest = get_manifest()
-    physical_col = manifest.get_column_name(sheet_name, column_name)
+    physical_col = _resolve_physical_col(sheet_name, column_name)
     
     if not physical_col:
         logger.error(f"[{trace_id}] Column {column_name} not found in manifest for {sheet_name}")
@@ -126,7 +149,19 @@ def atomic_increment(
                 )
             
             current_value = parse_float_safe(current_row.get(physical_col), default=0.0)
-            new_value = current_value + increment_by
+            should_write, result = apply(current_value)
+            
+            if not should_write:
+                logger.warning(f"[{trace_id}] {operation} failed on {sheet_name}.{column_name}: {result}")
+                return AtomicUpdateResult(
+                    success=False,
+                    old_value=current_value,
+                    retries_used=attempt,
+                    error_code="VALUE_CHANGED",
+                    error_message=result
+                )
+            
+            new_value = result
             
             # 2. Attempt update
             client.update_row(
@@ -137,7 +172,7 @@ def atomic_increment(
             
             # 3. Success!
             logger.info(
-                f"[{trace_id}] Atomic increment {sheet_name}.{column_name}: "
+                f"[{trace_id}] {operation} {sheet_name}.{column_name}: "
                 f"{current_value} -> {new_value} (attempt {attempt + 1})"
             )
             
@@ -150,15 +185,14 @@ def atomic_increment(
             
         except Exception as e:
             last_error = e
-            error_str = str(e).lower()
             
             # Check if this is a collision error (4004)
-            is_collision = "4004" in error_str or "collision" in error_str or "conflict" in error_str
+            is_collision = is_save_collision(e)
             
             if is_collision and attempt < max_retries - 1:
                 # Exponential backoff with jitter
                 delay_ms = min(
-                    BASE_DELAY_MS * (2 ** attempt) + random.randint(0, JITTER_MS),
+                    BASE_DELAY_MS * (2 ** attempt) + _rng.randrange(JITTER_MS + 1),
                     MAX_DELAY_MS
                 )
                 logger.warning(
@@ -170,7 +204,7 @@ def atomic_increment(
             
             # Non-collision error or max retries exceeded
             logger.error(
-                f"[{trace_id}] Atomic increment failed for {sheet_name}.{column_name}: {e}"
+                f"[{trace_id}] {operation} failed for {sheet_name}.{column_name}: {e}"
             )
             
             return AtomicUpdateResult(
@@ -189,6 +223,45 @@ def atomic_increment(
     )
 
 
+def atomic_increment(
+    client,
+    sheet_ref: Union[str, Sheet],
+    row_id: int,
+    column_ref: Union[str, Column],
+    increment_by: float,
+    trace_id: str = "",
+    max_retries: int = MAX_RETRIES
+) -> AtomicUpdateResult:
+    """
+    Atomically increment a numeric column value with retry on collision.
+    
+    Implements optimistic locking pattern:
+    1. Read current value
+    2. Compute new value
+    3. Attempt update
+    4. On collision (4004): retry with fresh read
+    
+    Args:
+        client: SmartsheetClient instance
+        sheet_ref: Sheet logical name or Sheet enum
+        row_id: Row ID to update
+        column_ref: Column logical name or Column enum
+        increment_by: Amount to add (can be negative for decrement)
+        trace_id: Trace ID for logging
+        max_retries: Maximum retry attempts
+        
+    Returns:
+        AtomicUpdateResult with success status and old/new values
+    """
+    return _atomic_cas(
+        client, sheet_ref, row_id, column_ref,
+        apply=lambda current: (True, current + increment_by),
+        operation="Atomic increment",
+        trace_id=trace_id,
+        max_retries=max_retries
+    )
+
+
 def atomic_set_if_equals(
     client,
     sheet_ref: Union[str, Sheet],
@@ -196,12 +269,22 @@ def atomic_set_if_equals(
     column_ref: Union[str, Column],
     expected_value: float,
     new_value: float,
-    trace_id: str = ""
+    trace_id: str = "",
+    quantum: Optional[float] = None,
+    max_retries: int = MAX_RETRIES
 ) -> AtomicUpdateResult:
     """
     Compare-and-swap: Set value only if current equals expected.
     
-    Useful for status transitions or exclusive locks.
+    Useful for status transitions or exclusive locks. A save collision
+    (4004) is retried with a fresh read, like atomic_increment; a value
+    that really changed returns VALUE_CHANGED without retrying.
+    
+    Values come back from Smartsheet through a JSON round trip, so "equal"
+    is tolerance-based rather than raw float ==:
+    - default: math.isclose(rel_tol=1e-9, abs_tol=1e-6)
+    - with quantum (e.g. 0.01 for m² stored to 2 decimals): both values
+      are rounded to whole multiples of quantum and compared exactly
     
     Args:
         client: SmartsheetClient instance
@@ -211,63 +294,21 @@ def atomic_set_if_equals(
         expected_value: Expected current value
         new_value: New value to set
         trace_id: Trace ID for logging
+        quantum: Optional resolution for integer-quantized comparison
+        max_retries: Maximum retry attempts on collision
         
     Returns:
         AtomicUpdateResult with success status
     """
-    sheet_name = sheet_ref.value if hasattr(sheet_ref, 'value') else sheet_ref
-    column_name = column_ref.value if hasattr(column_ref, 'value') else column_ref
-    
-    manifest = get_manifest()
-    physical_col = manifest.get_column_name(sheet_name, column_name)
-    
-    if not physical_col:
-        return AtomicUpdateResult(
-            success=False,
-            error_code="COLUMN_NOT_FOUND",
-            error_message=f"Column {column_name} not found"
-        )
+    def apply(current: float) -> Tuple[bool, Union[float, str]]:
+        if not _values_match(current, expected_value, quantum):
+            return False, f"Current value {current} != expected {expected_value}"
+        return True, new_value
     
-    try:
-        current_row = client.get_row(sheet_name, row_id)
-        
-        if not current_row:
-            return AtomicUpdateResult(
-                success=False,
-                error_code="ROW_NOT_FOUND",
-                error_message=f"Row {row_id} not found"
-            )
-        
-        current_value = parse_float_safe(current_row.get(physical_col), default=0.0)
-        
-        if current_value != expected_value:
-            logger.warning(
-                f"[{trace_id}] CAS failed: {column_name} is {current_value}, "
-                f"expected {expected_value}"
-            )
-            return AtomicUpdateResult(
-                success=False,
-                old_value=current_value,
-                error_code="VALUE_CHANGED",
-                error_message=f"Current value {current_value} != expected {expected_value}"
-            )
-        
-        client.update_row(sheet_name, row_id, {column_ref: new_value})
-        
-        logger.info(
-            f"[{trace_id}] CAS success: {column_name} {current_value} -> {new_value}"
-        )
-        
-        return AtomicUpdateResult(
-            success=True,
-            old_value=current_value,
-            new_value=new_value
-        )
-        
-    except Exception as e:
-        logger.error(f"[{trace_id}] CAS failed: {e}")
-        return AtomicUpdateResult(
-            success=False,
-            error_code="UPDATE_ERROR",
-            error_message=str(e)
-        )
+    return _atomic_cas(
+        client, sheet_ref, row_id, column_ref,
+        apply=apply,
+        operation="CAS",
+        trace_id=trace_id,
+        max_retries=max_retries
+    )
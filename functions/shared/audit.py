@@ -10,15 +10,259 @@ _log_user_action implementations across multiple functions.
 """
 
 import logging
-from typing import Optional
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional, Tuple
 
 from .logical_names import Sheet, Column
 from .models import ExceptionSeverity, ExceptionSource, ReasonCode, ActionType
-from .id_generator import generate_next_exception_id, generate_next_action_id
-from .helpers import calculate_sla_due, format_datetime_for_smartsheet, now_uae
+from .sheet_config import ConfigKey
+from .id_generator import BlockIdAllocator, get_block_allocator
+from .helpers import UAE_TZ, calculate_sla_due, format_datetime_for_smartsheet
+from .audit_queue import AuditQueue
 
 logger = logging.getLogger(__name__)
 
+# Column name tables pre-bound once; the row builders below use them per call.
+_EX = Column.EXCEPTION_LOG
+_UA = Column.USER_ACTION_LOG
+
+
+# (epoch second, UAE datetime, Smartsheet string) for the current second
+_clock_cache: tuple = (None, None, "")
+
+
+def _clock_now() -> Tuple[datetime, str]:
+    """
+    Current UAE time and its Smartsheet string, rebuilt once per second.
+    
+    Audit timestamps have one-second resolution, so bursts of rows within
+    the same second share one datetime/format call.
+    """
+    global _clock_cache
+    second = int(time.time())
+    cached_second, now, now_str = _clock_cache
+    if second != cached_second:
+        now = datetime.fromtimestamp(second, UAE_TZ)
+        now_str = format_datetime_for_smartsheet(now)
+        _clock_cache = (second, now, now_str)  # Single assignment: safe across threads
+    return now, now_str
+
+
+class _DedupCache:
+    """Thread-safe LRU of client_request_id -> exception_id with a TTL."""
+    
+    def __init__(self, maxsize: int = 10_000, ttl_seconds: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: str, value: str):
+        with self._lock:
+            self._data[key] = (value, time.monotonic() + self.ttl_seconds)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def discard(self, key: str):
+        with self._lock:
+            self._data.pop(key, None)
+
+
+# Exception IDs already known to exist, per client (webhook retries replay
+# the same client_request_id; this skips their find_row sheet scan)
+_dedup_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_dedup_caches_lock = threading.Lock()
+
+
+# Exception IDs whose row is still waiting in the AuditQueue, per client.
+# Dropped once the write succeeds (moved to _dedup_caches) or fails; the
+# short TTL bounds how long a lost write can suppress a retry.
+_pending_caches: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_PENDING_TTL_SECONDS = 60.0
+
+
+def _dedup_cache_for(client) -> _DedupCache:
+    with _dedup_caches_lock:
+        cache = _dedup_caches.get(client)
+        if cache is None:
+            cache = _dedup_caches[client] = _DedupCache()
+        return cache
+
+
+def _pending_cache_for(client) -> _DedupCache:
+    with _dedup_caches_lock:
+        cache = _pending_caches.get(client)
+        if cache is None:
+            cache = _pending_caches[client] = _DedupCache(ttl_seconds=_PENDING_TTL_SECONDS)
+        return cache
+
+
+class ExceptionIdPool(BlockIdAllocator):
+    """
+    Pre-reserved Exception IDs for handlers that raise several exceptions.
+    
+    Usage:
+        with ExceptionIdPool(client, expected=8, trace_id=trace_id) as pool:
+            for line in lines:
+                create_exception(client, ..., exception_id=pool.next())
+    
+    `expected` IDs are reserved with one Config write; another block is
+    reserved if the pool runs dry. Unused IDs are discarded on exit
+    (sequence IDs are never reused).
+    """
+    
+    def __init__(self, client, expected: int = 1, trace_id: Optional[str] = None):
+        super().__init__(client, ConfigKey.SEQ_EXCEPTION, expected)
+        self.trace_id = trace_id
+    
+    def __enter__(self) -> "ExceptionIdPool":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        if self._ids:
+            logger.info(f"[{self.trace_id}] Discarding {len(self._ids)} unused exception IDs: {self.unused}")
+            self._ids.clear()
+        return False
+
+
+class AuditBuffer:
+    """
+    Collects audit rows for one request and writes them in bulk.
+    
+    Without a buffer every create_exception / log_user_action call costs
+    its own add_row round trip (plus one for the ID). With a buffer the
+    rows are kept in memory and written with one add_rows call per sheet,
+    and IDs are reserved in blocks via SequenceGenerator.reserve_batch.
+    
+    Usage:
+        with AuditBuffer(client, trace_id=trace_id, expected_exceptions=3) as buf:
+            create_exception(client, ..., buffer=buf)
+            log_user_action(client, ..., buffer=buf)
+        # Pending rows are flushed on exit (also when the block raises)
+    
+    HTTP entrypoints that emit several audit rows per request (fn_ingest_tag,
+    fn_lpo_ingest, fn_submit_consumption) open one buffer around the whole
+    invocation. The buffer may be created before the client exists: it
+    flushes through the client of the first row buffered into it.
+    
+    IDs are handed out as soon as the row is buffered, so callers can
+    reference them immediately; the rows themselves only exist in
+    Smartsheet after flush().
+    """
+    
+    def __init__(
+        self,
+        client=None,
+        trace_id: Optional[str] = None,
+        expected_exceptions: Optional[int] = None,
+        expected_actions: Optional[int] = None,
+    ):
+        """
+        Args:
+            client: SmartsheetClient used by flush() when none is passed
+            trace_id: Correlation ID for flush logging
+            expected_exceptions: Exception IDs to reserve per Config write for
+                                 this buffer. Without it, IDs come from the
+                                 shared per-client block allocator
+            expected_actions: Same, for Action IDs
+        """
+        self.client = client
+        self.trace_id = trace_id
+        self._block_sizes = {
+            ConfigKey.SEQ_EXCEPTION: expected_exceptions,
+            ConfigKey.SEQ_ACTION: expected_actions,
+        }
+        self._id_pools: Dict[ConfigKey, BlockIdAllocator] = {}
+        self._exception_rows: List[dict] = []
+        self._action_rows: List[dict] = []
+    
+    def __enter__(self) -> "AuditBuffer":
+        return self
+    
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.flush()
+        return False
+    
+    def __len__(self) -> int:
+        return len(self._exception_rows) + len(self._action_rows)
+    
+    def next_id(self, client, sequence_key: ConfigKey) -> str:
+        """Take the next reserved ID, reserving a new block when empty."""
+        pool = self._id_pools.get(sequence_key)
+        if pool is None:
+            block_size = self._block_sizes[sequence_key]
+            if block_size is None:
+                pool = get_block_allocator(client, sequence_key)
+            else:
+                pool = BlockIdAllocator(client, sequence_key, block_size)
+            self._id_pools[sequence_key] = pool
+        return pool.next()
+    
+    def add_exception(self, row_data: dict, client=None):
+        """Queue an Exception Log row (`client` is kept for flush if none is set)."""
+        if self.client is None:
+            self.client = client
+        self._exception_rows.append(row_data)
+    
+    def add_user_action(self, row_data: dict, client=None):
+        """Queue a User Action Log row (`client` is kept for flush if none is set)."""
+        if self.client is None:
+            self.client = client
+        self._action_rows.append(row_data)
+    
+    def find_exception(self, client_request_id: str) -> Optional[dict]:
+        """Return a pending exception row with this client_request_id, if any."""
+        for row in self._exception_rows:
+            if row.get(_EX.CLIENT_REQUEST_ID) == client_request_id:
+                return row
+        return None
+    
+    def flush(self, client=None):
+        """
+        Write all pending rows (one add_rows call per sheet).
+        
+        Failures are logged, not raised - audit writes never break the
+        caller, same as the unbuffered path.
+        """
+        client = client or self.client
+        if client is None:
+            if len(self):
+                logger.error(f"[{self.trace_id}] AuditBuffer has {len(self)} pending rows but no client to flush them")
+            return
+        
+        pending = (
+            (Sheet.EXCEPTION_LOG, self._exception_rows),
+            (Sheet.USER_ACTION_LOG, self._action_rows),
+        )
+        self._exception_rows, self._action_rows = [], []
+        
+        for sheet, rows in pending:
+            if not rows:
+                continue
+            try:
+                client.add_rows(sheet, rows)
+                logger.info(f"[{self.trace_id}] Flushed {len(rows)} audit rows to {sheet}")
+            except Exception as e:
+                logger.error(f"[{self.trace_id}] Failed to flush {len(rows)} audit rows to {sheet}: {e}")
+
 
 def create_exception(
     client,
@@ -32,6 +276,9 @@ def create_exception(
     quantity: Optional[float] = None,
     message: Optional[str] = None,
     client_request_id: Optional[str] = None,  # For deduplication (v1.6.5)
+    buffer: Optional[AuditBuffer] = None,
+    wait: bool = False,
+    exception_id: Optional[str] = None,
 ) -> str:
     """
     Create an exception record and return the exception_id.
@@ -43,7 +290,10 @@ def create_exception(
     If client_request_id is provided, the function will first check if an
     exception with this ID already exists. If so, it returns the existing
     exception_id without creating a duplicate. This prevents multiple exceptions
-    from webhook retries processing the same event.
+    from webhook retries processing the same event. IDs confirmed this way
+    (or written here) are cached per client for an hour, so repeat retries
+    skip the find_row scan. A queued row is only cached once its write
+    succeeds; until then a short-lived pending entry answers retries.
     
     Args:
         client: SmartsheetClient instance
@@ -57,55 +307,107 @@ def create_exception(
         quantity: Quantity involved if applicable
         message: Human-readable message for resolution action
         client_request_id: Idempotency key - if provided, dedup check is performed
+        buffer: Optional AuditBuffer - if provided, the row is queued and
+                written on buffer flush instead of immediately
+        wait: Defaults to False: the row is handed to the background
+              AuditQueue (written in bulk, flushed at interpreter exit) and
+              the call returns as soon as the ID is known. Pass True when
+              the row must exist before returning - e.g. the same invocation
+              reads or updates it, or the caller needs a failed write to
+              surface in its logs before it responds
+        exception_id: Pre-reserved ID (e.g. from ExceptionIdPool). Without
+                      one, the ID comes from a per-client block of
+                      AUDIT_ID_BLOCK_SIZE reserved IDs
         
     Returns:
         The generated exception_id (e.g., "EX-0001")
     """
     # DEDUP CHECK (v1.6.5): If client_request_id provided, check for existing exception
     if client_request_id:
+        if buffer is not None:
+            pending = buffer.find_exception(client_request_id)
+            if pending:
+                return pending[_EX.EXCEPTION_ID]
+        dedup_cache = _dedup_cache_for(client)
+        cached_id = dedup_cache.get(client_request_id) or _pending_cache_for(client).get(client_request_id)
+        if cached_id:
+            logger.debug(f"[{trace_id}] Exception already exists for {client_request_id}: {cached_id} (cached)")
+            return cached_id
         try:
             existing = client.find_row(
                 Sheet.EXCEPTION_LOG,
-                Column.EXCEPTION_LOG.CLIENT_REQUEST_ID,
+                _EX.CLIENT_REQUEST_ID,
                 client_request_id
             )
             if existing:
-                existing_id = existing.get(Column.EXCEPTION_LOG.EXCEPTION_ID) or existing.get("Exception ID")
+                existing_id = existing.get(_EX.EXCEPTION_ID) or existing.get("Exception ID")
                 logger.info(f"[{trace_id}] Exception already exists for {client_request_id}: {existing_id}")
+                if existing_id:
+                    dedup_cache.set(client_request_id, existing_id)
                 return existing_id
         except Exception as e:
             logger.warning(f"[{trace_id}] Exception dedup check failed: {e} - proceeding with creation")
     
-    exception_id = generate_next_exception_id(client)
-    now = now_uae()
+    # Use the caller's pre-reserved ID if given
+    if not exception_id:
+        if buffer is not None:
+            exception_id = buffer.next_id(client, ConfigKey.SEQ_EXCEPTION)
+        else:
+            exception_id = get_block_allocator(client, ConfigKey.SEQ_EXCEPTION).next()
+    # One clock read per record; CREATED_AT and SLA_DUE both derive from it
+    now, created_at_str = _clock_now()
+    sla_due_str = format_datetime_for_smartsheet(calculate_sla_due(severity, now))
     
     exception_data = {
-        Column.EXCEPTION_LOG.EXCEPTION_ID: exception_id,
-        Column.EXCEPTION_LOG.CREATED_AT: format_datetime_for_smartsheet(now),
-        Column.EXCEPTION_LOG.SOURCE: source.value,
-        Column.EXCEPTION_LOG.REASON_CODE: reason_code.value,
-        Column.EXCEPTION_LOG.SEVERITY: severity.value,
-        Column.EXCEPTION_LOG.STATUS: "Open",
-        Column.EXCEPTION_LOG.SLA_DUE: format_datetime_for_smartsheet(calculate_sla_due(severity, now)),
+        _EX.EXCEPTION_ID: exception_id,
+        _EX.CREATED_AT: created_at_str,
+        _EX.SOURCE: source.value,
+        _EX.REASON_CODE: reason_code.value,
+        _EX.SEVERITY: severity.value,
+        _EX.STATUS: "Open",
+        _EX.SLA_DUE: sla_due_str,
     }
     
     # Optional fields
     if client_request_id:
-        exception_data[Column.EXCEPTION_LOG.CLIENT_REQUEST_ID] = client_request_id
+        exception_data[_EX.CLIENT_REQUEST_ID] = client_request_id
     if related_tag_id:
-        exception_data[Column.EXCEPTION_LOG.RELATED_TAG_ID] = related_tag_id
+        exception_data[_EX.RELATED_TAG_ID] = related_tag_id
     if related_txn_id:
-        exception_data[Column.EXCEPTION_LOG.RELATED_TXN_ID] = related_txn_id
+        exception_data[_EX.RELATED_TXN_ID] = related_txn_id
     if material_code:
-        exception_data[Column.EXCEPTION_LOG.MATERIAL_CODE] = material_code
+        exception_data[_EX.MATERIAL_CODE] = material_code
     if quantity is not None:
-        exception_data[Column.EXCEPTION_LOG.QUANTITY] = quantity
+        exception_data[_EX.QUANTITY] = quantity
     if message:
-        exception_data[Column.EXCEPTION_LOG.RESOLUTION_ACTION] = message
+        exception_data[_EX.RESOLUTION_ACTION] = message
+    
+    if buffer is not None:
+        buffer.add_exception(exception_data, client)
+        return exception_id
+    
+    if not wait:
+        on_done = None
+        if client_request_id:
+            # Retries arriving before the queue drains see the pending ID;
+            # only a written row is remembered for the full dedup TTL
+            pending_ids = _pending_cache_for(client)
+            pending_ids.set(client_request_id, exception_id)
+            dedup_cache = _dedup_cache_for(client)
+            
+            def on_done(written: bool):
+                if written:
+                    dedup_cache.set(client_request_id, exception_id)
+                pending_ids.discard(client_request_id)
+        
+        AuditQueue.instance().enqueue(client, Sheet.EXCEPTION_LOG, exception_data, trace_id, on_done)
+        return exception_id
     
     try:
         client.add_row(Sheet.EXCEPTION_LOG, exception_data)
-        logger.info(f"[{trace_id}] Exception created: {exception_id}")
+        logger.debug(f"[{trace_id}] Exception created: {exception_id}")
+        if client_request_id:
+            _dedup_cache_for(client).set(client_request_id, exception_id)
     except Exception as e:
         logger.error(f"[{trace_id}] Failed to create exception: {e}")
     
@@ -122,6 +424,8 @@ def log_user_action(
     new_value: Optional[str] = None,
     notes: Optional[str] = None,
     trace_id: Optional[str] = None,
+    buffer: Optional[AuditBuffer] = None,
+    wait: bool = False,
 ) -> Optional[str]:
     """
     Log a user action to the audit trail.
@@ -143,10 +447,21 @@ def log_user_action(
         new_value: New value (for creates/updates)
         notes: Additional notes about the action
         trace_id: Correlation ID for tracing
+        buffer: Optional AuditBuffer - if provided, the row is queued and
+                written on buffer flush instead of immediately
+        wait: Defaults to False: the row is handed to the background
+              AuditQueue (written in bulk, and flushed at interpreter
+              exit); the action_id is returned immediately and write
+              failures are only logged. Pass True to write the row before
+              returning, e.g. when the same invocation reads it back
         
     Returns:
         The generated action_id (e.g., "ACT-0001") or None if failed
+        (None only when wait=True)
     """
+    timestamp_str = _clock_now()[1]
+    action_type_str = action_type.value
+    
     # Email resolution (v1.6.7): Convert numeric user IDs to email
     if user_id and str(user_id).isdigit():
         try:
@@ -157,36 +472,43 @@ def log_user_action(
             logger.debug(f"Failed to resolve user_id {user_id} to email: {e}")
     
     # Generate action ID
-    action_id = generate_next_action_id(client)
+    if buffer is not None:
+        action_id = buffer.next_id(client, ConfigKey.SEQ_ACTION)
+    else:
+        action_id = get_block_allocator(client, ConfigKey.SEQ_ACTION).next()
     
-    target_table_str = target_table
-    if hasattr(target_table, 'value'):
-        target_table_str = target_table.value
-    elif not isinstance(target_table, str):
-        target_table_str = str(target_table)
+    target_table_str = target_table.value if isinstance(target_table, Enum) else str(target_table)
     
     action_data = {
-        Column.USER_ACTION_LOG.ACTION_ID: action_id,
-        Column.USER_ACTION_LOG.TIMESTAMP: format_datetime_for_smartsheet(now_uae()),
-        Column.USER_ACTION_LOG.USER_ID: user_id,
-        Column.USER_ACTION_LOG.ACTION_TYPE: action_type.value,
-        Column.USER_ACTION_LOG.TARGET_TABLE: target_table_str,
-        Column.USER_ACTION_LOG.TARGET_ID: target_id,
+        _UA.ACTION_ID: action_id,
+        _UA.TIMESTAMP: timestamp_str,
+        _UA.USER_ID: user_id,
+        _UA.ACTION_TYPE: action_type_str,
+        _UA.TARGET_TABLE: target_table_str,
+        _UA.TARGET_ID: target_id,
     }
     
     # Optional fields
     if old_value:
-        action_data[Column.USER_ACTION_LOG.OLD_VALUE] = old_value
+        action_data[_UA.OLD_VALUE] = old_value
     if new_value:
-        action_data[Column.USER_ACTION_LOG.NEW_VALUE] = new_value
+        action_data[_UA.NEW_VALUE] = new_value
     if notes:
-        action_data[Column.USER_ACTION_LOG.NOTES] = notes
+        action_data[_UA.NOTES] = notes
     elif trace_id:
-        action_data[Column.USER_ACTION_LOG.NOTES] = f"Trace: {trace_id}"
+        action_data[_UA.NOTES] = f"Trace: {trace_id}"
+    
+    if buffer is not None:
+        buffer.add_user_action(action_data, client)
+        return action_id
+    
+    if not wait:
+        AuditQueue.instance().enqueue(client, Sheet.USER_ACTION_LOG, action_data, trace_id)
+        return action_id
     
     try:
         client.add_row(Sheet.USER_ACTION_LOG, action_data)
-        logger.info(f"[{trace_id}] User action logged: {action_id} - {action_type.value}")
+        logger.debug(f"[{trace_id}] User action logged: {action_id} - {action_type_str}")
         return action_id
     except Exception as e:
         logger.error(f"[{trace_id}] Failed to log user action: {e}")
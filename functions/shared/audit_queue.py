@@ -0,0 +1,140 @@
+"""
+Background Audit Queue
+======================
+
+Process-wide queue for fire-and-forget audit rows: log_user_action by
+default, and create_exception with wait=False.
+
+A single daemon thread drains the queue and writes rows in bulk: it
+collects up to `max_batch` rows or waits at most `max_delay_ms` after the
+first one, then issues one add_rows call per (client, sheet). Under
+webhook bursts this turns one HTTP round trip per audit row into one per
+batch.
+
+Usage
+-----
+>>> from shared.audit_queue import AuditQueue
+>>> AuditQueue.instance().enqueue(client, Sheet.USER_ACTION_LOG, row, trace_id)
+>>> AuditQueue.instance().flush()  # Block until everything queued is written
+
+Rows still queued at interpreter exit are written by an atexit hook, so
+a worker shutting down does not drop them. Tests that read the audit
+sheets back should call flush() first.
+Write failures are logged, never raised - same as the synchronous path.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class AuditQueue:
+    """
+    In-process queue of audit rows drained by one background thread.
+
+    The worker thread is started on the first enqueue, so importing the
+    module does not spawn threads.
+    """
+
+    _instance: Optional["AuditQueue"] = None
+    _instance_lock = threading.Lock()
+
+    def __init__(self, max_batch: int = 100, max_delay_ms: int = 50):
+        """
+        Args:
+            max_batch: Maximum rows written per flush
+            max_delay_ms: Longest a row waits for others to join its batch
+        """
+        self.max_batch = max_batch
+        self.max_delay = max_delay_ms / 1000.0
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "AuditQueue":
+        """Get the process-wide queue (created on first use)."""
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+                    atexit.register(cls._instance.flush)
+        return cls._instance
+
+    def enqueue(
+        self,
+        client,
+        sheet: str,
+        row_data: dict,
+        trace_id: Optional[str] = None,
+        on_done: Optional[Callable[[bool], None]] = None
+    ):
+        """
+        Queue one row for `sheet`, written later via client.add_rows.
+        
+        on_done, if given, is called from the worker thread with True once
+        the row's batch is written, or False if the write failed.
+        """
+        self._ensure_worker()
+        self._queue.put((client, sheet, row_data, trace_id, on_done))
+
+    def flush(self):
+        """Block until every row queued so far has been written (or failed)."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_worker(self):
+        if self._thread is None:
+            with self._thread_lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(
+                        target=self._flush_loop, name="audit-queue", daemon=True
+                    )
+                    self._thread.start()
+
+    def _flush_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            try:
+                self._write(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    @staticmethod
+    def _write(batch: List[tuple]):
+        """One add_rows call per (client, sheet), preserving queue order."""
+        groups: Dict[Tuple[int, str], list] = {}
+        for client, sheet, row_data, trace_id, on_done in batch:
+            group = groups.setdefault((id(client), sheet), [client, sheet, [], trace_id, []])
+            group[2].append(row_data)
+            if on_done is not None:
+                group[4].append(on_done)
+
+        for client, sheet, rows, trace_id, callbacks in groups.values():
+            try:
+                client.add_rows(sheet, rows)
+                written = True
+                logger.debug(f"[{trace_id}] Wrote {len(rows)} queued audit rows to {sheet}")
+            except Exception as e:
+                written = False
+                logger.error(f"[{trace_id}] Failed to write {len(rows)} queued audit rows to {sheet}: {e}")
+            for on_done in callbacks:
+                try:
+                    on_done(written)
+                except Exception as e:
+                    logger.error(f"[{trace_id}] Audit queue callback failed: {e}")
@@ -22,9 +22,23 @@ Usage:
 import os
 import json
 import logging
+import math
+import functools
 from typing import Optional, Dict, Any
 from datetime import datetime
 
+try:
+    from azure.storage.blob import BlobServiceClient, ContentSettings
+    _HAS_AZURE_BLOB = True
+except ImportError:  # pragma: no cover - depends on environment
+    BlobServiceClient = ContentSettings = None
+    _HAS_AZURE_BLOB = False
+
+try:
+    import orjson  # Optional: faster serialization for upload_json_blob
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Default container name
@@ -35,9 +49,16 @@ def get_blob_service_client():
     """
     Get Azure Blob Service Client.
     
+    The client is created once per connection string and reused, so
+    uploads share its HTTP connection pool.
+    
     Returns:
         BlobServiceClient or None if not configured
     """
+    if not _HAS_AZURE_BLOB:
+        logger.error("azure-storage-blob package not installed")
+        return None
+    
     connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
     
     if not connection_string:
@@ -45,16 +66,23 @@ def get_blob_service_client():
         return None
     
     try:
-        from azure.storage.blob import BlobServiceClient
-        return BlobServiceClient.from_connection_string(connection_string)
-    except ImportError:
-        logger.error("azure-storage-blob package not installed")
-        return None
+        return _blob_service_client_for(connection_string)
     except Exception as e:
         logger.error(f"Failed to create BlobServiceClient: {e}")
         return None
 
 
+@functools.lru_cache(maxsize=4)
+def _blob_service_client_for(connection_string: str):
+    """Create (once) the BlobServiceClient for a connection string."""
+    return BlobServiceClient.from_connection_string(connection_string)
+
+
+def _join_blob_path(folder_path: Optional[str], blob_name: str) -> str:
+    """Full blob name: "{folder_path}/{blob_name}", or blob_name alone."""
+    return f"{folder_path}/{blob_name}" if folder_path else blob_name
+
+
 def get_container_name() -> str:
     """Get the container name from environment or default."""
     return os.environ.get("BLOB_CONTAINER_NAME", DEFAULT_CONTAINER_NAME)
@@ -89,18 +117,12 @@ def upload_content_blob(
     
     container_name = get_container_name()
     
-    # Build full blob path
-    if folder_path:
-        full_blob_name = f"{folder_path}/{blob_name}"
-    else:
-        full_blob_name = blob_name
+    full_blob_name = _join_blob_path(folder_path, blob_name)
     
     try:
         container_client = service_client.get_container_client(container_name)
         blob_client = container_client.get_blob_client(full_blob_name)
         
-        from azure.storage.blob import ContentSettings
-        
         # Merge default metadata with provided
         final_meta = {
             "trace_id": trace_id,
@@ -132,13 +154,17 @@ def upload_json_blob(
     blob_name: str,
     trace_id: str,
     folder_path: Optional[str] = None,
-    content_type: str = "application/json"
+    content_type: str = "application/json",
+    pretty: bool = False
 ) -> Optional[str]:
     """
     Upload JSON data to Azure Blob Storage.
+    
+    Serialized compactly (orjson when installed); pass pretty=True for an
+    indented document when debugging.
     """
     try:
-        json_content = json.dumps(data, indent=2, default=str).encode('utf-8')
+        json_content = _dumps_json(data, pretty)
         return upload_content_blob(
             content=json_content,
             blob_name=blob_name,
@@ -151,6 +177,54 @@ def upload_json_blob(
         return None
 
 
+def _finite_or_none(value: Any) -> Any:
+    """Copy of `value` with NaN / Infinity floats replaced by None (as orjson writes them)."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {k: _finite_or_none(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(v) for v in value]
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    """default= hook: numpy values as plain Python (as orjson writes them), else str()."""
+    if type(value).__module__ == "numpy" and hasattr(value, "tolist"):
+        return value.tolist()
+    return str(value)
+
+
+def _dumps_json(data: Any, pretty: bool = False) -> bytes:
+    """
+    Serialize to UTF-8 JSON bytes; non-JSON values fall back to str().
+    
+    numpy scalars and arrays (e.g. from pandas) are written as numbers on
+    both paths rather than being stringified.
+    
+    NaN / Infinity are written as null on both paths: orjson does this
+    itself, the stdlib would emit the non-standard NaN / Infinity tokens.
+    """
+    if orjson is not None and not pretty:
+        try:
+            # Datetimes passed through to default=str so output matches json.dumps
+            return orjson.dumps(
+                data,
+                default=str,
+                option=(
+                    orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_SERIALIZE_NUMPY
+                ),
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits - let the stdlib handle it
+    data = _finite_or_none(data)
+    if pretty:
+        return json.dumps(data, indent=2, default=_json_default).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), default=_json_default).encode('utf-8')
+
+
 def upload_nesting_json(
     record_data: Dict[str, Any],
     nest_session_id: str,
@@ -201,10 +275,7 @@ def get_blob_url(
     
     container_name = get_container_name()
     
-    if folder_path:
-        full_blob_name = f"{folder_path}/{blob_name}"
-    else:
-        full_blob_name = blob_name
+    full_blob_name = _join_blob_path(folder_path, blob_name)
     
     try:
         container_client = service_client.get_container_client(container_name)
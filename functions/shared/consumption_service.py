@@ -25,7 +25,7 @@ from .logical_names import Sheet, Column
 from .manifest import get_manifest
 from .models import ActionType, ExceptionSeverity, ExceptionSource, ReasonCode
 from .helpers import parse_float_safe, now_uae
-from .audit import create_exception, log_user_action
+from .audit import AuditBuffer, create_exception, log_user_action
 from .flow_models import (
     ConsumptionSubmission,
     ConsumptionSubmissionFromCard,
@@ -224,7 +224,8 @@ def parse_card_data_to_submission(client, raw: ConsumptionSubmissionFromCard, tr
 def submit_consumption(
     client,
     submission: ConsumptionSubmission,
-    trace_id: str = ""
+    trace_id: str = "",
+    buffer: Optional[AuditBuffer] = None
 ) -> SubmissionResult:
     """
     Submit consumption with locking and idempotency.
@@ -240,6 +241,8 @@ def submit_consumption(
         client: SmartsheetClient instance
         submission: ConsumptionSubmission model
         trace_id: Trace ID for logging and idempotency
+        buffer: Optional AuditBuffer collecting the exception / user action
+                rows (written when the caller's buffer flushes)
         
     Returns:
         SubmissionResult with status and warnings/errors
@@ -286,7 +289,7 @@ def submit_consumption(
             )
         
         # 4. Write to CONSUMPTION_LOG (one row per line)
-        from .id_generator import generate_next_consumption_id
+        from .id_generator import generate_next_consumption_ids
         from .inventory_service import log_inventory_transactions_batch
         
         col_tag_id = manifest.get_column_name(Sheet.CONSUMPTION_LOG, Column.CONSUMPTION_LOG.TAG_SHEET_ID)
@@ -338,6 +341,14 @@ def submit_consumption(
         
         inventory_txns = []
         
+        # Reserve every consumption ID up front: one Config write instead of one per row
+        id_count = sum(
+            (line.actual_qty > 0) + (line.accessories_qty > 0)
+            for line in submission.lines
+            if alloc_id_by_material.get(line.canonical_code)
+        )
+        consumption_ids = iter(generate_next_consumption_ids(client, id_count) if id_count else [])
+        
         for line in submission.lines:
             alloc_id = alloc_id_by_material.get(line.canonical_code, "")
             if not alloc_id:
@@ -349,7 +360,8 @@ def submit_consumption(
                         severity=ExceptionSeverity.MEDIUM,
                         source=ExceptionSource.ALLOCATION,
                         material_code=line.canonical_code,
-                        message=f"Material '{line.canonical_code}' has no matching allocation during consumption"
+                        message=f"Material '{line.canonical_code}' has no matching allocation during consumption",
+                        buffer=buffer
                     )
                 except Exception:
                     pass
@@ -359,7 +371,7 @@ def submit_consumption(
             
             # 1. Production Consumption Row
             if line.actual_qty > 0:
-                consumption_id = generate_next_consumption_id(client)
+                consumption_id = next(consumption_ids)
                 row_data = {
                     Column.CONSUMPTION_LOG.CONSUMPTION_ID: consumption_id,
                     Column.CONSUMPTION_LOG.TAG_SHEET_ID: tag_id,
@@ -380,7 +392,7 @@ def submit_consumption(
                 
             # 2. Accessory Consumption Row
             if line.accessories_qty > 0:
-                consumption_id = generate_next_consumption_id(client)
+                consumption_id = next(consumption_ids)
                 row_data = {
                     Column.CONSUMPTION_LOG.CONSUMPTION_ID: consumption_id,
                     Column.CONSUMPTION_LOG.TAG_SHEET_ID: tag_id,
@@ -445,7 +457,8 @@ def submit_consumption(
                     action_type=ActionType.CONSUMPTION_SUBMITTED,
                     target_table="CONSUMPTION_LOG", target_id=tag_id,
                     notes=f"Submitted {len(formatted_rows)} consumption rows for {tag_id}",
-                    trace_id=trace_id
+                    trace_id=trace_id,
+                    buffer=buffer
                 )
             except Exception as ua_err:
                 logger.warning(f"[{trace_id}] Failed to log user action: {ua_err}")
@@ -462,7 +475,8 @@ def submit_consumption(
                         reason_code=ReasonCode.SYSTEM_ERROR,
                         severity=ExceptionSeverity.CRITICAL,
                         source=ExceptionSource.ALLOCATION,
-                        message=f"Failed to log inventory transactions: {str(e)[:500]}"
+                        message=f"Failed to log inventory transactions: {str(e)[:500]}",
+                        buffer=buffer
                     )
                 except Exception:
                     pass
@@ -553,7 +567,8 @@ def submit_consumption(
                                 action_type=ActionType.TAG_UPDATED,
                                 target_table="TAG_REGISTRY", target_id=entry["tag_id"],
                                 new_value="Complete",
-                                trace_id=trace_id
+                                trace_id=trace_id,
+                                buffer=buffer
                             )
                     except Exception as ua_err:
                         logger.warning(f"[{trace_id}] Failed to log tag completion action: {ua_err}")
@@ -591,6 +606,7 @@ def submit_consumption(
                                             source=ExceptionSource.ALLOCATION,
                                             related_tag_id=str(t_id),
                                             message=f"Margin approval trigger failed: {str(me)[:500]}",
+                                            buffer=buffer,
                                         )
                                     except Exception:
                                         logger.error(f"[{trace_id}] Failed to create exception record for margin failure")
@@ -6,13 +6,28 @@ Shared utilities for event dispatcher handlers.
 All access is ID-based for resilience to renames.
 """
 
+import functools
 import logging
 from typing import Any, Optional
 
-from .manifest import get_manifest
+from .manifest import get_manifest, register_derived_cache
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+
+@register_derived_cache
+@functools.lru_cache(maxsize=4096)
+def _resolve_column_id(manifest, sheet_logical: str, column_logical: str) -> Optional[int]:
+    """
+    Memoized manifest.get_column_id.
+    
+    The manifest object is part of the key, so a reloaded (or patched)
+    manifest never sees IDs cached from a previous one.
+    """
+    return manifest.get_column_id(sheet_logical, column_logical)
+
 
 def get_cell_value_by_column_id(
     row_data: dict,
@@ -28,7 +43,12 @@ def get_cell_value_by_column_id(
     Returns:
         Cell value or None if not found
     """
-    return row_data.get(column_id) or row_data.get(str(column_id))
+    # get_row() keys by int; only fall back to the str form when the int
+    # key is absent (falsy cell values like 0 or "" are real values)
+    value = row_data.get(column_id, _MISSING)
+    if value is _MISSING:
+        return row_data.get(str(column_id))
+    return value
 
 
 def get_cell_value_by_logical_name(
@@ -50,8 +70,7 @@ def get_cell_value_by_logical_name(
     Returns:
         Cell value or None if column not found
     """
-    manifest = get_manifest()
-    column_id = manifest.get_column_id(sheet_logical, column_logical)
+    column_id = _resolve_column_id(get_manifest(), sheet_logical, column_logical)
     
     if column_id is None:
         logger.warning(
@@ -60,4 +79,4 @@ def get_cell_value_by_logical_name(
         return None
     
     # Row data is keyed by column_id (as int or string)
-    return row_data.get(column_id) or row_data.get(str(column_id))
+    return get_cell_value_by_column_id(row_data, column_id)
@@ -6,19 +6,31 @@ Note: ID generation functions have moved to id_generator.py
 which uses sequence-based IDs stored in the Config sheet.
 """
 
+import base64
+import functools
 import hashlib
+import os
+import re
+import sys
 import uuid
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional, Any, Dict
+from urllib.parse import quote
 from zoneinfo import ZoneInfo
 import requests
+from requests.adapters import HTTPAdapter
 
 from .models import ExceptionSeverity
+from .smartsheet_errors import SmartsheetSaveCollisionError
 
 # UAE timezone constant (UTC+4)
 UAE_TZ = ZoneInfo("Asia/Dubai")
 
+# dataclass(slots=True) needs Python 3.10+; README still lists 3.9 as supported
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
 def now_uae() -> datetime:
     """Current datetime in UAE timezone (UTC+4)."""
@@ -95,6 +107,30 @@ def resolve_user_email(client, user_id: str) -> str:
     return user_str
 
 
+def is_save_collision(exc: BaseException) -> bool:
+    """
+    True if `exc` is a Smartsheet save collision (errorCode 4004).
+    
+    SmartsheetClient raises SmartsheetSaveCollisionError for these; any
+    other exception is not a collision, whatever its message says.
+    """
+    return isinstance(exc, SmartsheetSaveCollisionError)
+
+
+_b64decode = base64.b64decode
+
+# Read size for streamed downloads in compute_file_hash_from_url
+HASH_CHUNK_SIZE = 64 * 1024
+
+# Upper bound on concurrent downloads in compute_combined_file_hash
+MAX_HASH_WORKERS = 8
+
+# Keep-alive session for file downloads: attachments of one LPO usually sit
+# on the same host, so later files reuse the TCP/TLS connection
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=MAX_HASH_WORKERS * 2))
+
+
 def compute_file_hash(file_content: bytes, filename: Optional[str] = None) -> str:
     """Compute SHA256 hash of file content, optionally including filename."""
     h = hashlib.sha256(file_content)
@@ -107,12 +143,23 @@ def compute_file_hash_from_url(file_url: str, auth_headers: Optional[Dict[str, s
     """
     Download file from URL and compute its hash.
     Returns None if download fails.
+    
+    The body is streamed into the hash in 64 KiB chunks, so large
+    attachments are never held in memory as a whole.
     """
     try:
         headers = auth_headers or {}
-        response = requests.get(file_url, headers=headers, timeout=30)
-        response.raise_for_status()
-        return compute_file_hash(response.content, filename=filename)
+        response = _HTTP_SESSION.get(file_url, headers=headers, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            h = hashlib.sha256()
+            for chunk in response.iter_content(chunk_size=HASH_CHUNK_SIZE):
+                h.update(chunk)
+        finally:
+            response.close()
+        if filename:
+            h.update(filename.encode("utf-8"))
+        return h.hexdigest()
     except Exception as e:
         logger.error(f"Failed to download file for hashing: {e}")
         return None
@@ -123,21 +170,41 @@ def compute_file_hash_from_base64(file_content_base64: str, filename: Optional[s
     Compute hash from base64 encoded file content.
     Returns None if decoding fails.
     """
-    import base64
     try:
-        file_bytes = base64.b64decode(file_content_base64)
+        file_bytes = _b64decode(file_content_base64)
         return compute_file_hash(file_bytes, filename=filename)
     except Exception as e:
         logger.error(f"Failed to decode base64 content for hashing: {e}")
         return None
 
 
+def _hash_attachment(f, include_filenames: bool) -> Optional[str]:
+    """Hash one attachment from its base64 content or its URL."""
+    fname = (getattr(f, 'file_name', None) or None) if include_filenames else None
+    file_content = getattr(f, 'file_content', None)
+    if file_content:
+        return compute_file_hash_from_base64(file_content, filename=fname)
+    file_url = getattr(f, 'file_url', None)
+    if file_url:
+        return compute_file_hash_from_url(file_url, filename=fname)
+    return None
+
+
+def _file_type_key(f) -> str:
+    """Sort key for attachments: the FileType value (or str for plain strings)."""
+    try:
+        return f.file_type.value
+    except AttributeError:
+        return str(f.file_type)
+
+
 def compute_combined_file_hash(files: list, include_filenames: bool = False) -> Optional[str]:
     """
     Compute a deterministic combined hash from multiple files.
 
     Files are sorted by file_type for consistent ordering.
-    Individual hashes are combined and hashed again.
+    Individual hashes are combined and hashed again. With several files,
+    the per-file downloads/decodes run on a small thread pool.
 
     Args:
         files: List of FileAttachment objects
@@ -152,19 +219,17 @@ def compute_combined_file_hash(files: list, include_filenames: bool = False) ->
         return None
 
     # Sort by file_type for deterministic ordering
-    sorted_files = sorted(files, key=lambda f: f.file_type.value if hasattr(f.file_type, 'value') else str(f.file_type))
+    sorted_files = sorted(files, key=_file_type_key)
 
-    individual_hashes = []
-    for f in sorted_files:
-        file_hash = None
-        fname = (getattr(f, 'file_name', None) or None) if include_filenames else None
-        if hasattr(f, 'file_content') and f.file_content:
-            file_hash = compute_file_hash_from_base64(f.file_content, filename=fname)
-        elif hasattr(f, 'file_url') and f.file_url:
-            file_hash = compute_file_hash_from_url(f.file_url, filename=fname)
+    # Downloads are independent I/O, so hash several files concurrently;
+    # map() keeps results in sorted_files order
+    if len(sorted_files) == 1:
+        results = [_hash_attachment(sorted_files[0], include_filenames)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_HASH_WORKERS, len(sorted_files))) as executor:
+            results = list(executor.map(lambda f: _hash_attachment(f, include_filenames), sorted_files))
 
-        if file_hash:
-            individual_hashes.append(file_hash)
+    individual_hashes = [h for h in results if h]
 
     if not individual_hashes:
         return None
@@ -174,6 +239,16 @@ def compute_combined_file_hash(files: list, include_filenames: bool = False) ->
     return hashlib.sha256(combined.encode()).hexdigest()
 
 
+# SLA window per severity (built once; timedelta objects are immutable)
+_SLA_DELTAS = {
+    ExceptionSeverity.CRITICAL: timedelta(hours=4),
+    ExceptionSeverity.HIGH: timedelta(hours=24),
+    ExceptionSeverity.MEDIUM: timedelta(hours=48),
+    ExceptionSeverity.LOW: timedelta(hours=72),
+}
+_SLA_DEFAULT_DELTA = timedelta(hours=48)
+
+
 def calculate_sla_due(severity: ExceptionSeverity, created_at: Optional[datetime] = None) -> datetime:
     """
     Calculate SLA due date based on severity.
@@ -183,16 +258,7 @@ def calculate_sla_due(severity: ExceptionSeverity, created_at: Optional[datetime
     - LOW: +72 hours
     """
     base_time = created_at or datetime.utcnow()
-
-    sla_hours = {
-        ExceptionSeverity.CRITICAL: 4,
-        ExceptionSeverity.HIGH: 24,
-        ExceptionSeverity.MEDIUM: 48,
-        ExceptionSeverity.LOW: 72,
-    }
-
-    hours = sla_hours.get(severity, 48)
-    return base_time + timedelta(hours=hours)
+    return base_time + _SLA_DELTAS.get(severity, _SLA_DEFAULT_DELTA)
 
 
 def format_datetime_for_smartsheet(dt: datetime) -> str:
@@ -203,8 +269,9 @@ def format_datetime_for_smartsheet(dt: datetime) -> str:
     - Timezone-aware datetimes are converted to UAE before formatting.
     """
     if dt.tzinfo is not None:
-        dt = dt.astimezone(UAE_TZ)
-    return dt.strftime("%Y-%m-%dT%H:%M:%S")
+        # Drop tzinfo after converting so isoformat() omits the +04:00 offset
+        dt = dt.astimezone(UAE_TZ).replace(tzinfo=None)
+    return dt.isoformat(timespec="seconds")
 
 
 def normalize_ref_value(value: Any) -> str:
@@ -326,6 +393,11 @@ def safe_get(d: Dict, *keys, default=None) -> Any:
     return d if d is not None else default
 
 
+# Characters invalid in SharePoint folder names -> "_"
+_FOLDER_NAME_TRANS = str.maketrans({c: '_' for c in '/\\:*?"<>|#%'})
+_UNDERSCORE_RUN = re.compile(r'_{2,}')
+
+
 def sanitize_folder_name(name: str) -> str:
     """
     Sanitize a string for use in SharePoint folder paths.
@@ -334,23 +406,20 @@ def sanitize_folder_name(name: str) -> str:
     if not name:
         return "Unknown"
     
-    # Replace invalid characters with underscore
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '#', '%']
-    result = name
-    for char in invalid_chars:
-        result = result.replace(char, '_')
+    # Replace invalid characters with underscore (single pass)
+    result = name.translate(_FOLDER_NAME_TRANS)
     
     # Remove leading/trailing spaces and dots
     result = result.strip(' .')
     
     # Replace multiple underscores with single
-    while '__' in result:
-        result = result.replace('__', '_')
+    result = _UNDERSCORE_RUN.sub('_', result)
     
     # Truncate to reasonable length (SharePoint limit considerations)
     return result[:50] if result else "Unknown"
 
 
+@functools.lru_cache(maxsize=1024)
 def generate_lpo_folder_path(
     sap_reference: str, 
     customer_name: str,
@@ -382,6 +451,10 @@ def generate_lpo_folder_path(
     return f"LPOs/{folder_name}"
 
 
+# Fallback when SHAREPOINT_BASE_URL is not set
+DEFAULT_SHAREPOINT_BASE_URL = "https://algurguae.sharepoint.com/sites/DuctsFabricationPlant/Ducts"
+
+
 def generate_lpo_folder_url(
     sap_reference: str,
     customer_name: str,
@@ -405,16 +478,16 @@ def generate_lpo_folder_url(
         >>> generate_lpo_folder_url("PTE-185", "Acme Corp")
         "https://algurguae.sharepoint.com/sites/DuctsFabricationPlant/Ducts/LPOs/PTE-185_Acme_Corp"
     """
-    import os
-    from urllib.parse import quote
-    
     # Get base URL from env if not provided
     if not base_url:
-        base_url = os.environ.get(
-            "SHAREPOINT_BASE_URL",
-            "https://algurguae.sharepoint.com/sites/DuctsFabricationPlant/Ducts"
-        )
+        base_url = os.environ.get("SHAREPOINT_BASE_URL", DEFAULT_SHAREPOINT_BASE_URL)
     
+    return _lpo_folder_url(base_url, sap_reference, customer_name)
+
+
+@functools.lru_cache(maxsize=1024)
+def _lpo_folder_url(base_url: str, sap_reference: str, customer_name: str) -> str:
+    """Build and encode the LPO folder URL (memoized; pure in its args)."""
     # Get relative path
     relative_path = generate_lpo_folder_path(sap_reference, customer_name)
     
@@ -12,20 +12,41 @@ This approach is:
 
 Concurrency handling:
 - Uses retry with collision detection since Smartsheet doesn't support atomic ops
-- Exponential backoff on retry to reduce contention
+- Exponential backoff with decorrelated jitter on retry to reduce contention
 """
 
 import logging
+import threading
 import time
 import random
-from typing import Optional
+import weakref
+from collections import deque
+from typing import Callable, Dict, List, Optional, Tuple
 
-from .helpers import now_uae
+from .helpers import is_save_collision, now_uae
 from .sheet_config import ConfigKey, ID_PREFIXES, SheetName, ColumnName
 
 logger = logging.getLogger(__name__)
 
 
+# Physical Config sheet name and the author recorded on sequence writes
+_CONFIG_SHEET = SheetName.CONFIG.value
+_SYSTEM_USER = "system"
+
+# "PREFIX-%0Nd".__mod__ per (sequence_key, padding), built on first use
+# (%-formatting of an int is cheaper than str.format)
+_FORMATTERS: Dict[Tuple[ConfigKey, int], Callable[[int], str]] = {}
+
+
+def _formatter(sequence_key: ConfigKey, padding: int) -> Callable[[int], str]:
+    """Get the bound %-formatter that renders a sequence value as an ID."""
+    fmt = _FORMATTERS.get((sequence_key, padding))
+    if fmt is None:
+        fmt = (ID_PREFIXES.get(sequence_key, "ID") + "-%0" + str(padding) + "d").__mod__
+        _FORMATTERS[(sequence_key, padding)] = fmt
+    return fmt
+
+
 class SequenceCollisionError(Exception):
     """Raised when a sequence collision is detected and max retries exceeded."""
     pass
@@ -60,7 +81,8 @@ class SequenceGenerator:
             smartsheet_client: Instance of SmartsheetClient
         """
         self.client = smartsheet_client
-        self._cache: dict = {}  # Cache for config row IDs and values
+        self._cache: dict = {}  # Config row IDs by sequence key
+        self._value_col_id: Optional[int] = None  # Config value column, resolved once
     
     def next_id(self, sequence_key: ConfigKey, padding: int = 4) -> str:
         """
@@ -80,71 +102,121 @@ class SequenceGenerator:
         Raises:
             SequenceCollisionError: If max retries exceeded due to contention
         """
+        return self.reserve_batch(sequence_key, 1, padding=padding)[0]
+    
+    def reserve_batch(self, sequence_key: ConfigKey, count: int, padding: int = 4) -> List[str]:
+        """
+        Reserve a contiguous block of sequential IDs in one Config write.
+        
+        The sequence is bumped by `count` with the same read/write/retry
+        cycle as next_id(), so N IDs cost one round trip instead of N.
+        IDs that the caller ends up not using are simply skipped (IDs are
+        never reused).
+        
+        Args:
+            sequence_key: ConfigKey enum for the sequence (e.g., ConfigKey.SEQ_EXCEPTION)
+            count: Number of IDs to reserve (must be >= 1)
+            padding: Number of digits to zero-pad (default: 4)
+        
+        Returns:
+            List of formatted ID strings in ascending order
+        
+        Raises:
+            ValueError: If count < 1
+            SequenceCollisionError: If max retries exceeded due to contention
+        """
+        if count < 1:
+            raise ValueError(f"count must be >= 1, got {count}")
+        
+        key_str = sequence_key.value
         last_error = None
+        delay_ms = self.BASE_DELAY_MS
         
         for attempt in range(self.MAX_RETRIES):
             try:
-                # Clear cache to get fresh value on retries
-                if attempt > 0:
-                    self._cache.pop(sequence_key, None)
-                
-                # Get current value (fresh read)
-                current = self._get_sequence_value(sequence_key)
-                expected_row_id = self._cache.get(sequence_key)
+                # Get current value (fresh read; full search on retries)
+                current, expected_row_id = self._get_sequence_value(sequence_key, search=attempt > 0)
                 
-                # Calculate next value
-                next_val = current + 1
+                # Calculate last value of the reserved block
+                last_val = current + count
                 
                 # Attempt to write back
-                success = self._try_update_sequence(sequence_key, next_val, expected_row_id)
+                success = self._try_update_sequence(sequence_key, last_val, expected_row_id)
                 
                 if success:
-                    # Format and return ID
-                    prefix = ID_PREFIXES.get(sequence_key, "ID")
-                    generated_id = f"{prefix}-{next_val:0{padding}d}"
-                    logger.debug(f"Generated ID: {generated_id} (attempt {attempt + 1})")
-                    return generated_id
+                    # Format and return IDs
+                    fmt = _formatter(sequence_key, padding)
+                    generated_ids = [fmt(val) for val in range(current + 1, last_val + 1)]
+                    logger.debug(
+                        f"Generated IDs: {generated_ids[0]}..{generated_ids[-1]} "
+                        f"(attempt {attempt + 1})"
+                    )
+                    return generated_ids
                 
                 # Collision detected - retry
-                logger.warning(f"Sequence collision for {sequence_key.value}, attempt {attempt + 1}/{self.MAX_RETRIES}")
+                logger.warning(f"Sequence collision for {key_str}, attempt {attempt + 1}/{self.MAX_RETRIES}")
                 
             except Exception as e:
                 last_error = e
-                logger.warning(f"Error generating ID for {sequence_key.value}: {e}, attempt {attempt + 1}/{self.MAX_RETRIES}")
+                logger.warning(f"Error generating ID for {key_str}: {e}, attempt {attempt + 1}/{self.MAX_RETRIES}")
             
-            # Exponential backoff with jitter
+            # Decorrelated-jitter backoff: concurrent retriers drift apart
+            # instead of waking in lockstep on BASE * 2**attempt
             if attempt < self.MAX_RETRIES - 1:
-                delay_ms = min(
-                    self.BASE_DELAY_MS * (2 ** attempt) + random.randint(0, 50),
-                    self.MAX_DELAY_MS
-                )
+                delay_ms = min(self.MAX_DELAY_MS, random.uniform(self.BASE_DELAY_MS, delay_ms * 3))
                 time.sleep(delay_ms / 1000.0)
         
         # All retries exhausted
-        error_msg = f"Failed to generate ID for {sequence_key.value} after {self.MAX_RETRIES} attempts"
+        error_msg = f"Failed to generate ID for {key_str} after {self.MAX_RETRIES} attempts"
         logger.error(error_msg)
         raise SequenceCollisionError(error_msg) from last_error
     
-    def _get_sequence_value(self, sequence_key: ConfigKey) -> int:
-        """Get current sequence value from Config sheet (fresh read)."""
+    def _get_sequence_value(self, sequence_key: ConfigKey, search: bool = False) -> Tuple[int, Optional[int]]:
+        """
+        Get current sequence value from Config sheet (fresh read).
+        
+        Once the sequence's Config row ID is known, only that row is
+        fetched; the full Config sheet is searched on first use, when
+        `search` is set (retries), or if the row has gone.
+        
+        Returns:
+            (current value, Config row ID)
+        """
+        row_id = None if search else self._cache.get(sequence_key)
+        if row_id is not None:
+            cells = self.client.get_row(_CONFIG_SHEET, row_id)
+            if cells is not None:
+                return self._parse_sequence_value(cells.get(self._config_value_column_id())), row_id
+        
+        key_str = sequence_key.value
         row = self.client.find_row_by_column(
-            SheetName.CONFIG.value,
+            _CONFIG_SHEET,
             ColumnName.CONFIG_KEY,
-            sequence_key.value
+            key_str
         )
         
         if row:
-            self._cache[sequence_key] = row.get("row_id")
-            value = row.get(ColumnName.CONFIG_VALUE)
-            try:
-                return int(value) if value else 0
-            except (ValueError, TypeError):
-                return 0
+            row_id = self._cache[sequence_key] = row.get("row_id")
+            return self._parse_sequence_value(row.get(ColumnName.CONFIG_VALUE)), row_id
         
         # Sequence doesn't exist, create it
-        logger.info(f"Creating new sequence: {sequence_key.value}")
-        self._create_sequence(sequence_key)
-        return 0
+        logger.info(f"Creating new sequence: {key_str}")
+        return 0, self._create_sequence(sequence_key)
+    
+    def _config_value_column_id(self) -> int:
+        """Column ID of the Config value column (resolved on first use)."""
+        if self._value_col_id is None:
+            self._value_col_id = self.client.resolve_column_id(
+                _CONFIG_SHEET, ColumnName.CONFIG_VALUE
+            )
+        return self._value_col_id
+    
+    @staticmethod
+    def _parse_sequence_value(value) -> int:
+        try:
+            return int(value) if value else 0
+        except (ValueError, TypeError):
+            return 0
     
     def _try_update_sequence(self, sequence_key: ConfigKey, new_value: int, expected_row_id: Optional[int]) -> bool:
         """
@@ -157,28 +229,28 @@ class SequenceGenerator:
         try:
             if expected_row_id:
                 self.client.update_row(
-                    SheetName.CONFIG.value,
+                    _CONFIG_SHEET,
                     expected_row_id,
                     {
                         ColumnName.CONFIG_VALUE: str(new_value),
-                        ColumnName.CHANGED_BY: "system"
+                        ColumnName.CHANGED_BY: _SYSTEM_USER
                     }
                 )
                 return True
             else:
                 # Row doesn't exist in cache, need to find it
                 row = self.client.find_row_by_column(
-                    SheetName.CONFIG.value,
+                    _CONFIG_SHEET,
                     ColumnName.CONFIG_KEY,
                     sequence_key.value
                 )
                 if row:
                     self.client.update_row(
-                        SheetName.CONFIG.value,
+                        _CONFIG_SHEET,
                         row.get("row_id"),
                         {
                             ColumnName.CONFIG_VALUE: str(new_value),
-                            ColumnName.CHANGED_BY: "system"
+                            ColumnName.CHANGED_BY: _SYSTEM_USER
                         }
                     )
                     return True
@@ -188,23 +260,23 @@ class SequenceGenerator:
                     return True
                     
         except Exception as e:
-            # Check if this was a collision (4004 error)
-            error_str = str(e).lower()
-            if "4004" in error_str or "collision" in error_str or "conflict" in error_str:
+            # Save collision (4004): let reserve_batch retry with a fresh read
+            if is_save_collision(e):
                 return False
             # Re-raise other errors
             raise
     
-    def _create_sequence(self, sequence_key: ConfigKey, initial_value: int = 0):
-        """Create a new sequence row in Config sheet."""
+    def _create_sequence(self, sequence_key: ConfigKey, initial_value: int = 0) -> Optional[int]:
+        """Create a new sequence row in Config sheet and return its row ID."""
         row_data = {
             ColumnName.CONFIG_KEY: sequence_key.value,
             ColumnName.CONFIG_VALUE: str(initial_value),
-            ColumnName.EFFECTIVE_FROM: now_uae().strftime("%Y-%m-%d"),
-            ColumnName.CHANGED_BY: "system"
+            ColumnName.EFFECTIVE_FROM: now_uae().date().isoformat(),
+            ColumnName.CHANGED_BY: _SYSTEM_USER
         }
-        result = self.client.add_row(SheetName.CONFIG.value, row_data)
-        self._cache[sequence_key] = result.get("id")
+        result = self.client.add_row(_CONFIG_SHEET, row_data)
+        row_id = self._cache[sequence_key] = result.get("id")
+        return row_id
     
     def peek_next(self, sequence_key: ConfigKey, padding: int = 4) -> str:
         """
@@ -221,13 +293,94 @@ class SequenceGenerator:
         Returns:
             What the next ID would be (approximate)
         """
-        current = self._get_sequence_value(sequence_key)
-        prefix = ID_PREFIXES.get(sequence_key, "ID")
-        return f"{prefix}-{current + 1:0{padding}d}"
+        current, _ = self._get_sequence_value(sequence_key)
+        return _formatter(sequence_key, padding)(current + 1)
     
     def current_value(self, sequence_key: ConfigKey) -> int:
         """Get the current sequence value without incrementing."""
-        return self._get_sequence_value(sequence_key)
+        return self._get_sequence_value(sequence_key)[0]
+
+
+# Per-client generators (weak keys: dropped along with the client)
+_generators: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_generators_lock = threading.Lock()
+
+
+def get_sequence_generator(client) -> SequenceGenerator:
+    """Get the shared SequenceGenerator for this client (keeps its row-ID cache warm)."""
+    gen = _generators.get(client)
+    if gen is None:
+        with _generators_lock:
+            gen = _generators.get(client)
+            if gen is None:
+                gen = SequenceGenerator(client)
+                _generators[client] = gen
+    return gen
+
+
+class BlockIdAllocator:
+    """
+    Hands out IDs of one sequence from blocks reserved in a single update.
+    
+    Hi/lo allocation: each Config sheet write reserves `block_size` IDs
+    (reserve_batch), which are then handed out from memory. Thread-safe.
+    IDs left in a block when the process recycles are skipped - sequence
+    IDs are never reused, so this only leaves gaps.
+    
+    Usage:
+        allocator = BlockIdAllocator(client, ConfigKey.SEQ_ACTION, block_size=50)
+        action_id = allocator.next()  # One Config write per 50 calls
+    """
+    
+    def __init__(self, client, sequence_key: ConfigKey, block_size: int = 1, padding: int = 4):
+        self.client = client
+        self.sequence_key = sequence_key
+        self.block_size = max(block_size, 1)
+        self.padding = padding
+        self._ids: deque = deque()
+        self._lock = threading.Lock()
+    
+    def next(self) -> str:
+        """Take the next reserved ID, reserving a new block when empty."""
+        with self._lock:
+            if not self._ids:
+                self._ids.extend(
+                    get_sequence_generator(self.client).reserve_batch(
+                        self.sequence_key, self.block_size, padding=self.padding
+                    )
+                )
+            return self._ids.popleft()
+    
+    @property
+    def unused(self) -> List[str]:
+        """IDs reserved but not yet handed out."""
+        return list(self._ids)
+
+
+# IDs reserved per Config write for high-volume audit sequences
+AUDIT_ID_BLOCK_SIZE = 50
+
+# IDs reserved per Config write for allocation rows (one per allocated
+# material, so they come in bursts). Consumption IDs are reserved per
+# submission via reserve_batch instead; a second, pooled path on the same
+# sequence would leave holes in its ranges. Business-facing IDs (TAG, LPO,
+# DO, ...) stay one write per ID so they remain gap-free in normal operation.
+LOG_ID_BLOCK_SIZE = 25
+
+# Per-client allocators (weak keys: dropped along with the client)
+_block_allocators: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_block_allocators_lock = threading.Lock()
+
+
+def get_block_allocator(client, sequence_key: ConfigKey, block_size: int = AUDIT_ID_BLOCK_SIZE) -> BlockIdAllocator:
+    """Get the shared BlockIdAllocator for this client and sequence."""
+    with _block_allocators_lock:
+        per_client = _block_allocators.setdefault(client, {})
+        allocator = per_client.get(sequence_key)
+        if allocator is None:
+            allocator = BlockIdAllocator(client, sequence_key, block_size)
+            per_client[sequence_key] = allocator
+        return allocator
 
 
 # ============== Convenience Functions ==============
@@ -235,22 +388,27 @@ class SequenceGenerator:
 
 def generate_next_tag_id(client) -> str:
     """Generate next Tag ID (e.g., TAG-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_TAG)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_TAG)
 
 
 def generate_next_lpo_id(client) -> str:
     """Generate next LPO ID (e.g., LPO-0001). v1.6.8"""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_LPO)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_LPO)
 
 
 def generate_next_exception_id(client) -> str:
     """Generate next Exception ID (e.g., EX-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_EXCEPTION)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_EXCEPTION)
+
+
+def generate_next_exception_ids(client, count: int) -> List[str]:
+    """Reserve `count` consecutive Exception IDs with one sequence update."""
+    return get_sequence_generator(client).reserve_batch(ConfigKey.SEQ_EXCEPTION, count)
 
 
 def generate_next_allocation_id(client) -> str:
     """Generate next Allocation ID (e.g., ALLOC-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_ALLOCATION)
+    return get_block_allocator(client, ConfigKey.SEQ_ALLOCATION, LOG_ID_BLOCK_SIZE).next()
 
 
 def generate_next_consumption_id(client) -> str:
@@ -258,24 +416,29 @@ def generate_next_consumption_id(client) -> str:
     return SequenceGenerator(client).next_id(ConfigKey.SEQ_CONSUMPTION)
 
 
+def generate_next_consumption_ids(client, count: int) -> List[str]:
+    """Reserve `count` consecutive Consumption IDs with one sequence update."""
+    return get_sequence_generator(client).reserve_batch(ConfigKey.SEQ_CONSUMPTION, count)
+
+
 def generate_next_delivery_id(client) -> str:
     """Generate next Delivery ID (e.g., DO-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_DELIVERY)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_DELIVERY)
 
 
 def generate_next_nesting_id(client) -> str:
     """Generate next Nesting Session ID (e.g., NEST-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_NESTING)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_NESTING)
 
 
 def generate_next_remnant_id(client) -> str:
     """Generate next Remnant ID (e.g., REM-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_REMNANT)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_REMNANT)
 
 
 def generate_next_filler_id(client) -> str:
     """Generate next Filler ID (e.g., FILL-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_FILLER)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_FILLER)
 
 
 def generate_next_txn_id(client) -> str:
@@ -285,16 +448,16 @@ def generate_next_txn_id(client) -> str:
 
 def generate_next_action_id(client) -> str:
     """Generate next User Action ID (e.g., ACT-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_ACTION)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_ACTION)
 
 
 def generate_next_schedule_id(client) -> str:
     """Generate next Production Schedule ID (e.g., SCHED-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_SCHEDULE)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_SCHEDULE)
 
 
 def generate_next_approval_id(client) -> str:
     """Generate next Margin Approval ID (e.g., APV-0001)."""
-    return SequenceGenerator(client).next_id(ConfigKey.SEQ_APPROVAL)
+    return get_sequence_generator(client).next_id(ConfigKey.SEQ_APPROVAL)
 
 
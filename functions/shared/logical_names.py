@@ -31,6 +31,8 @@ Naming Convention
 - Folder names: UPPER_SNAKE_CASE with number prefix for ordering
 """
 
+from types import MappingProxyType
+
 
 class Sheet:
     """Logical sheet names used in code."""
@@ -510,8 +512,8 @@ class Column:
         UNRESTRICTED_VALUE = "UNRESTRICTED_VALUE"
 
 
-# Mapping from Sheet logical name to Column class
-SHEET_COLUMNS = {
+# Mapping from Sheet logical name to Column class (read-only view)
+SHEET_COLUMNS = MappingProxyType({
     Sheet.CONFIG: Column.CONFIG,
     Sheet.LPO_MASTER: Column.LPO_MASTER,
     Sheet.TAG_REGISTRY: Column.TAG_REGISTRY,
@@ -533,5 +535,5 @@ SHEET_COLUMNS = {
     Sheet.INVENTORY_TXN_LOG: Column.INVENTORY_TXN_LOG,
     Sheet.INVENTORY_SNAPSHOT: Column.INVENTORY_SNAPSHOT,
     Sheet.SAP_INVENTORY_SNAPSHOT: Column.SAP_INVENTORY_SNAPSHOT,
-}
+})
 
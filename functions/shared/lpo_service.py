@@ -3,8 +3,9 @@ LPO Service Module - Centralized LPO operations.
 
 This module provides:
 - Flexible LPO lookup by various reference fields
+- Request-scoped lookup cache with explicit invalidation on write
 - LPO status and balance validation  
-- Quantity extraction helpers
+- Quantity extraction helpers (single and bulk)
 
 DRY Compliance: Consolidates LPO logic from fn_ingest_tag, fn_schedule_tag,
 fn_lpo_update, and fn_lpo_ingest.
@@ -12,35 +13,57 @@ fn_lpo_update, and fn_lpo_ingest.
 Created: v1.6.6 (2026-01-30)
 """
 
-from dataclasses import dataclass
-from typing import Optional, NamedTuple
+import contextlib
+import contextvars
+import functools
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, NamedTuple, Tuple
 from enum import Enum
 
 from .logical_names import Sheet, Column
-from .helpers import get_physical_column_name, parse_float_safe
+from .helpers import DATACLASS_SLOTS, normalize_ref_value, parse_float_safe
+from .manifest import get_manifest, register_derived_cache
+
+
+@register_derived_cache
+@functools.lru_cache(maxsize=64)
+def _lpo_col(manifest, column_logical: str) -> Optional[str]:
+    """
+    Memoized physical LPO_MASTER column name for a logical column.
+    
+    The manifest object is part of the key, so a reloaded (or patched)
+    manifest never sees names cached from a previous one.
+    """
+    return manifest.get_column_name("LPO_MASTER", column_logical)
 
 
 # =============================================================================
 # Data Classes
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class LPOQuantities:
-    """Extracted quantity values from an LPO record."""
+    """
+    Extracted quantity values from an LPO record (immutable).
+    
+    total_committed (Delivered + Planned + Allocated) and available_balance
+    (PO Quantity minus total committed) are computed once at construction.
+    """
     po_quantity: float
     delivered_quantity: float
     planned_quantity: float
     allocated_quantity: float
+    total_committed: float = field(init=False)
+    available_balance: float = field(init=False)
     
-    @property
-    def total_committed(self) -> float:
-        """Delivered + Planned + Allocated."""
-        return self.delivered_quantity + self.planned_quantity + self.allocated_quantity
-    
-    @property
-    def available_balance(self) -> float:
-        """PO Quantity minus total committed."""
-        return self.po_quantity - self.total_committed
+    def __post_init__(self):
+        total = self.delivered_quantity + self.planned_quantity + self.allocated_quantity
+        object.__setattr__(self, "total_committed", total)
+        object.__setattr__(self, "available_balance", self.po_quantity - total)
 
 
 class LPOValidationStatus(Enum):
@@ -60,6 +83,164 @@ class LPOValidationResult:
     quantities: Optional[LPOQuantities] = None
 
 
+# =============================================================================
+# Request-scoped Lookup Cache
+# =============================================================================
+
+# Seconds a cached LPO lookup stays valid inside a lookup scope
+LPO_CACHE_TTL_SECONDS = 15
+
+# Most lookups kept per scope (least recently used are evicted first)
+LPO_CACHE_MAXSIZE = 256
+
+# (id(client), column, ref) -> (expires_at, row); None outside lpo_lookup_scope()
+_lpo_cache: "contextvars.ContextVar[Optional[OrderedDict[Tuple[int, str, str], Tuple[float, dict]]]]" = (
+    contextvars.ContextVar("lpo_lookup_cache", default=None)
+)
+
+
+@contextlib.contextmanager
+def lpo_lookup_scope() -> Iterator[None]:
+    """
+    Cache LPO lookups for the duration of one function invocation.
+    
+    Inside the scope, repeated find_lpo_by_* calls for the same reference
+    reuse the first result (for up to LPO_CACHE_TTL_SECONDS; at most
+    LPO_CACHE_MAXSIZE lookups are kept). Outside any
+    scope every lookup goes to Smartsheet, so LPO quantities are never
+    served stale across requests.
+    
+    fn_ingest_tag, fn_schedule_tag and fn_lpo_update run their whole
+    invocation inside one scope.
+    
+    Example:
+        >>> with lpo_lookup_scope():
+        ...     lpo = find_lpo_by_sap_reference(client, "PTE-185")
+        ...     lpo = find_lpo_by_sap_reference(client, "PTE-185")  # cached
+    """
+    token = _lpo_cache.set(OrderedDict())
+    try:
+        yield
+    finally:
+        _lpo_cache.reset(token)
+
+
+def invalidate_lpo_cache(sap_ref: Optional[str] = None, customer_ref: Optional[str] = None):
+    """
+    Drop cached lookups for an LPO after writing to it.
+    
+    Entries are dropped if they were looked up by, or their cached row
+    carries, the given SAP or Customer LPO reference. With no arguments
+    the whole scope cache is cleared. No-op outside lpo_lookup_scope().
+    """
+    cache = _lpo_cache.get()
+    if not cache:
+        return
+    if sap_ref is None and customer_ref is None:
+        cache.clear()
+        return
+    
+    manifest = get_manifest()
+    sap_col = _lpo_col(manifest, "SAP_REFERENCE")
+    customer_col = _lpo_col(manifest, "CUSTOMER_LPO_REF")
+    refs = {ref for ref in (sap_ref, customer_ref) if ref}
+    stale = [
+        key for key, (_, row) in cache.items()
+        if key[2] in refs
+        or (sap_ref and row.get(sap_col) == sap_ref)
+        or (customer_ref and row.get(customer_col) == customer_ref)
+    ]
+    for key in stale:
+        del cache[key]
+
+
+# Lookups currently running, keyed like the scope cache (or by the whole
+# criteria list for find_lpo_flexible) -> Future shared by every concurrent
+# caller (singleflight); entries are removed on completion
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _singleflight(key: tuple, fetch: Callable[[], Optional[dict]]) -> Optional[dict]:
+    """
+    Run `fetch`, coalescing identical concurrent calls.
+    
+    The first caller for a key performs the request; callers arriving
+    while it is in flight wait for and share its result (or exception).
+    """
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = Future()
+            _inflight[key] = future
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        lpo = fetch()
+        future.set_result(lpo)
+        return lpo
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _fetch_lpo_row(client, column: str, ref: str) -> Optional[dict]:
+    """client.find_row on LPO_MASTER, coalescing identical concurrent calls."""
+    return _singleflight(
+        (id(client), column, ref),
+        lambda: client.find_row(Sheet.LPO_MASTER, column, ref)
+    )
+
+
+def _cache_get(cache: OrderedDict, key: tuple) -> Optional[dict]:
+    """Unexpired cached row for `key`, or None."""
+    hit = cache.get(key)
+    if hit is not None and hit[0] > time.monotonic():
+        cache.move_to_end(key)
+        return hit[1]
+    return None
+
+
+def _cache_put(cache: OrderedDict, key: tuple, lpo: dict):
+    """Cache a found row, evicting the least recently used past LPO_CACHE_MAXSIZE."""
+    cache[key] = (time.monotonic() + LPO_CACHE_TTL_SECONDS, lpo)
+    cache.move_to_end(key)
+    if len(cache) > LPO_CACHE_MAXSIZE:
+        cache.popitem(last=False)
+
+
+def _find_lpo_row(client, column: str, ref: str) -> Optional[dict]:
+    """LPO_MASTER lookup, through the scope cache when one is active."""
+    cache = _lpo_cache.get()
+    if cache is None:
+        return _fetch_lpo_row(client, column, ref)
+    
+    key = (id(client), column, ref)
+    lpo = _cache_get(cache, key)
+    if lpo is not None:
+        return lpo
+    
+    lpo = _fetch_lpo_row(client, column, ref)
+    if lpo:
+        _cache_put(cache, key, lpo)
+    return lpo
+
+
+def _matched_criterion(lpo: dict, criteria: List[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+    """The highest-priority (column, ref) criterion that `lpo` satisfies."""
+    manifest = get_manifest()
+    for column, ref in criteria:
+        if normalize_ref_value(lpo.get(_lpo_col(manifest, column))) == normalize_ref_value(ref):
+            return column, ref
+    return None
+
+
 # =============================================================================
 # Lookup Functions
 # =============================================================================
@@ -77,11 +258,7 @@ def find_lpo_by_sap_reference(client, sap_ref: str) -> Optional[dict]:
     """
     if not sap_ref:
         return None
-    return client.find_row(
-        Sheet.LPO_MASTER,
-        Column.LPO_MASTER.SAP_REFERENCE,
-        sap_ref
-    )
+    return _find_lpo_row(client, Column.LPO_MASTER.SAP_REFERENCE, sap_ref)
 
 
 def find_lpo_by_customer_ref(client, customer_ref: str) -> Optional[dict]:
@@ -97,11 +274,7 @@ def find_lpo_by_customer_ref(client, customer_ref: str) -> Optional[dict]:
     """
     if not customer_ref:
         return None
-    return client.find_row(
-        Sheet.LPO_MASTER,
-        Column.LPO_MASTER.CUSTOMER_LPO_REF,
-        customer_ref
-    )
+    return _find_lpo_row(client, Column.LPO_MASTER.CUSTOMER_LPO_REF, customer_ref)
 
 
 def find_lpo_flexible(
@@ -118,6 +291,11 @@ def find_lpo_flexible(
     2. Customer LPO Reference
     3. LPO ID (tries as SAP first, then Customer ref)
     
+    When more than one reference is given, all of them are matched
+    against a single fetch of the LPO sheet; inside lpo_lookup_scope()
+    the row is cached under the reference it matched. References whose
+    column is missing from the sheet are skipped.
+    
     Args:
         client: SmartsheetClient instance
         sap_ref: SAP Reference to search for
@@ -132,28 +310,40 @@ def find_lpo_flexible(
         >>> lpo = find_lpo_flexible(client, customer_ref="CUST-001")
         >>> lpo = find_lpo_flexible(client, lpo_id="PTE-185")  # tries both
     """
-    # 1. Try SAP Reference first (most specific)
-    if sap_ref:
-        lpo = find_lpo_by_sap_reference(client, sap_ref)
-        if lpo:
-            return lpo
-    
-    # 2. Try Customer LPO Reference
-    if customer_ref:
-        lpo = find_lpo_by_customer_ref(client, customer_ref)
-        if lpo:
-            return lpo
+    # Priority order: SAP ref, Customer ref, then LPO ID as SAP and Customer ref
+    criteria = [
+        (column, value)
+        for column, value in (
+            (Column.LPO_MASTER.SAP_REFERENCE, sap_ref),
+            (Column.LPO_MASTER.CUSTOMER_LPO_REF, customer_ref),
+            (Column.LPO_MASTER.SAP_REFERENCE, lpo_id),
+            (Column.LPO_MASTER.CUSTOMER_LPO_REF, lpo_id),
+        )
+        if value
+    ]
+    if not criteria:
+        return None
+    if len(criteria) == 1:
+        return _find_lpo_row(client, *criteria[0])
     
-    # 3. Try LPO ID as both SAP and Customer ref
-    if lpo_id:
-        lpo = find_lpo_by_sap_reference(client, lpo_id)
-        if lpo:
-            return lpo
-        lpo = find_lpo_by_customer_ref(client, lpo_id)
-        if lpo:
+    # Only the top-priority criterion can be answered from the scope cache:
+    # a cached lower-priority hit says nothing about the ones before it
+    cache = _lpo_cache.get()
+    if cache is not None:
+        lpo = _cache_get(cache, (id(client), *criteria[0]))
+        if lpo is not None:
             return lpo
     
-    return None
+    # Several candidates: resolve them all against one sheet fetch
+    lpo = _singleflight(
+        (id(client), tuple(criteria)),
+        lambda: client.find_first_row(Sheet.LPO_MASTER, criteria)
+    )
+    if lpo and cache is not None:
+        matched = _matched_criterion(lpo, criteria)
+        if matched:
+            _cache_put(cache, (id(client), *matched), lpo)
+    return lpo
 
 
 # =============================================================================
@@ -170,17 +360,36 @@ def get_lpo_quantities(lpo: dict) -> LPOQuantities:
     Returns:
         LPOQuantities dataclass with all quantity fields
     """
-    po_qty_col = get_physical_column_name("LPO_MASTER", "PO_QUANTITY_SQM")
-    delivered_col = get_physical_column_name("LPO_MASTER", "DELIVERED_QUANTITY_SQM")
-    planned_col = get_physical_column_name("LPO_MASTER", "PLANNED_QUANTITY")
-    allocated_col = get_physical_column_name("LPO_MASTER", "ALLOCATED_QUANTITY")
-    
-    return LPOQuantities(
-        po_quantity=parse_float_safe(lpo.get(po_qty_col), 0),
-        delivered_quantity=parse_float_safe(lpo.get(delivered_col), 0),
-        planned_quantity=parse_float_safe(lpo.get(planned_col), 0),
-        allocated_quantity=parse_float_safe(lpo.get(allocated_col), 0),
-    )
+    return get_lpo_quantities_bulk([lpo])[0]
+
+
+def get_lpo_quantities_bulk(lpos: List[dict]) -> List[LPOQuantities]:
+    """
+    Extract quantity values from many LPO records.
+    
+    Column names are resolved once for the whole list rather than per row.
+    
+    Args:
+        lpos: LPO row dicts from Smartsheet
+        
+    Returns:
+        LPOQuantities for each record, in the same order
+    """
+    manifest = get_manifest()
+    po_qty_col = _lpo_col(manifest, "PO_QUANTITY_SQM")
+    delivered_col = _lpo_col(manifest, "DELIVERED_QUANTITY_SQM")
+    planned_col = _lpo_col(manifest, "PLANNED_QUANTITY")
+    allocated_col = _lpo_col(manifest, "ALLOCATED_QUANTITY")
+    
+    return [
+        LPOQuantities(
+            po_quantity=parse_float_safe(lpo.get(po_qty_col), 0),
+            delivered_quantity=parse_float_safe(lpo.get(delivered_col), 0),
+            planned_quantity=parse_float_safe(lpo.get(planned_col), 0),
+            allocated_quantity=parse_float_safe(lpo.get(allocated_col), 0),
+        )
+        for lpo in lpos
+    ]
 
 
 def get_lpo_status(lpo: dict) -> str:
@@ -193,7 +402,7 @@ def get_lpo_status(lpo: dict) -> str:
     Returns:
         LPO status string (normalized to lowercase), or empty string
     """
-    status_col = get_physical_column_name("LPO_MASTER", "LPO_STATUS")
+    status_col = _lpo_col(get_manifest(), "LPO_STATUS")
     status = lpo.get(status_col, "")
     return str(status).lower() if status else ""
 
@@ -208,7 +417,7 @@ def get_lpo_sap_reference(lpo: dict) -> Optional[str]:
     Returns:
         SAP Reference string or None
     """
-    sap_col = get_physical_column_name("LPO_MASTER", "SAP_REFERENCE")
+    sap_col = _lpo_col(get_manifest(), "SAP_REFERENCE")
     return lpo.get(sap_col)
 
 
@@ -216,6 +425,10 @@ def get_lpo_sap_reference(lpo: dict) -> Optional[str]:
 # Validation Functions
 # =============================================================================
 
+# Lowercased LPO statuses that block operations (reported as ON_HOLD)
+_BLOCKED_STATUSES = frozenset({"on hold"})
+
+
 def validate_lpo_status(lpo: dict) -> LPOValidationResult:
     """
     Validate that an LPO is in a valid status for operations.
@@ -233,7 +446,7 @@ def validate_lpo_status(lpo: dict) -> LPOValidationResult:
         )
     
     status = get_lpo_status(lpo)
-    if status == "on hold":
+    if status in _BLOCKED_STATUSES:
         sap_ref = get_lpo_sap_reference(lpo) or "unknown"
         return LPOValidationResult(
             status=LPOValidationStatus.ON_HOLD,
@@ -264,7 +477,8 @@ def validate_po_balance(
         tolerance_pct: Tolerance percentage (default 5% = 0.05)
         
     Returns:
-        LPOValidationResult with quantities populated
+        LPOValidationResult with quantities populated (None when
+        requested_qty <= 0, which is always OK)
     """
     if not lpo:
         return LPOValidationResult(
@@ -272,6 +486,14 @@ def validate_po_balance(
             message="LPO not found"
         )
     
+    # Nothing requested (preview paths): no balance to check
+    if requested_qty <= 0:
+        return LPOValidationResult(
+            status=LPOValidationStatus.OK,
+            message="No quantity requested",
+            lpo=lpo
+        )
+    
     quantities = get_lpo_quantities(lpo)
     
     # Check if total committed + requested exceeds PO Quantity with tolerance
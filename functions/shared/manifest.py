@@ -23,15 +23,29 @@ Usage
 >>> manifest = WorkspaceManifest.load()
 >>> sheet_id = manifest.get_sheet_id("TAG_REGISTRY")  # Returns numeric ID
 >>> column_id = manifest.get_column_id("TAG_REGISTRY", "FILE_HASH")
+>>>
+>>> from shared.manifest import MANIFEST  # Lazily loaded singleton
 """
 
 import os
 import json
 import logging
-from typing import Dict, Optional, Any
-from pathlib import Path
+import stat
+import sys
+import tempfile
+import threading
+from functools import cached_property
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+try:
+    import orjson  # Optional: faster manifest parse / save
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_THIS_DIR = os.path.dirname(os.path.abspath(__file__))
+
 
 class ManifestError(Exception):
     """Raised when manifest operations fail."""
@@ -91,9 +105,17 @@ class WorkspaceManifest:
         "functions/workspace_manifest.json",          # From project root
     ]
     
+    # DEFAULT_LOCATIONS resolved against this module's directory, computed once
+    _MODULE_CANDIDATES = tuple(
+        os.path.normpath(os.path.join(_THIS_DIR, location)) for location in DEFAULT_LOCATIONS
+    )
+    
     # Environment variable for manifest path override
     ENV_MANIFEST_PATH = "SMARTSHEET_MANIFEST_PATH"
     
+    # (env override, path) found by the last default-location search
+    _resolved_path: Optional[Tuple[Optional[str], str]] = None
+    
     def __init__(self, manifest_path: Optional[str] = None):
         """
         Initialize manifest manager.
@@ -102,8 +124,8 @@ class WorkspaceManifest:
             manifest_path: Path to manifest file. If None, searches default locations.
         """
         self._manifest_path = manifest_path
-        self._data: Optional[Dict[str, Any]] = None
         self._loaded = False
+        self._set_data(self._empty_manifest())
     
     @classmethod
     def load(cls, path: Optional[str] = None) -> "WorkspaceManifest":
@@ -134,7 +156,6 @@ class WorkspaceManifest:
         except ManifestNotFoundError:
             logger.warning("Manifest not found, using empty manifest (name fallback mode)")
             instance = cls(path)
-            instance._data = cls._empty_manifest()
             instance._loaded = True
             return instance
     
@@ -152,40 +173,65 @@ class WorkspaceManifest:
             "sheets": {}
         }
     
+    def _set_data(self, data: Dict[str, Any]):
+        """Adopt manifest data; `_sheets` is bound once so accessors skip re-fetching it."""
+        self._data = data
+        self._sheets: Dict[str, Any] = data.setdefault("sheets", {})
+        self._invalidate_lookups()
+    
     def _find_manifest_path(self) -> Optional[str]:
-        """Find manifest file in default locations."""
-        # Check environment variable first
+        """
+        Find manifest file in default locations.
+        
+        The first hit is remembered for the process (per env override), so
+        later loads skip the probing; reset_manifest() forgets it.
+        """
         env_path = os.environ.get(self.ENV_MANIFEST_PATH)
-        if env_path and os.path.exists(env_path):
-            return env_path
+        resolved = WorkspaceManifest._resolved_path
+        if resolved is not None and resolved[0] == env_path:
+            return resolved[1]
         
-        # Check relative to this file
-        this_dir = Path(__file__).parent
-        for location in self.DEFAULT_LOCATIONS:
-            check_path = this_dir / location
-            if check_path.exists():
-                return str(check_path)
+        path = next((p for p in self._candidate_paths(env_path) if os.path.exists(p)), None)
+        if path:
+            WorkspaceManifest._resolved_path = (env_path, path)
+        return path
+    
+    def _candidate_paths(self, env_path: Optional[str]):
+        """
+        Manifest locations in search order (env var, next to this file, cwd).
         
-        # Check relative to current working directory
+        cwd candidates that name a module candidate again (e.g. when running
+        from functions/) are skipped, so each file is probed once.
+        """
+        if env_path:
+            yield env_path
+        yield from self._MODULE_CANDIDATES
         for location in self.DEFAULT_LOCATIONS:
-            if os.path.exists(location):
-                return location
-        
-        return None
+            path = os.path.abspath(location)  # Stays valid if cwd changes later
+            if path not in self._MODULE_CANDIDATES:
+                yield path
     
     def _load(self):
         """Load manifest from file."""
         path = self._manifest_path or self._find_manifest_path()
         
-        if not path or not os.path.exists(path):
+        raw = None
+        if path:
+            try:
+                with open(path, "rb") as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                if not self._manifest_path:
+                    WorkspaceManifest._resolved_path = None  # Remembered file has gone
+        
+        if raw is None:
             raise ManifestNotFoundError(
                 f"Workspace manifest not found. Searched locations: {self.DEFAULT_LOCATIONS}. "
                 f"Run 'python create_workspace.py' or 'python fetch_manifest.py' to generate one."
             )
         
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                self._data = json.load(f)
+            self._set_data(orjson.loads(raw) if orjson is not None else json.loads(raw))
             self._manifest_path = path
             self._loaded = True
             logger.info(f"Loaded workspace manifest from: {path}")
@@ -193,7 +239,13 @@ class WorkspaceManifest:
             raise ManifestError(f"Invalid JSON in manifest file: {e}")
     
     def save(self, path: Optional[str] = None):
-        """Save manifest to file."""
+        """
+        Save manifest to file.
+        
+        Written to a uniquely named temp file beside the target, fsynced and
+        swapped in with os.replace, so a crash mid-write never leaves a
+        truncated manifest and concurrent saves never share a temp file.
+        """
         save_path = path or self._manifest_path
         if not save_path:
             raise ManifestError("No path specified for saving manifest")
@@ -201,20 +253,87 @@ class WorkspaceManifest:
         from .helpers import now_uae
         self._data["_meta"]["generated_at"] = now_uae().isoformat()
         
-        with open(save_path, "w", encoding="utf-8") as f:
-            json.dump(self._data, f, indent=2, ensure_ascii=False)
+        content = self._dumps()
+        tmp = tempfile.NamedTemporaryFile(
+            dir=os.path.dirname(os.path.abspath(save_path)),
+            prefix=os.path.basename(save_path) + ".",
+            suffix=".tmp",
+            delete=False
+        )
+        try:
+            with tmp:
+                tmp.write(content)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            # NamedTemporaryFile is 0600; keep the target's mode for other readers
+            os.chmod(tmp.name, _file_mode_for(save_path))
+            os.replace(tmp.name, save_path)
+        except BaseException:
+            try:
+                os.unlink(tmp.name)
+            except OSError:
+                pass
+            raise
         
         logger.info(f"Saved workspace manifest to: {save_path}")
     
+    def _dumps(self) -> bytes:
+        """Serialize the manifest as indented UTF-8 JSON."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(self._data, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                pass  # e.g. integers beyond 64 bits - let the stdlib handle it
+        return json.dumps(self._data, indent=2, ensure_ascii=False).encode("utf-8")
+    
     @property
     def workspace_id(self) -> Optional[int]:
         """Get workspace ID."""
-        return self._data.get("workspace", {}).get("id") if self._data else None
+        return self._data.get("workspace", {}).get("id")
     
     @property
     def workspace_name(self) -> Optional[str]:
         """Get workspace name."""
-        return self._data.get("workspace", {}).get("name") if self._data else None
+        return self._data.get("workspace", {}).get("name")
+    
+    # ============== Flat lookup tables (built on first use) ==============
+    # Keys are interned: callers pass logical names from logical_names.py,
+    # which are interned literals, so lookups match on identity. Dynamic
+    # (non-interned) names still work, just without that shortcut.
+    
+    _LOOKUP_TABLES = ("_sheet_ids", "_sheet_names", "_column_ids", "_column_names")
+    
+    @cached_property
+    def _sheet_ids(self) -> Dict[str, int]:
+        """{logical_name: id} for sheets that have an ID."""
+        return {sys.intern(name): info["id"] for name, info in self._sheets.items() if info.get("id")}
+    
+    @cached_property
+    def _sheet_names(self) -> Dict[str, str]:
+        """{logical_name: physical name}."""
+        return {sys.intern(name): info.get("name") for name, info in self._sheets.items()}
+    
+    @cached_property
+    def _column_ids(self) -> Dict[Tuple[str, str], int]:
+        """{(sheet, column): column id}."""
+        return {key: info.get("id") for key, info in self._iter_columns()}
+    
+    @cached_property
+    def _column_names(self) -> Dict[Tuple[str, str], str]:
+        """{(sheet, column): physical column name}."""
+        return {key: info.get("name") for key, info in self._iter_columns()}
+    
+    def _iter_columns(self):
+        intern = sys.intern
+        for sheet_name, sheet_info in self._sheets.items():
+            sheet_name = intern(sheet_name)
+            for column_name, column_info in sheet_info.get("columns", {}).items():
+                yield (sheet_name, intern(column_name)), column_info
+    
+    def _invalidate_lookups(self):
+        """Drop the flat tables; they are rebuilt on next lookup."""
+        for attr in self._LOOKUP_TABLES:
+            self.__dict__.pop(attr, None)
     
     def get_sheet_id(self, logical_name: str) -> Optional[int]:
         """
@@ -226,15 +345,11 @@ class WorkspaceManifest:
         Returns:
             Sheet ID or None if not in manifest
         """
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        sheet_info = sheets.get(logical_name)
-        return sheet_info.get("id") if sheet_info else None
+        return self._sheet_ids.get(logical_name)
     
     def get_sheet_name(self, logical_name: str) -> Optional[str]:
         """Get physical sheet name by logical name."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        sheet_info = sheets.get(logical_name)
-        return sheet_info.get("name") if sheet_info else None
+        return self._sheet_names.get(logical_name)
     
     def get_column_id(self, sheet_logical_name: str, column_logical_name: str) -> Optional[int]:
         """
@@ -247,35 +362,19 @@ class WorkspaceManifest:
         Returns:
             Column ID or None if not in manifest
         """
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        sheet_info = sheets.get(sheet_logical_name)
-        if not sheet_info:
-            return None
-        
-        columns = sheet_info.get("columns", {})
-        column_info = columns.get(column_logical_name)
-        return column_info.get("id") if column_info else None
+        return self._column_ids.get((sheet_logical_name, column_logical_name))
     
     def get_column_name(self, sheet_logical_name: str, column_logical_name: str) -> Optional[str]:
         """Get physical column name by logical names."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        sheet_info = sheets.get(sheet_logical_name)
-        if not sheet_info:
-            return None
-        
-        columns = sheet_info.get("columns", {})
-        column_info = columns.get(column_logical_name)
-        return column_info.get("name") if column_info else None
+        return self._column_names.get((sheet_logical_name, column_logical_name))
     
     def get_all_sheet_ids(self) -> Dict[str, int]:
         """Get all sheet IDs as {logical_name: id} dict."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        return {name: info.get("id") for name, info in sheets.items() if info.get("id")}
+        return dict(self._sheet_ids)
     
     def get_all_column_ids(self, sheet_logical_name: str) -> Dict[str, int]:
         """Get all column IDs for a sheet as {logical_name: id} dict."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        sheet_info = sheets.get(sheet_logical_name)
+        sheet_info = self._sheets.get(sheet_logical_name)
         if not sheet_info:
             return {}
         
@@ -284,8 +383,7 @@ class WorkspaceManifest:
     
     def has_sheet(self, logical_name: str) -> bool:
         """Check if sheet exists in manifest."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        return logical_name in sheets and sheets[logical_name].get("id") is not None
+        return logical_name in self._sheet_ids
     
     def is_loaded(self) -> bool:
         """Check if manifest is loaded."""
@@ -293,49 +391,63 @@ class WorkspaceManifest:
     
     def is_empty(self) -> bool:
         """Check if manifest has no sheets defined."""
-        sheets = self._data.get("sheets", {}) if self._data else {}
-        return len(sheets) == 0
+        return not self._sheets
     
     # ============== Builder Methods (for create_workspace.py) ==============
     
     def set_workspace(self, workspace_id: int, workspace_name: str):
         """Set workspace info."""
-        if not self._data:
-            self._data = self._empty_manifest()
         self._data["workspace"] = {"id": workspace_id, "name": workspace_name}
     
     def add_folder(self, logical_name: str, folder_id: int, folder_name: str):
         """Add folder to manifest."""
-        if not self._data:
-            self._data = self._empty_manifest()
         self._data["folders"][logical_name] = {"id": folder_id, "name": folder_name}
     
     def add_sheet(self, logical_name: str, sheet_id: int, sheet_name: str, folder_logical_name: Optional[str] = None):
         """Add sheet to manifest."""
-        if not self._data:
-            self._data = self._empty_manifest()
-        self._data["sheets"][logical_name] = {
+        self._sheets[logical_name] = {
             "id": sheet_id,
             "name": sheet_name,
             "folder": folder_logical_name,
             "columns": {}
         }
+        self._invalidate_lookups()  # Replaces any existing columns too
     
     def add_column(self, sheet_logical_name: str, column_logical_name: str, 
                    column_id: int, column_name: str, column_type: str):
         """Add column to sheet in manifest."""
-        if sheet_logical_name not in self._data.get("sheets", {}):
+        sheet_info = self._sheets.get(sheet_logical_name)
+        if sheet_info is None:
             raise ManifestError(f"Sheet '{sheet_logical_name}' not in manifest. Add sheet first.")
         
-        self._data["sheets"][sheet_logical_name]["columns"][column_logical_name] = {
+        sheet_info.setdefault("columns", {})[column_logical_name] = {
             "id": column_id,
             "name": column_name,
             "type": column_type
         }
+        
+        # Keep already-built tables current with a single insert
+        key = (sys.intern(sheet_logical_name), sys.intern(column_logical_name))
+        tables = self.__dict__
+        if "_column_ids" in tables:
+            tables["_column_ids"][key] = column_id
+        if "_column_names" in tables:
+            tables["_column_names"][key] = column_name
+
+
+def _file_mode_for(path: str) -> int:
+    """Permission bits for `path`: its current mode, or 0o666 minus the umask if new."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)  # Only way to read the umask; restored at once
+        os.umask(umask)
+        return 0o666 & ~umask
 
 
 # Singleton for easy access
 _manifest: Optional[WorkspaceManifest] = None
+_manifest_lock = threading.Lock()
 
 
 def get_manifest(force_reload: bool = False) -> WorkspaceManifest:
@@ -343,14 +455,59 @@ def get_manifest(force_reload: bool = False) -> WorkspaceManifest:
     Get the singleton workspace manifest.
     
     Uses load_or_empty to support fallback mode when manifest doesn't exist.
+    Thread-safe: concurrent first callers share a single load.
     """
     global _manifest
-    if _manifest is None or force_reload:
-        _manifest = WorkspaceManifest.load_or_empty()
-    return _manifest
+    manifest = _manifest
+    if manifest is None or force_reload:
+        with _manifest_lock:
+            if _manifest is None or force_reload:
+                _clear_derived_caches()
+                _manifest = WorkspaceManifest.load_or_empty()
+            manifest = _manifest
+    return manifest
+
+
+# cache_clear of every manifest-derived cache (see register_derived_cache)
+_derived_cache_clears: List[Callable[[], None]] = []
+
+
+def register_derived_cache(fn):
+    """
+    Register an lru_cache whose values derive from the manifest.
+    
+    Registered caches are cleared whenever the manifest is reloaded or
+    reset. Use it as a decorator above functools.lru_cache; `fn` is
+    returned unchanged.
+    """
+    _derived_cache_clears.append(fn.cache_clear)
+    return fn
+
+
+def _clear_derived_caches():
+    """Clear every registered manifest-derived cache."""
+    for cache_clear in _derived_cache_clears:
+        cache_clear()  # Also releases cached references to the old manifest
 
 
 def reset_manifest():
     """Reset the singleton manifest (useful for testing)."""
     global _manifest
-    _manifest = None
+    with _manifest_lock:
+        _manifest = None
+        WorkspaceManifest._resolved_path = None
+        _clear_derived_caches()
+
+
+def __getattr__(name: str):
+    """
+    Lazy module attribute `MANIFEST` (PEP 562): the singleton manifest.
+    
+    `from shared.manifest import MANIFEST` loads it on first use and binds
+    a local reference. That reference is not refreshed by
+    get_manifest(force_reload=True) or reset_manifest(); code that must
+    follow reloads should call get_manifest() instead.
+    """
+    if name == "MANIFEST":
+        return get_manifest()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -22,7 +22,8 @@ Request/Response Models
     TagIngestRequest, TagIngestResponse
 
 Entity Models
-    ExceptionRecord, UserActionRecord, LPORecord, TagRecord
+    ExceptionRecord
+    UserActionRecord, LPORecord, TagRecord (record_models, loaded on first use)
 
 Usage Examples
 --------------
@@ -51,10 +52,32 @@ See Also
 
 from datetime import datetime
 from typing import Optional, List, Dict, Any
-from pydantic import BaseModel, Field, model_validator, field_validator
+from pydantic import BaseModel, ConfigDict, Field, model_validator, field_validator
 from enum import Enum
+import os
 import uuid
 
+_uuid4 = uuid.uuid4
+
+
+def _new_id() -> str:
+    """Default factory for request and record IDs (32-char UUID4 hex)."""
+    return _uuid4().hex
+
+
+_exception_day = (None, "")  # (UTC date, "EX-YYYYMMDD-") last used
+
+
+def _new_exception_id() -> str:
+    """Default factory for ExceptionRecord.exception_id (EX-YYYYMMDD-XXXXXX)."""
+    global _exception_day
+    today = datetime.utcnow().date()
+    day, prefix = _exception_day
+    if day != today:
+        prefix = f"EX-{today:%Y%m%d}-"
+        _exception_day = (today, prefix)
+    return prefix + os.urandom(3).hex().upper()
+
 
 class TagStatus(str, Enum):
     """Tag sheet status values - must match Smartsheet picklist."""
@@ -187,7 +210,7 @@ class MachineStatus(str, Enum):
 
 class TagIngestRequest(BaseModel):
     """Request payload for tag ingestion API."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_request_id: str = Field(default_factory=_new_id)
     tag_id: Optional[str] = None  # Optional, will be generated if not provided
     lpo_id: Optional[str] = None
     customer_lpo_ref: Optional[str] = None  # Fallback if lpo_id not provided
@@ -224,20 +247,22 @@ class TagIngestRequest(BaseModel):
         return str(v).strip()
 
     def get_all_files(self) -> List["FileAttachment"]:
-        """Get all files including legacy single-file fields (DRY - matches LPOIngestRequest)."""
-        all_files = list(self.files)
-        
+        """Get all files including legacy single-file fields (DRY - matches LPOIngestRequest).
+
+        Returns `files` itself when there is no legacy file - treat the
+        result as read-only.
+        """
         # Convert legacy fields to FileAttachment if present
         if self.file_url or self.file_content:
-            legacy_file = FileAttachment(
+            legacy_file = FileAttachment.model_construct(  # Source checked above - skip revalidation
                 file_type=FileType.OTHER,  # Tags don't have typed files like LPO
                 file_url=self.file_url,
                 file_content=self.file_content,
                 file_name=self.original_file_name
             )
-            all_files.insert(0, legacy_file)
+            return [legacy_file, *self.files]
         
-        return all_files
+        return self.files
 
 
 class TagIngestResponse(BaseModel):
@@ -252,7 +277,7 @@ class TagIngestResponse(BaseModel):
 
 class ScheduleTagRequest(BaseModel):
     """Request payload for production schedule API."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_request_id: str = Field(default_factory=_new_id)
     tag_id: str
     planned_date: str  # YYYY-MM-DD format
     shift: str  # Morning or Evening
@@ -264,6 +289,8 @@ class ScheduleTagRequest(BaseModel):
 
 class ScheduleTagResponse(BaseModel):
     """Response payload for production schedule API."""
+    model_config = ConfigDict(defer_build=True)  # Rarely used - build the validator on first use
+
     status: str  # RELEASED_FOR_NESTING, BLOCKED, CONFLICT
     schedule_id: Optional[str] = None
     next_action_deadline: Optional[str] = None  # T-1 cutoff timestamp
@@ -274,7 +301,7 @@ class ScheduleTagResponse(BaseModel):
 
 class ExceptionRecord(BaseModel):
     """Exception log record."""
-    exception_id: str = Field(default_factory=lambda: f"EX-{datetime.utcnow().strftime('%Y%m%d')}-{uuid.uuid4().hex[:6].upper()}")
+    exception_id: str = Field(default_factory=_new_exception_id)
     created_at: datetime = Field(default_factory=datetime.utcnow)
     source: ExceptionSource
     related_tag_id: Optional[str] = None
@@ -292,50 +319,6 @@ class ExceptionRecord(BaseModel):
     trace_id: Optional[str] = None
 
 
-class UserActionRecord(BaseModel):
-    """User action history record."""
-    action_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    timestamp: datetime = Field(default_factory=datetime.now)
-    user_id: str
-    action_type: ActionType
-    target_table: str
-    target_id: str
-    old_value: Optional[str] = None
-    new_value: Optional[str] = None
-    notes: Optional[str] = None
-    trace_id: Optional[str] = None
-
-
-class LPORecord(BaseModel):
-    """LPO master record (read from Smartsheet)."""
-    lpo_id: str
-    customer_lpo_ref: str
-    sap_reference: Optional[str] = None
-    customer_name: Optional[str] = None
-    project_name: Optional[str] = None
-    lpo_status: LPOStatus
-    brand: Optional[str] = None
-    po_quantity_sqm: float
-    delivered_quantity_sqm: float = 0
-    total_allocated_cost: float = 0
-    current_status: Optional[str] = None
-    row_id: Optional[int] = None  # Smartsheet row ID
-
-
-class TagRecord(BaseModel):
-    """Tag sheet record."""
-    tag_id: str
-    tag_name: Optional[str] = None
-    lpo_sap_reference: Optional[str] = None
-    required_delivery_date: Optional[str] = None
-    estimated_quantity: Optional[float] = None
-    status: TagStatus = TagStatus.DRAFT
-    file_hash: Optional[str] = None
-    client_request_id: Optional[str] = None
-    submitted_by: Optional[str] = None
-    row_id: Optional[int] = None  # Smartsheet row ID
-
-
 # ============== LPO Request/Response Models ==============
 
 class Brand(str, Enum):
@@ -388,7 +371,7 @@ class FileUploadItem(BaseModel):
 
 class LPOIngestRequest(BaseModel):
     """Request payload for LPO ingestion API (create)."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_request_id: str = Field(default_factory=_new_id)
     
     # Required fields
     sap_reference: str  # REQUIRED - external ID (e.g., PTE-185)
@@ -431,26 +414,30 @@ class LPOIngestRequest(BaseModel):
         return str(v).strip()
     
     def get_all_files(self) -> List[FileAttachment]:
-        """Get all files including legacy single-file fields."""
-        all_files = list(self.files)
-        
+        """Get all files including legacy single-file fields.
+
+        Returns `files` itself when there is no legacy file - treat the
+        result as read-only.
+        """
         # Convert legacy fields to FileAttachment if present
         if self.file_url or self.file_content:
-            legacy_file = FileAttachment(
+            legacy_file = FileAttachment.model_construct(  # Source checked above - skip revalidation
                 file_type=FileType.LPO,  # Assume legacy = LPO type
                 file_url=self.file_url,
                 file_content=self.file_content,
                 file_name=self.original_file_name
             )
-            all_files.insert(0, legacy_file)
+            return [legacy_file, *self.files]
         
-        return all_files
+        return self.files
 
 
 
 class LPOUpdateRequest(BaseModel):
     """Request payload for LPO update API."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    model_config = ConfigDict(defer_build=True)  # Rarely used - build the validator on first use
+
+    client_request_id: str = Field(default_factory=_new_id)
 
     # Key for lookup
     sap_reference: str  # REQUIRED - identifies which LPO to update
@@ -491,6 +478,8 @@ class LPOIngestResponse(BaseModel):
 
 class LPOUpdateResponse(BaseModel):
     """Response payload for LPO update API."""
+    model_config = ConfigDict(defer_build=True)  # Rarely used - build the validator on first use
+
     status: str  # OK, NOT_FOUND, BLOCKED
     sap_reference: Optional[str] = None
     trace_id: str
@@ -512,7 +501,7 @@ class DeliveryStatus(str, Enum):
 
 class DeliveryIngestRequest(BaseModel):
     """Request payload for delivery log ingestion API (create)."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_request_id: str = Field(default_factory=_new_id)
 
     # Required fields
     sap_do_number: str  # SAP Delivery Order number (primary key in staging)
@@ -546,13 +535,13 @@ class DeliveryIngestRequest(BaseModel):
         return s
 
     def get_all_files(self) -> List[FileAttachment]:
-        """Get all file attachments."""
-        return list(self.files)
+        """Get all file attachments (the `files` list itself - treat as read-only)."""
+        return self.files
 
 
 class DeliveryUpdateRequest(BaseModel):
     """Request payload for delivery log update API."""
-    client_request_id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    client_request_id: str = Field(default_factory=_new_id)
 
     # Key for lookup — identifies which delivery to update
     sap_do_number: str  # REQUIRED
@@ -579,3 +568,15 @@ class DeliveryUpdateRequest(BaseModel):
         if "." in s and s.endswith("0"):
             s = s.rstrip("0").rstrip(".")
         return s
+
+
+# Smartsheet row / audit record models live in record_models, which is only
+# imported when one of them is first used (PEP 562).
+_RECORD_MODELS = frozenset(["UserActionRecord", "LPORecord", "TagRecord"])
+
+
+def __getattr__(name):
+    if name in _RECORD_MODELS:
+        from . import record_models
+        return getattr(record_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,59 @@
+"""
+Record Models
+=============
+
+Pydantic models for Smartsheet row records (LPO master, tag sheet) and the
+user action log. None of the function handlers build these, so they are kept
+out of shared.models and imported on first use - via `shared.X` or
+`shared.models.X` - instead of on every cold start.
+"""
+
+from datetime import datetime
+from typing import Optional
+from pydantic import BaseModel, Field
+
+from .models import ActionType, LPOStatus, TagStatus, _new_id
+
+
+class UserActionRecord(BaseModel):
+    """User action history record."""
+    action_id: str = Field(default_factory=_new_id)
+    timestamp: datetime = Field(default_factory=datetime.now)
+    user_id: str
+    action_type: ActionType
+    target_table: str
+    target_id: str
+    old_value: Optional[str] = None
+    new_value: Optional[str] = None
+    notes: Optional[str] = None
+    trace_id: Optional[str] = None
+
+
+class LPORecord(BaseModel):
+    """LPO master record (read from Smartsheet)."""
+    lpo_id: str
+    customer_lpo_ref: str
+    sap_reference: Optional[str] = None
+    customer_name: Optional[str] = None
+    project_name: Optional[str] = None
+    lpo_status: LPOStatus
+    brand: Optional[str] = None
+    po_quantity_sqm: float
+    delivered_quantity_sqm: float = 0
+    total_allocated_cost: float = 0
+    current_status: Optional[str] = None
+    row_id: Optional[int] = None  # Smartsheet row ID
+
+
+class TagRecord(BaseModel):
+    """Tag sheet record."""
+    tag_id: str
+    tag_name: Optional[str] = None
+    lpo_sap_reference: Optional[str] = None
+    required_delivery_date: Optional[str] = None
+    estimated_quantity: Optional[float] = None
+    status: TagStatus = TagStatus.DRAFT
+    file_hash: Optional[str] = None
+    client_request_id: Optional[str] = None
+    submitted_by: Optional[str] = None
+    row_id: Optional[int] = None  # Smartsheet row ID
@@ -28,13 +28,19 @@ import logging
 import time
 import threading
 import functools
-from typing import Optional, List, Dict, Any, Callable, TypeVar, Union
+from typing import Optional, List, Dict, Any, Callable, Tuple, TypeVar, Union
 from datetime import datetime
 import requests
 from requests.exceptions import RequestException
 
 from .manifest import WorkspaceManifest, get_manifest, ManifestNotFoundError
 from .logical_names import Sheet, Column
+from .smartsheet_errors import (  # Re-exported: callers import them from here
+    SmartsheetError,
+    SmartsheetRateLimitError,
+    SmartsheetSaveCollisionError,
+    SmartsheetNotFoundError,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -42,30 +48,6 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
-# ============== Custom Exceptions ==============
-
-class SmartsheetError(Exception):
-    """Base exception for Smartsheet operations."""
-    pass
-
-
-class SmartsheetRateLimitError(SmartsheetError):
-    """Raised when API rate limit is exceeded."""
-    def __init__(self, reset_time: Optional[int] = None):
-        self.reset_time = reset_time
-        super().__init__(f"Rate limit exceeded. Reset at: {reset_time}")
-
-
-class SmartsheetSaveCollisionError(SmartsheetError):
-    """Raised when a save collision occurs (concurrent update)."""
-    pass
-
-
-class SmartsheetNotFoundError(SmartsheetError):
-    """Raised when a resource is not found."""
-    pass
-
-
 # ============== Retry Decorator ==============
 
 def retry_with_backoff(
@@ -579,30 +561,12 @@ class SmartsheetClient:
             List of matching rows as dictionaries
         """
         sheet_data = self.get_sheet(sheet_ref)
-        sheet_id = sheet_data["id"]
         columns = sheet_data.get("columns", [])
         
         # Build column name map
         col_id_to_name = {col["id"]: col["title"] for col in columns}
         col_name_to_id = {col["title"]: col["id"] for col in columns}
-        
-        # Resolve column - try as name first, then as logical name in manifest
-        target_column_id = col_name_to_id.get(column_ref)
-        if not target_column_id:
-            # Try manifest lookup
-            sheet_logical = None
-            for ln in [sheet_ref] if isinstance(sheet_ref, str) else []:
-                if self._manifest.get_sheet_id(ln):
-                    sheet_logical = ln
-                    break
-            
-            if sheet_logical:
-                physical_name = self._manifest.get_column_name(sheet_logical, column_ref)
-                if physical_name:
-                    target_column_id = col_name_to_id.get(physical_name)
-        
-        if not target_column_id:
-            raise SmartsheetNotFoundError(f"Column '{column_ref}' not found in sheet")
+        target_column_id = self._resolve_search_column(sheet_ref, column_ref, col_name_to_id)
         
         # Normalize search value once
         normalized_value = self._normalize_for_comparison(value)
@@ -619,6 +583,77 @@ class SmartsheetClient:
 
         return matching_rows
     
+    def _resolve_search_column(
+        self,
+        sheet_ref: Union[str, int],
+        column_ref: str,
+        col_name_to_id: Dict[str, int]
+    ) -> int:
+        """Resolve a column (physical name first, then manifest logical name) to its ID."""
+        target_column_id = col_name_to_id.get(column_ref)
+        if not target_column_id and isinstance(sheet_ref, str) and self._manifest.get_sheet_id(sheet_ref):
+            physical_name = self._manifest.get_column_name(sheet_ref, column_ref)
+            if physical_name:
+                target_column_id = col_name_to_id.get(physical_name)
+        
+        if not target_column_id:
+            raise SmartsheetNotFoundError(f"Column '{column_ref}' not found in sheet")
+        return target_column_id
+    
+    @retry_with_backoff(max_retries=3)
+    def find_first_row(
+        self,
+        sheet_ref: Union[str, int],
+        criteria: List[Tuple[str, Any]]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find the first row matching any of several (column, value) criteria.
+        
+        Criteria are tried in order against a single sheet fetch, so this is
+        equivalent to chained find_row() calls at the cost of one. Criteria
+        whose column is not in the sheet are skipped (logged); only if none
+        resolves is SmartsheetNotFoundError raised.
+        
+        Args:
+            sheet_ref: Sheet reference (logical name, physical name, or ID)
+            criteria: (column_ref, value) pairs in priority order
+        
+        Returns:
+            Row dict for the highest-priority match, or None
+        """
+        sheet_data = self.get_sheet(sheet_ref)
+        columns = sheet_data.get("columns", [])
+        col_id_to_name = {col["id"]: col["title"] for col in columns}
+        col_name_to_id = {col["title"]: col["id"] for col in columns}
+        
+        targets = []
+        for column_ref, value in criteria:
+            try:
+                column_id = self._resolve_search_column(sheet_ref, column_ref, col_name_to_id)
+            except SmartsheetNotFoundError as e:
+                logger.warning(f"find_first_row: skipping criterion on {sheet_ref}: {e}")
+                continue
+            targets.append((column_id, value, self._normalize_for_comparison(value)))
+        if not targets:
+            raise SmartsheetNotFoundError(f"None of the search columns found in sheet {sheet_ref}")
+        
+        # Lowest criterion index matched so far; stop early on the first one
+        best_index, best_row = len(targets), None
+        for row in sheet_data.get("rows", []):
+            cells = {cell.get("columnId"): cell for cell in row.get("cells", [])}
+            for i, (column_id, value, normalized_value) in enumerate(targets[:best_index]):
+                cell = cells.get(column_id)
+                if cell is None:
+                    continue
+                cell_value = cell.get("value") or cell.get("displayValue")
+                if cell_value == value or self._normalize_for_comparison(cell_value) == normalized_value:
+                    best_index, best_row = i, row
+                    break
+            if best_index == 0:
+                break
+        
+        return self._row_to_dict(best_row, col_id_to_name) if best_row is not None else None
+    
     def find_row(
         self, 
         sheet_ref: Union[str, int], 
@@ -641,26 +676,18 @@ class SmartsheetClient:
         """
         return self.find_row(sheet_ref, column_ref, value)
     
-    @retry_with_backoff(max_retries=3)
-    def add_row(
-        self, 
-        sheet_ref: Union[str, int], 
+    def _build_cells(
+        self,
+        sheet_ref: Union[str, int],
+        columns: List[Dict[str, Any]],
         row_data: Dict[str, Any]
-    ) -> Dict[str, Any]:
+    ) -> List[Dict[str, Any]]:
         """
-        Add a new row to a sheet.
+        Build the Smartsheet cells array for a new row.
         
-        Args:
-            sheet_ref: Sheet reference
-            row_data: Dict mapping column names (physical or logical) to values
-        
-        Returns:
-            Created row data
+        Keys may be physical column names or logical names from the manifest.
+        None values are skipped.
         """
-        sheet_id = self.resolve_sheet_id(sheet_ref)
-        sheet_data = self.get_sheet(sheet_id)
-        columns = sheet_data.get("columns", [])
-        
         col_name_to_id = {col["title"]: col["id"] for col in columns}
         
         # Resolve logical column names if using manifest
@@ -695,6 +722,27 @@ class SmartsheetClient:
                     "value": resolved_row_data[col_name],
                     "strict": False
                 })
+        return cells
+    
+    @retry_with_backoff(max_retries=3)
+    def add_row(
+        self, 
+        sheet_ref: Union[str, int], 
+        row_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Add a new row to a sheet.
+        
+        Args:
+            sheet_ref: Sheet reference
+            row_data: Dict mapping column names (physical or logical) to values
+        
+        Returns:
+            Created row data
+        """
+        sheet_id = self.resolve_sheet_id(sheet_ref)
+        sheet_data = self.get_sheet(sheet_id)
+        cells = self._build_cells(sheet_ref, sheet_data.get("columns", []), row_data)
         
         url = f"{self.base_url}/sheets/{sheet_id}/rows"
         payload = {"toBottom": True, "cells": cells}
@@ -706,6 +754,46 @@ class SmartsheetClient:
         logger.info(f"Added row to sheet {self._sheet_label(sheet_ref, sheet_id)}: row_id={created_row.get('id')}")
         return created_row
     
+    @retry_with_backoff(max_retries=3)
+    def add_rows(
+        self, 
+        sheet_ref: Union[str, int], 
+        rows: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Add several rows to a sheet in a single API call.
+        
+        Same input format as add_row(), so callers can coalesce writes
+        without building cell arrays themselves (see add_rows_bulk for that).
+        
+        Args:
+            sheet_ref: Sheet reference
+            rows: List of dicts mapping column names (physical or logical) to values
+        
+        Returns:
+            List of created row data
+        """
+        if not rows:
+            return []
+        
+        sheet_id = self.resolve_sheet_id(sheet_ref)
+        sheet_data = self.get_sheet(sheet_id)
+        columns = sheet_data.get("columns", [])
+        
+        url = f"{self.base_url}/sheets/{sheet_id}/rows"
+        payload = [
+            {"toBottom": True, "cells": self._build_cells(sheet_ref, columns, row_data)}
+            for row_data in rows
+        ]
+        
+        response = self._make_request("POST", url, json=payload)
+        result = response.json()
+        created = result.get("result", [])
+        created_rows = created if isinstance(created, list) else [created]
+        
+        logger.info(f"Added {len(created_rows)} rows to sheet {self._sheet_label(sheet_ref, sheet_id)}")
+        return created_rows
+    
     @retry_with_backoff(max_retries=3)
     def update_row(
         self, 
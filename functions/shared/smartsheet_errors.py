@@ -0,0 +1,32 @@
+"""
+Smartsheet Exceptions
+=====================
+
+Exceptions raised by SmartsheetClient. Kept apart from smartsheet_client so
+light modules (helpers, id_generator, atomic_update) can match them by type
+without importing the HTTP client stack.
+"""
+
+from typing import Optional
+
+
+class SmartsheetError(Exception):
+    """Base exception for Smartsheet operations."""
+    pass
+
+
+class SmartsheetRateLimitError(SmartsheetError):
+    """Raised when API rate limit is exceeded."""
+    def __init__(self, reset_time: Optional[int] = None):
+        self.reset_time = reset_time
+        super().__init__(f"Rate limit exceeded. Reset at: {reset_time}")
+
+
+class SmartsheetSaveCollisionError(SmartsheetError):
+    """Raised when a save collision occurs (concurrent update)."""
+    pass
+
+
+class SmartsheetNotFoundError(SmartsheetError):
+    """Raised when a resource is not found."""
+    pass
@@ -449,6 +449,34 @@ class MockSmartsheetClient:
                 return self.storage.find_rows(physical_sheet, physical_col, value)
         return self.storage.find_rows(sheet_ref, column_ref, value)
     
+    def resolve_column_id(self, sheet_ref, column_ref: str) -> int:
+        """Resolve a column (logical or physical name) to its ID."""
+        if isinstance(sheet_ref, str) and self._manifest.has_sheet(sheet_ref):
+            col_id = self._manifest.get_column_id(sheet_ref, column_ref)
+            if col_id:
+                return col_id
+        sheet = self.storage._get_sheet(sheet_ref)
+        for col in sheet["columns"]:
+            if col["title"] == column_ref:
+                return col["id"]
+        raise KeyError(f"Column not found: {column_ref}")
+    
+    def get_row(self, sheet_ref, row_id: int) -> Optional[Dict[int, Any]]:
+        """Get a row's cell values keyed by column ID, or None if not found."""
+        sheet = self.storage._get_sheet(sheet_ref)
+        for row in sheet["rows"]:
+            if row["id"] == row_id:
+                return {cell["columnId"]: cell.get("value") for cell in row.get("cells", [])}
+        return None
+    
+    def find_first_row(self, sheet_ref, criteria: List) -> Optional[Dict]:
+        """First row matching any (column, value) criterion, in priority order."""
+        for column_ref, value in criteria:
+            row = self.find_row(sheet_ref, column_ref, value)
+            if row:
+                return row
+        return None
+    
     def find_row_by_column(self, sheet_ref, column_ref: str, value: Any) -> Optional[Dict]:
         """Deprecated alias for find_row."""
         return self.find_row(sheet_ref, column_ref, value)
@@ -464,7 +492,11 @@ class MockSmartsheetClient:
                 resolved_data[physical_col or key] = value
             return self.storage.add_row(physical_sheet, resolved_data)
         return self.storage.add_row(sheet_ref, row_data)
-    
+
+    def add_rows(self, sheet_ref, rows: List[Dict]) -> List[Dict]:
+        """Add several rows to a sheet (single call in production)."""
+        return [self.add_row(sheet_ref, row_data) for row_data in rows]
+
     def update_row(self, sheet_ref, row_id: int, updates: Dict) -> Dict:
         """Update a row."""
         if isinstance(sheet_ref, str) and self._manifest.has_sheet(sheet_ref):
@@ -731,3 +731,61 @@ class TestInventoryTransactionLogging:
             f"Consumption of 8.0 actual + 2.0 accessories should produce 2 txn rows. "
             f"All add_row calls: {[(str(c[0][0]), list(c[0][1].keys()) if len(c[0]) > 1 else 'N/A') for c in mock_client.add_row.call_args_list]}"
         )
+
+
+# ── Test: consumption audit rows are written in bulk ────────────────────────
+
+class TestConsumptionAuditBuffer:
+    """Audit rows from one submission go out through the caller's AuditBuffer."""
+
+    def test_unmatched_lines_flush_in_one_add_rows(self, manifest, manifest_data):
+        """Two unmatched materials -> one add_rows call carrying both exception rows."""
+        from shared.audit import AuditBuffer
+        from shared.consumption_service import submit_consumption
+        from shared.flow_models import ConsumptionSubmission, ConsumptionLine
+
+        alloc_rows = [
+            {"_row_id": 100, "ALLOCATION_ID": "ALLOC-001", "TAG_SHEET_ID": "TAG-0013",
+             "MATERIAL_CODE": "MAT-A", "SAP_CODE": "SAP-A", "QUANTITY": 100.0, "UOM": "m2",
+             "STATUS": "Active", "RAW_QUANTITY": 100.0, "RAW_UOM": "m2"},
+        ]
+        sheets = {
+            "ALLOCATION": _make_sheet_response("ALLOCATION_LOG", manifest_data, alloc_rows),
+            "CONSUMPTION": _make_sheet_response("CONSUMPTION_LOG", manifest_data, []),
+        }
+
+        mock_client = MagicMock()
+        mock_client.get_sheet.side_effect = lambda sheet_ref, **kwargs: next(
+            (s for key, s in sheets.items() if key in str(sheet_ref)),
+            {"id": 0, "columns": [], "rows": []},
+        )
+        mock_client.find_rows.return_value = []
+
+        submission = ConsumptionSubmission(
+            allocation_ids=["ALLOC-001"],
+            lines=[
+                ConsumptionLine(allocation_id="ALLOC-001", canonical_code=code,
+                                allocated_qty=10.0, actual_qty=0.0, uom="m2")
+                for code in ("MAT-X", "MAT-Y")
+            ],
+            user="test@example.com",
+            plant="PLANT-A",
+            shift="Morning",
+        )
+
+        allocator = MagicMock()
+        allocator.next.side_effect = ["EX-0001", "EX-0002"]
+        with patch("shared.consumption_service.get_manifest", return_value=manifest), \
+             patch("shared.consumption_service.AllocationLock") as mock_lock, \
+             patch("shared.consumption_service.validate_consumption", return_value=MagicMock(ok=True)), \
+             patch("shared.audit.get_block_allocator", return_value=allocator):
+            mock_lock.return_value.__enter__.return_value.success = True
+            with AuditBuffer(mock_client, trace_id="test-trace-003") as audit:
+                submit_consumption(mock_client, submission, trace_id="test-trace-003", buffer=audit)
+                mock_client.add_rows.assert_not_called()
+
+        mock_client.add_row.assert_not_called()
+        mock_client.add_rows.assert_called_once()
+        sheet, rows = mock_client.add_rows.call_args.args
+        assert sheet == Sheet.EXCEPTION_LOG
+        assert [r[Column.EXCEPTION_LOG.MATERIAL_CODE] for r in rows] == ["MAT-X", "MAT-Y"]
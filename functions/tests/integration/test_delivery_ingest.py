@@ -20,6 +20,8 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
+from shared.audit_queue import AuditQueue
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -112,6 +114,7 @@ class TestDeliveryIngestHappyPath:
         request_data = _make_delivery_request(sap_do_number="DO-AUDIT-001")
 
         _call_delivery_ingest(mock_storage, request_data)
+        AuditQueue.instance().flush()  # User actions are written in the background
 
         actions = mock_storage.find_rows(
             "98 User Action Log", "Action Type", "DO_CREATED"
@@ -343,6 +346,7 @@ class TestDeliveryUpdate:
             "updated_by": "auditor@company.com",
         }
         _call_delivery_ingest(mock_storage, update_data, method="PUT")
+        AuditQueue.instance().flush()  # User actions are written in the background
 
         actions = mock_storage.find_rows(
             "98 User Action Log", "Action Type", "LPO_UPDATED"
@@ -303,6 +303,37 @@ class TestUserActionLogging:
         actions = mock_storage.find_rows("98 User Action Log", "User ID", "failed-user@company.com")
         assert len(actions) >= 1
         assert any(a.get("Action Type") == "OPERATION_FAILED" for a in actions)
+    
+    @pytest.mark.integration
+    def test_audit_rows_written_in_one_add_rows_per_sheet(self, mock_storage, factory, mock_http_request):
+        """Exception and user action rows of one request are flushed together."""
+        request_data = factory.create_tag_ingest_request(
+            lpo_sap_reference="NON-EXISTENT",
+            uploaded_by="bulk-user@company.com"
+        )
+        
+        from tests.conftest import MockSmartsheetClient, MockWorkspaceManifest
+        mock_client = MockSmartsheetClient(mock_storage)
+        
+        with patch.object(mock_client, 'add_row', wraps=mock_client.add_row) as add_row, \
+             patch.object(mock_client, 'add_rows', wraps=mock_client.add_rows) as add_rows:
+            with patch('fn_ingest_tag.get_smartsheet_client', return_value=mock_client):
+                with patch('fn_ingest_tag.get_manifest', return_value=MockWorkspaceManifest()):
+                    with patch('fn_ingest_tag._manifest', MockWorkspaceManifest()):
+                        import fn_ingest_tag
+                        response = fn_ingest_tag.main(mock_http_request(request_data))
+        
+        assert response.status_code == 422
+        
+        # One add_rows per audit sheet, and every audit add_row came from it
+        audit_sheets = (Sheet.EXCEPTION_LOG, Sheet.USER_ACTION_LOG)
+        flushed = [c.args for c in add_rows.call_args_list if c.args[0] in audit_sheets]
+        assert sorted(sheet for sheet, _ in flushed) == sorted(audit_sheets)
+        written = [c for c in add_row.call_args_list if c.args[0] in audit_sheets]
+        assert len(written) == sum(len(rows) for _, rows in flushed)
+        
+        actions = mock_storage.find_rows("98 User Action Log", "User ID", "bulk-user@company.com")
+        assert any(a.get("Action Type") == "OPERATION_FAILED" for a in actions)
 
 
 class TestTagRecordFields:
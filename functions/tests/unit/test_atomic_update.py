@@ -0,0 +1,200 @@
+"""
+Unit Tests for Atomic Update Helpers
+
+Tests atomic_increment / atomic_set_if_equals for:
+- Read-modify-write results
+- Physical column resolution caching
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared import atomic_update
+from shared.atomic_update import atomic_increment, atomic_set_if_equals, _resolve_physical_col
+from shared.manifest import reset_manifest
+from shared.smartsheet_errors import SmartsheetSaveCollisionError
+
+
+@pytest.fixture
+def manifest():
+    """Patch the manifest used by atomic_update and clear the column cache."""
+    _resolve_physical_col.cache_clear()
+    mock = MagicMock()
+    mock.get_column_name.return_value = "Allocated Quantity"
+    with patch.object(atomic_update, "get_manifest", return_value=mock):
+        yield mock
+    _resolve_physical_col.cache_clear()
+
+
+def _client(current_value):
+    client = MagicMock()
+    client.get_row.return_value = {"row_id": 1, "Allocated Quantity": current_value}
+    return client
+
+
+class TestAtomicIncrement:
+    """Tests for atomic_increment."""
+
+    @pytest.mark.unit
+    def test_increment_success(self, manifest):
+        """New value is current + increment."""
+        client = _client("10.5")
+        result = atomic_increment(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 2.0)
+
+        assert result.success
+        assert result.old_value == 10.5
+        assert result.new_value == 12.5
+        client.update_row.assert_called_once_with("LPO_MASTER", 1, {"ALLOCATED_QUANTITY": 12.5})
+
+    @pytest.mark.unit
+    def test_column_lookup_cached(self, manifest):
+        """Repeated calls resolve the physical column once."""
+        client = _client("0")
+        atomic_increment(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 1.0)
+        atomic_increment(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 1.0)
+
+        assert manifest.get_column_name.call_count == 1
+
+    @pytest.mark.unit
+    def test_reset_manifest_clears_column_cache(self, manifest):
+        """reset_manifest() drops cached column resolutions."""
+        client = _client("0")
+        atomic_increment(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 1.0)
+        reset_manifest()
+        atomic_increment(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 1.0)
+
+        assert manifest.get_column_name.call_count == 2
+
+
+class TestAtomicSetIfEquals:
+    """Tests for atomic_set_if_equals."""
+
+    @pytest.mark.unit
+    def test_cas_success(self, manifest):
+        """Value is written when current equals expected."""
+        client = _client("5")
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 5.0, 7.0)
+
+        assert result.success
+        assert result.new_value == 7.0
+
+    @pytest.mark.unit
+    def test_cas_value_changed(self, manifest):
+        """No write when current differs from expected."""
+        client = _client("6")
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 5.0, 7.0)
+
+        assert not result.success
+        assert result.error_code == "VALUE_CHANGED"
+        client.update_row.assert_not_called()
+
+    @pytest.mark.unit
+    def test_cas_tolerates_float_noise(self, manifest):
+        """JSON round-trip noise does not fail the comparison."""
+        client = _client(10.100000000000001)
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 10.1, 11.0)
+
+        assert result.success
+
+    @pytest.mark.unit
+    def test_cas_quantum_comparison(self, manifest):
+        """With quantum, values equal to that resolution match."""
+        client = _client("12.344")
+        result = atomic_set_if_equals(
+            client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 12.34, 13.0, quantum=0.01
+        )
+
+        assert result.success
+
+    @pytest.mark.unit
+    def test_cas_quantum_detects_real_change(self, manifest):
+        """With quantum, a change of one unit is still detected."""
+        client = _client("12.35")
+        result = atomic_set_if_equals(
+            client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 12.34, 13.0, quantum=0.01
+        )
+
+        assert result.error_code == "VALUE_CHANGED"
+
+    @pytest.mark.unit
+    def test_cas_zero_matches_zero(self, manifest):
+        """A legitimate 0.0 current value matches expected_value=0.0."""
+        client = _client(0.0)
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 0.0, 5.0)
+
+        assert result.success
+        assert result.old_value == 0.0
+
+    @pytest.mark.unit
+    def test_cas_missing_cell_reads_as_zero(self, manifest):
+        """An empty cell is treated as 0.0."""
+        client = MagicMock()
+        client.get_row.return_value = {"row_id": 1}
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 0.0, 5.0)
+
+        assert result.success
+        assert isinstance(result.old_value, float)
+
+
+class TestAtomicUpdateResult:
+    """Tests for the result type."""
+
+    @pytest.mark.unit
+    def test_result_is_immutable(self):
+        """Results cannot be modified after construction."""
+        result = atomic_update.AtomicUpdateResult(success=True, new_value=1.0)
+
+        with pytest.raises(AttributeError):
+            result.success = False
+
+    @pytest.mark.unit
+    def test_result_truthiness(self):
+        """bool(result) reflects success."""
+        assert atomic_update.AtomicUpdateResult(success=True)
+        assert not atomic_update.AtomicUpdateResult(success=False)
+
+
+class TestCollisionRetry:
+    """Tests for the shared collision retry loop."""
+
+    @pytest.mark.unit
+    def test_cas_retries_on_collision(self, manifest):
+        """A transient 4004 collision is retried instead of failing the CAS."""
+        client = _client("5")
+        client.update_row.side_effect = [SmartsheetSaveCollisionError("errorCode 4004: save collision"), {"id": 1}]
+
+        with patch.object(atomic_update.time, "sleep"):
+            result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 5.0, 7.0)
+
+        assert result.success
+        assert result.retries_used == 1
+        assert client.get_row.call_count == 2
+
+    @pytest.mark.unit
+    def test_increment_gives_up_after_max_retries(self, manifest):
+        """Persistent collisions end with COLLISION_MAX_RETRIES."""
+        client = _client("5")
+        client.update_row.side_effect = SmartsheetSaveCollisionError("4004 collision")
+
+        with patch.object(atomic_update.time, "sleep"):
+            result = atomic_increment(
+                client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 1.0, max_retries=3
+            )
+
+        assert result.error_code == "COLLISION_MAX_RETRIES"
+        assert client.update_row.call_count == 3
+
+    @pytest.mark.unit
+    def test_non_collision_error_not_retried(self, manifest):
+        """Other errors fail immediately with UPDATE_ERROR."""
+        client = _client("5")
+        client.update_row.side_effect = Exception("permission denied")
+
+        result = atomic_set_if_equals(client, "LPO_MASTER", 1, "ALLOCATED_QUANTITY", 5.0, 7.0)
+
+        assert result.error_code == "UPDATE_ERROR"
+        assert client.update_row.call_count == 1
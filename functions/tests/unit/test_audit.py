@@ -0,0 +1,352 @@
+"""
+Unit Tests for Audit Utilities
+
+Tests create_exception / log_user_action for:
+- Direct (unbuffered) writes
+- Buffered writes via AuditBuffer (bulk flush, reserved IDs)
+- Background writes via AuditQueue (default for log_user_action, flushed at exit)
+"""
+
+import pytest
+import subprocess
+from unittest.mock import MagicMock, patch
+
+import sys
+import os
+FUNCTIONS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, FUNCTIONS_DIR)
+
+from shared.audit import AuditBuffer, ExceptionIdPool, create_exception, log_user_action
+from shared.audit_queue import AuditQueue
+from shared.models import ExceptionSeverity, ExceptionSource, ReasonCode, ActionType
+
+
+def _rows(mock_client, sheet_name):
+    return mock_client.storage.sheets[sheet_name]["rows"]
+
+
+def _config_value(mock_client, key):
+    return mock_client.storage.find_rows("00a Config", "config_key", key)[0]["config_value"]
+
+
+class TestCreateException:
+    """Tests for unbuffered create_exception."""
+
+    @pytest.mark.unit
+    def test_writes_row_immediately(self, mock_client):
+        """With wait=True the exception row is added on the call itself."""
+        ex_id = create_exception(
+            mock_client,
+            trace_id="trace-1",
+            reason_code=ReasonCode.LPO_NOT_FOUND,
+            severity=ExceptionSeverity.HIGH,
+            source=ExceptionSource.INGEST,
+            message="LPO missing",
+            wait=True,
+        )
+
+        assert ex_id == "EX-0001"
+        assert len(_rows(mock_client, "99 Exception Log")) == 1
+
+    @pytest.mark.unit
+    def test_retry_with_same_client_request_id_hits_cache(self):
+        """A replayed client_request_id returns the cached ID without find_row."""
+        client = MagicMock()
+        client.find_row.return_value = None
+
+        first = create_exception(
+            client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+            client_request_id="req-1", exception_id="EX-0042", wait=True
+        )
+        second = create_exception(
+            client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+            client_request_id="req-1"
+        )
+
+        assert first == second == "EX-0042"
+        assert client.find_row.call_count == 1
+        assert client.add_row.call_count == 1
+
+    @pytest.mark.unit
+    def test_dedup_cache_expires(self):
+        """Entries older than the TTL are dropped."""
+        from shared.audit import _DedupCache
+
+        cache = _DedupCache(ttl_seconds=-1)
+        cache.set("req-1", "EX-0001")
+
+        assert cache.get("req-1") is None
+
+    @pytest.mark.unit
+    def test_dedup_cache_evicts_least_recent(self):
+        """The cache is bounded by maxsize (LRU)."""
+        from shared.audit import _DedupCache
+
+        cache = _DedupCache(maxsize=2)
+        cache.set("a", "EX-1")
+        cache.set("b", "EX-2")
+        cache.get("a")
+        cache.set("c", "EX-3")
+
+        assert cache.get("b") is None
+        assert cache.get("a") == "EX-1"
+
+
+class TestClock:
+    """Tests for the per-second audit timestamp cache."""
+
+    @pytest.mark.unit
+    def test_same_second_reuses_value(self):
+        """Calls within one wall-clock second share the formatted string."""
+        from shared import audit
+
+        with patch.object(audit.time, "time", side_effect=[1767780000.1, 1767780000.9, 1767780001.0]):
+            first = audit._clock_now()
+            second = audit._clock_now()
+            third = audit._clock_now()
+
+        assert first is not None and first == second
+        assert first[1] == "2026-01-07T14:00:00"
+        assert third[1] == "2026-01-07T14:00:01"
+
+
+class TestAuditBuffer:
+    """Tests for AuditBuffer batching."""
+
+    @pytest.mark.unit
+    def test_rows_written_on_exit(self, mock_client):
+        """Buffered rows are only written when the buffer flushes."""
+        with AuditBuffer(mock_client, trace_id="trace-1") as buf:
+            ex_id = create_exception(
+                mock_client, "trace-1", ReasonCode.SHORTAGE, ExceptionSeverity.LOW, buffer=buf
+            )
+            act_id = log_user_action(
+                mock_client, "user@company.com", ActionType.EXCEPTION_CREATED,
+                "EXCEPTION_LOG", ex_id, trace_id="trace-1", buffer=buf
+            )
+            assert len(buf) == 2
+            assert _rows(mock_client, "99 Exception Log") == []
+            assert _rows(mock_client, "98 User Action Log") == []
+
+        assert ex_id == "EX-0001"
+        assert act_id == "ACT-0001"
+        assert len(_rows(mock_client, "99 Exception Log")) == 1
+        assert len(_rows(mock_client, "98 User Action Log")) == 1
+        assert len(buf) == 0
+
+    @pytest.mark.unit
+    def test_one_add_rows_call_per_sheet(self):
+        """Flush issues a single add_rows per sheet."""
+        client = MagicMock()
+        buf = AuditBuffer(client)
+        buf.add_exception({"a": 1})
+        buf.add_exception({"a": 2})
+        buf.add_user_action({"b": 1})
+
+        buf.flush()
+
+        assert client.add_rows.call_count == 2
+        assert client.add_row.call_count == 0
+        assert len(client.add_rows.call_args_list[0].args[1]) == 2
+
+    @pytest.mark.unit
+    def test_ids_reserved_in_one_block(self, mock_client):
+        """expected_exceptions IDs are reserved with one sequence bump."""
+        with AuditBuffer(mock_client, expected_exceptions=3) as buf:
+            first = create_exception(
+                mock_client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW, buffer=buf
+            )
+            # Whole block reserved up front
+            assert _config_value(mock_client, "seq_exception") == "3"
+            ids = [first] + [
+                create_exception(mock_client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW, buffer=buf)
+                for _ in range(2)
+            ]
+
+        assert ids == ["EX-0001", "EX-0002", "EX-0003"]
+        assert _config_value(mock_client, "seq_exception") == "3"
+
+    @pytest.mark.unit
+    def test_flush_failure_does_not_raise(self):
+        """A failed bulk write is logged, not raised."""
+        client = MagicMock()
+        client.add_rows.side_effect = Exception("boom")
+        buf = AuditBuffer(client)
+        buf.add_exception({"a": 1})
+
+        buf.flush()
+
+        assert len(buf) == 0
+
+
+class TestBackgroundWrites:
+    """Tests for wait=False (fire-and-forget) audit writes."""
+
+    @pytest.mark.unit
+    def test_exception_written_via_queue(self, mock_client):
+        """wait=False returns the ID and the row lands after the queue drains."""
+        ex_id = create_exception(
+            mock_client, "trace-1", ReasonCode.SHORTAGE, ExceptionSeverity.LOW, wait=False
+        )
+        AuditQueue.instance().flush()
+
+        assert ex_id == "EX-0001"
+        assert len(_rows(mock_client, "99 Exception Log")) == 1
+
+    @pytest.mark.unit
+    def test_exception_queued_by_default(self):
+        """Without wait=True the row is enqueued; retries see it as pending."""
+        client = MagicMock()
+        client.find_row.return_value = None
+
+        with patch.object(AuditQueue, "enqueue") as enqueue:
+            first = create_exception(
+                client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+                client_request_id="req-q", exception_id="EX-0042"
+            )
+            retry = create_exception(
+                client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+                client_request_id="req-q"
+            )
+
+        assert first == retry == "EX-0042"
+        enqueue.assert_called_once()
+        assert enqueue.call_args.args[1] == "EXCEPTION_LOG"
+        client.add_row.assert_not_called()
+
+    @pytest.mark.unit
+    def test_failed_queued_write_is_not_cached(self):
+        """A retry after a failed background write creates the exception again."""
+        client = MagicMock()
+        client.find_row.return_value = None
+        client.add_rows.side_effect = [Exception("429 rate limited"), []]
+        allocator = MagicMock()
+        allocator.next.side_effect = ["EX-0001", "EX-0002"]
+
+        with patch("shared.audit.get_block_allocator", return_value=allocator):
+            first = create_exception(
+                client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+                client_request_id="req-fail"
+            )
+            AuditQueue.instance().flush()
+            retry = create_exception(
+                client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+                client_request_id="req-fail"
+            )
+            AuditQueue.instance().flush()
+
+        assert (first, retry) == ("EX-0001", "EX-0002")
+        assert client.add_rows.call_count == 2
+        assert client.add_rows.call_args.args[1][0]["CLIENT_REQUEST_ID"] == "req-fail"
+
+    @pytest.mark.unit
+    def test_written_queued_row_is_cached(self):
+        """Once the background write succeeds, retries skip find_row."""
+        client = MagicMock()
+        client.find_row.return_value = None
+
+        first = create_exception(
+            client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+            client_request_id="req-ok", exception_id="EX-0007"
+        )
+        AuditQueue.instance().flush()
+        retry = create_exception(
+            client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+            client_request_id="req-ok"
+        )
+
+        assert first == retry == "EX-0007"
+        assert client.find_row.call_count == 1
+        client.add_rows.assert_called_once()
+
+    @pytest.mark.unit
+    def test_queued_rows_written_in_bulk(self):
+        """Rows for the same client and sheet go out in one add_rows call."""
+        client = MagicMock()
+        q = AuditQueue(max_batch=10, max_delay_ms=200)
+        for i in range(3):
+            q.enqueue(client, "USER_ACTION_LOG", {"n": i})
+        q.flush()
+
+        client.add_rows.assert_called_once_with("USER_ACTION_LOG", [{"n": 0}, {"n": 1}, {"n": 2}])
+
+    @pytest.mark.unit
+    def test_queue_failure_is_logged_not_raised(self):
+        """A failing bulk write does not kill the worker."""
+        client = MagicMock()
+        client.add_rows.side_effect = [Exception("boom"), []]
+        q = AuditQueue(max_batch=1)
+        q.enqueue(client, "EXCEPTION_LOG", {"n": 1})
+        q.flush()
+        q.enqueue(client, "EXCEPTION_LOG", {"n": 2})
+        q.flush()
+
+        assert client.add_rows.call_count == 2
+
+    @pytest.mark.unit
+    def test_user_action_queued_by_default(self, mock_client):
+        """log_user_action hands its row to the AuditQueue unless wait=True."""
+        with patch.object(AuditQueue, "enqueue") as enqueue:
+            act_id = log_user_action(
+                mock_client, "user@company.com", ActionType.LPO_CREATED,
+                "LPO_MASTER", "PTE-1", trace_id="trace-1"
+            )
+            log_user_action(
+                mock_client, "user@company.com", ActionType.LPO_UPDATED,
+                "LPO_MASTER", "PTE-1", trace_id="trace-1", wait=True
+            )
+
+        assert act_id == "ACT-0001"
+        enqueue.assert_called_once()
+        assert enqueue.call_args.args[1] == "USER_ACTION_LOG"
+        assert len(_rows(mock_client, "98 User Action Log")) == 1  # wait=True row only
+
+    @pytest.mark.unit
+    def test_queued_rows_flushed_at_exit(self):
+        """Rows still queued when the interpreter exits are written by the atexit hook."""
+        code = (
+            "from shared.audit_queue import AuditQueue\n"
+            "class Client:\n"
+            "    def add_rows(self, sheet, rows):\n"
+            "        print(sheet, len(rows), flush=True)\n"
+            "q, client = AuditQueue.instance(), Client()\n"
+            "q.max_delay = 0.5\n"  # Worker still collecting the batch at exit
+            "for i in range(3):\n"
+            "    q.enqueue(client, 'USER_ACTION_LOG', {'n': i})\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=FUNCTIONS_DIR, capture_output=True, text=True, check=True, timeout=30,
+        )
+        assert result.stdout.split() == ["USER_ACTION_LOG", "3"]
+
+
+class TestExceptionIdPool:
+    """Tests for pre-reserved exception IDs."""
+
+    @pytest.mark.unit
+    def test_pool_reserves_block_once(self, mock_client):
+        """IDs come from one sequence update; create_exception skips generation."""
+        with ExceptionIdPool(mock_client, expected=3) as pool:
+            ids = [
+                create_exception(
+                    mock_client, "t", ReasonCode.SHORTAGE, ExceptionSeverity.LOW,
+                    exception_id=pool.next()
+                )
+                for _ in range(3)
+            ]
+
+        AuditQueue.instance().flush()
+
+        assert ids == ["EX-0001", "EX-0002", "EX-0003"]
+        assert _config_value(mock_client, "seq_exception") == "3"
+        assert len(_rows(mock_client, "99 Exception Log")) == 3
+
+    @pytest.mark.unit
+    def test_pool_refills_when_exhausted(self, mock_client):
+        """Running past `expected` reserves another block."""
+        with ExceptionIdPool(mock_client, expected=2) as pool:
+            ids = [pool.next() for _ in range(3)]
+
+        assert ids == ["EX-0001", "EX-0002", "EX-0003"]
+        assert _config_value(mock_client, "seq_exception") == "4"
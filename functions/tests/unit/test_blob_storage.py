@@ -0,0 +1,139 @@
+"""
+Unit Tests for Azure Blob Storage Helper
+
+Tests:
+- BlobServiceClient reuse across calls
+- Behaviour when storage is not configured
+"""
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared import blob_storage
+from shared.blob_storage import get_blob_service_client
+
+
+CONN_STR = "DefaultEndpointsProtocol=https;AccountName=test;AccountKey=dGVzdA==;EndpointSuffix=core.windows.net"
+
+
+@pytest.fixture(autouse=True)
+def clear_client_cache():
+    blob_storage._blob_service_client_for.cache_clear()
+    yield
+    blob_storage._blob_service_client_for.cache_clear()
+
+
+class TestGetBlobServiceClient:
+    """Tests for get_blob_service_client."""
+
+    @pytest.mark.unit
+    def test_not_configured_returns_none(self, monkeypatch):
+        """No connection string -> None."""
+        monkeypatch.delenv("AZURE_STORAGE_CONNECTION_STRING", raising=False)
+        assert get_blob_service_client() is None
+
+    @pytest.mark.unit
+    def test_package_missing_returns_none(self, monkeypatch):
+        """Without azure-storage-blob the helper returns None up front."""
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", CONN_STR)
+        monkeypatch.setattr(blob_storage, "_HAS_AZURE_BLOB", False)
+        assert get_blob_service_client() is None
+
+    @pytest.mark.unit
+    def test_client_reused_across_calls(self, monkeypatch):
+        """The client is built once per connection string."""
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", CONN_STR)
+
+        first = get_blob_service_client()
+        second = get_blob_service_client()
+
+        assert first is not None
+        assert first is second
+
+    @pytest.mark.unit
+    def test_creation_failure_not_cached(self, monkeypatch):
+        """A failed construction is retried on the next call."""
+        monkeypatch.setenv("AZURE_STORAGE_CONNECTION_STRING", CONN_STR)
+        with patch("azure.storage.blob.BlobServiceClient.from_connection_string",
+                   side_effect=[ValueError("bad"), "client"]):
+            assert get_blob_service_client() is None
+            assert get_blob_service_client() == "client"
+
+
+class TestUploadJsonBlob:
+    """Tests for upload_json_blob serialization."""
+
+    @pytest.mark.unit
+    def test_compact_by_default(self):
+        """JSON is uploaded without indentation."""
+        with patch.object(blob_storage, "upload_content_blob", return_value="url") as upload:
+            blob_storage.upload_json_blob({"a": 1, "b": [1, 2]}, "x.json", "trace-1")
+
+        assert upload.call_args.kwargs["content"] == b'{"a":1,"b":[1,2]}'
+
+    @pytest.mark.unit
+    def test_pretty_option(self):
+        """pretty=True keeps the indented format."""
+        with patch.object(blob_storage, "upload_content_blob", return_value="url") as upload:
+            blob_storage.upload_json_blob({"a": 1}, "x.json", "trace-1", pretty=True)
+
+        assert upload.call_args.kwargs["content"] == b'{\n  "a": 1\n}'
+
+    @pytest.mark.unit
+    def test_datetime_and_fallback_match_stdlib(self):
+        """Datetimes and non-JSON values serialize like json.dumps(default=str)."""
+        import json
+        from datetime import datetime
+
+        data = {"at": datetime(2026, 1, 7, 14, 30), "big": 2 ** 70, "ok": "é"}
+
+        assert json.loads(blob_storage._dumps_json(data)) == json.loads(
+            json.dumps(data, default=str)
+        )
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_non_finite_floats_written_as_null(self, use_orjson, monkeypatch):
+        """NaN / Infinity become null with and without orjson."""
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(blob_storage, "orjson", None)
+
+        data = {"waste": float("nan"), "areas": [1.5, float("inf")], "nested": {"x": float("-inf")}}
+
+        assert blob_storage._dumps_json(data) == b'{"waste":null,"areas":[1.5,null],"nested":{"x":null}}'
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_numpy_values_written_as_numbers(self, use_orjson, monkeypatch):
+        """numpy scalars and arrays serialize as plain numbers with and without orjson."""
+        np = pytest.importorskip("numpy")
+        if use_orjson:
+            pytest.importorskip("orjson")
+        else:
+            monkeypatch.setattr(blob_storage, "orjson", None)
+
+        data = {"qty": np.int64(5), "area": np.float64(1.5), "ok": np.bool_(True), "ids": np.array([1, 2])}
+
+        assert blob_storage._dumps_json(data) == b'{"qty":5,"area":1.5,"ok":true,"ids":[1,2]}'
+
+    @pytest.mark.unit
+    def test_non_finite_floats_null_when_pretty(self):
+        """The pretty (stdlib-only) path writes null too."""
+        assert blob_storage._dumps_json({"a": float("nan")}, pretty=True) == b'{\n  "a": null\n}'
+
+
+class TestJoinBlobPath:
+    """Tests for blob path assembly."""
+
+    @pytest.mark.unit
+    def test_with_and_without_folder(self):
+        """Folder is prefixed only when given."""
+        assert blob_storage._join_blob_path("PTE-185", "NEST-0001.json") == "PTE-185/NEST-0001.json"
+        assert blob_storage._join_blob_path(None, "NEST-0001.json") == "NEST-0001.json"
+        assert blob_storage._join_blob_path("", "NEST-0001.json") == "NEST-0001.json"
@@ -73,6 +73,12 @@ class TestGetCellValueByColumnId:
         }
         value = get_cell_value_by_column_id(row_data, 1111111111111111)
         assert value == "Value from string key"
+    
+    def test_get_value_falsy_not_shadowed(self):
+        """Test falsy cell values (0, "", False) are returned as-is."""
+        for falsy in (0, 0.0, "", False):
+            row_data = {1111111111111111: falsy, "1111111111111111": "stale"}
+            assert get_cell_value_by_column_id(row_data, 1111111111111111) is falsy
 
 
 @pytest.mark.unit
@@ -122,3 +128,18 @@ class TestGetCellValueByLogicalName:
             )
         
         assert value is None
+        
+    def test_column_id_resolution_memoized_per_manifest(self, sample_row_data, mock_manifest):
+        """Repeated lookups hit the manifest once; a new manifest is consulted afresh."""
+        with patch("shared.event_utils.get_manifest", return_value=mock_manifest):
+            for _ in range(3):
+                get_cell_value_by_logical_name(sample_row_data, "01H_LPO_INGESTION", "CUSTOMER_NAME")
+        
+        assert mock_manifest.get_column_id.call_count == 1
+        
+        other = MagicMock()
+        other.get_column_id.return_value = 1111111111111111
+        with patch("shared.event_utils.get_manifest", return_value=other):
+            value = get_cell_value_by_logical_name(sample_row_data, "01H_LPO_INGESTION", "CUSTOMER_NAME")
+        
+        assert value == "SAP-PTE-185"
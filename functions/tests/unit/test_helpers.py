@@ -28,6 +28,7 @@ from shared.helpers import (
     compute_file_hash_from_base64,
     calculate_sla_due,
     format_datetime_for_smartsheet,
+    is_save_collision,
     parse_float_safe,
     safe_get,
 )
@@ -105,9 +106,9 @@ class TestComputeFileHashFromUrl:
     @pytest.mark.unit
     def test_successful_download_and_hash(self):
         """Test successful file download and hash computation."""
-        with patch('shared.helpers.requests.get') as mock_get:
+        with patch('shared.helpers._HTTP_SESSION.get') as mock_get:
             mock_response = MagicMock()
-            mock_response.content = b"test content"
+            mock_response.iter_content.return_value = [b"test ", b"content"]
             mock_response.raise_for_status = MagicMock()
             mock_get.return_value = mock_response
             
@@ -115,11 +116,13 @@ class TestComputeFileHashFromUrl:
             
             assert result is not None
             assert result == hashlib.sha256(b"test content").hexdigest()
+            assert mock_get.call_args[1]["stream"] is True
+            mock_response.close.assert_called_once()
     
     @pytest.mark.unit
     def test_download_failure_returns_none(self):
         """Test that download failure returns None."""
-        with patch('shared.helpers.requests.get') as mock_get:
+        with patch('shared.helpers._HTTP_SESSION.get') as mock_get:
             mock_get.side_effect = Exception("Connection error")
             
             result = compute_file_hash_from_url("https://example.com/file.xlsx")
@@ -129,9 +132,9 @@ class TestComputeFileHashFromUrl:
     @pytest.mark.unit
     def test_auth_headers_passed(self):
         """Test that auth headers are passed to request."""
-        with patch('shared.helpers.requests.get') as mock_get:
+        with patch('shared.helpers._HTTP_SESSION.get') as mock_get:
             mock_response = MagicMock()
-            mock_response.content = b"content"
+            mock_response.iter_content.return_value = [b"content"]
             mock_response.raise_for_status = MagicMock()
             mock_get.return_value = mock_response
             
@@ -141,6 +144,18 @@ class TestComputeFileHashFromUrl:
             mock_get.assert_called_once()
             call_kwargs = mock_get.call_args[1]
             assert call_kwargs["headers"] == auth_headers
+    
+    @pytest.mark.unit
+    def test_filename_included_after_content(self):
+        """Streamed hash matches compute_file_hash with a filename."""
+        with patch('shared.helpers._HTTP_SESSION.get') as mock_get:
+            mock_response = MagicMock()
+            mock_response.iter_content.return_value = [b"abc", b"def"]
+            mock_get.return_value = mock_response
+            
+            result = compute_file_hash_from_url("https://example.com/f.pdf", filename="f.pdf")
+            
+            assert result == compute_file_hash(b"abcdef", filename="f.pdf")
 
 
 class TestComputeFileHashFromBase64:
@@ -271,6 +286,19 @@ class TestFormatDatetimeForSmartsheet:
         dt = datetime(2026, 12, 31, 23, 59, 59)
         formatted = format_datetime_for_smartsheet(dt)
         assert formatted == "2026-12-31T23:59:59"
+    
+    @pytest.mark.unit
+    def test_microseconds_dropped(self):
+        """Test sub-second precision is not emitted."""
+        dt = datetime(2026, 1, 7, 14, 30, 45, 123456)
+        assert format_datetime_for_smartsheet(dt) == "2026-01-07T14:30:45"
+    
+    @pytest.mark.unit
+    def test_aware_datetime_converted_without_offset(self):
+        """Test aware datetimes are shifted to UAE time with no offset suffix."""
+        from datetime import timezone
+        dt = datetime(2026, 1, 7, 10, 0, 0, 500, tzinfo=timezone.utc)
+        assert format_datetime_for_smartsheet(dt) == "2026-01-07T14:00:00"
 
 
 class TestParseFloatSafe:
@@ -361,3 +389,28 @@ class TestSafeGet:
         """Test non-dict intermediate returns default."""
         d = {"key": "string value"}
         assert safe_get(d, "key", "nested") is None
+
+
+class TestIsSaveCollision:
+    """Tests for save-collision (4004) detection."""
+    
+    @pytest.mark.unit
+    def test_client_collision_error_matched_by_type(self):
+        """SmartsheetSaveCollisionError is a collision whatever its message."""
+        from shared.smartsheet_client import SmartsheetSaveCollisionError
+        
+        assert is_save_collision(SmartsheetSaveCollisionError("boom"))
+    
+    @pytest.mark.unit
+    def test_message_alone_is_not_a_collision(self):
+        """Only the typed error counts; messages mentioning 4004 / conflict do not."""
+        assert not is_save_collision(Exception("errorCode 4004: save collision"))
+        assert not is_save_collision(ValueError("SAP code conflict"))
+    
+    @pytest.mark.unit
+    def test_other_errors(self):
+        """Unrelated errors are not collisions."""
+        from shared.smartsheet_client import SmartsheetNotFoundError
+        
+        assert not is_save_collision(SmartsheetNotFoundError("row 1 not found"))
+        assert not is_save_collision(ValueError("bad value"))
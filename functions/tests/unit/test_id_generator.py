@@ -17,10 +17,15 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspa
 
 from shared.id_generator import (
     SequenceGenerator,
+    BlockIdAllocator,
+    get_block_allocator,
+    get_sequence_generator,
     generate_next_tag_id,
     generate_next_exception_id,
+    generate_next_exception_ids,
     generate_next_allocation_id,
     generate_next_consumption_id,
+    generate_next_consumption_ids,
     generate_next_delivery_id,
     generate_next_nesting_id,
     generate_next_remnant_id,
@@ -104,6 +109,61 @@ class TestSequenceGenerator:
         gen.next_id(ConfigKey.SEQ_TAG)
         assert gen.current_value(ConfigKey.SEQ_TAG) == 1
     
+    @pytest.mark.unit
+    def test_warm_read_fetches_single_row(self, mock_client):
+        """After the first lookup, the sequence is re-read by row ID, not by sheet search."""
+        gen = SequenceGenerator(mock_client)
+        gen.next_id(ConfigKey.SEQ_TAG)
+        
+        # Another process advances the counter: the warm read must still see it
+        row_id = gen._cache[ConfigKey.SEQ_TAG]
+        mock_client.storage.update_row("00a Config", row_id, {"config_value": "41"})
+        
+        with patch.object(mock_client, "find_row_by_column", wraps=mock_client.find_row_by_column) as find:
+            assert gen.next_id(ConfigKey.SEQ_TAG) == "TAG-0042"
+        find.assert_not_called()
+    
+    @pytest.mark.unit
+    def test_warm_read_falls_back_when_row_gone(self, mock_client):
+        """A deleted Config row is looked up (and recreated) again."""
+        gen = SequenceGenerator(mock_client)
+        gen.next_id(ConfigKey.SEQ_TAG)
+        row_id = gen._cache[ConfigKey.SEQ_TAG]
+        config = mock_client.storage.sheets["00a Config"]
+        config["rows"] = [r for r in config["rows"] if r["id"] != row_id]
+        
+        assert gen.next_id(ConfigKey.SEQ_TAG) == "TAG-0001"
+
+    @pytest.mark.unit
+    def test_retry_searches_config_sheet(self, mock_client):
+        """A retry re-reads the sequence by sheet search, not the cached row."""
+        gen = SequenceGenerator(mock_client)
+        gen.next_id(ConfigKey.SEQ_TAG)
+
+        with patch.object(gen, "_try_update_sequence", side_effect=[False, True]), \
+             patch("shared.id_generator.time.sleep"), \
+             patch.object(mock_client, "find_row_by_column", wraps=mock_client.find_row_by_column) as find:
+            assert gen.next_id(ConfigKey.SEQ_TAG) == "TAG-0002"
+        assert find.call_count == 1
+
+    @pytest.mark.unit
+    def test_reserve_batch(self, mock_client):
+        """Test reserving a block of IDs in one update."""
+        gen = SequenceGenerator(mock_client)
+        
+        ids = gen.reserve_batch(ConfigKey.SEQ_TAG, 3)
+        
+        assert ids == ["TAG-0001", "TAG-0002", "TAG-0003"]
+        assert gen.current_value(ConfigKey.SEQ_TAG) == 3
+        assert gen.next_id(ConfigKey.SEQ_TAG) == "TAG-0004"
+    
+    @pytest.mark.unit
+    def test_reserve_batch_rejects_non_positive_count(self, mock_client):
+        """Test reserve_batch validates count."""
+        gen = SequenceGenerator(mock_client)
+        with pytest.raises(ValueError):
+            gen.reserve_batch(ConfigKey.SEQ_TAG, 0)
+    
     @pytest.mark.unit
     def test_all_prefixes_valid(self, mock_client):
         """Test all ID prefixes generate valid IDs."""
@@ -113,6 +173,67 @@ class TestSequenceGenerator:
             id_value = gen.next_id(config_key)
             assert id_value.startswith(f"{prefix}-"), f"ID for {config_key} should start with {prefix}-"
 
+    
+    @pytest.mark.unit
+    def test_retry_backoff_is_decorrelated_and_capped(self, mock_client):
+        """Retry sleeps stay within [BASE, MAX] and grow from the previous delay."""
+        from shared.id_generator import SequenceCollisionError
+        
+        gen = SequenceGenerator(mock_client)
+        with patch.object(gen, "_try_update_sequence", return_value=False), \
+             patch("shared.id_generator.time.sleep") as sleep:
+            with pytest.raises(SequenceCollisionError):
+                gen.next_id(ConfigKey.SEQ_TAG)
+        
+        delays = [c.args[0] * 1000 for c in sleep.call_args_list]
+        assert len(delays) == gen.MAX_RETRIES - 1
+        prev = gen.BASE_DELAY_MS
+        for d in delays:
+            assert gen.BASE_DELAY_MS <= d <= min(gen.MAX_DELAY_MS, prev * 3)
+            prev = d
+
+
+class TestBlockIdAllocator:
+    """Tests for hi/lo block ID allocation."""
+    
+    @pytest.mark.unit
+    def test_one_sequence_update_per_block(self, mock_client):
+        """IDs within a block come from memory."""
+        allocator = BlockIdAllocator(mock_client, ConfigKey.SEQ_ACTION, block_size=3)
+        gen = SequenceGenerator(mock_client)
+        
+        first = allocator.next()
+        assert gen.current_value(ConfigKey.SEQ_ACTION) == 3
+        rest = [allocator.next(), allocator.next()]
+        assert gen.current_value(ConfigKey.SEQ_ACTION) == 3
+        
+        assert [first] + rest == ["ACT-0001", "ACT-0002", "ACT-0003"]
+        assert allocator.next() == "ACT-0004"
+        assert gen.current_value(ConfigKey.SEQ_ACTION) == 6
+        assert allocator.unused == ["ACT-0005", "ACT-0006"]
+    
+    @pytest.mark.unit
+    def test_get_block_allocator_shared_per_client(self, mock_client):
+        """The same client and sequence share one allocator."""
+        a = get_block_allocator(mock_client, ConfigKey.SEQ_EXCEPTION)
+        b = get_block_allocator(mock_client, ConfigKey.SEQ_EXCEPTION)
+        c = get_block_allocator(mock_client, ConfigKey.SEQ_ACTION)
+        
+        assert a is b
+        assert a is not c
+
+    
+    @pytest.mark.unit
+    def test_get_sequence_generator_shared_per_client(self, mock_client):
+        """Helpers reuse one generator per client, keeping its row-ID cache."""
+        gen = get_sequence_generator(mock_client)
+        
+        generate_next_tag_id(mock_client)
+        
+        assert get_sequence_generator(mock_client) is gen
+        assert ConfigKey.SEQ_TAG in gen._cache
+        assert get_sequence_generator(MagicMock()) is not gen
+
 
 class TestConvenienceFunctions:
     """Tests for convenience ID generation functions."""
@@ -131,6 +252,13 @@ class TestConvenienceFunctions:
         assert ex_id.startswith("EX-")
         assert ex_id == "EX-0001"
     
+    @pytest.mark.unit
+    def test_generate_next_exception_ids(self, mock_client):
+        """Test batch exception ID reservation."""
+        ids = generate_next_exception_ids(mock_client, 3)
+        assert ids == ["EX-0001", "EX-0002", "EX-0003"]
+        assert generate_next_exception_id(mock_client) == "EX-0004"
+    
     @pytest.mark.unit
     def test_generate_next_allocation_id(self, mock_client):
         """Test generate_next_allocation_id convenience function."""
@@ -138,6 +266,16 @@ class TestConvenienceFunctions:
         assert alloc_id.startswith("ALLOC-")
         assert alloc_id == "ALLOC-0001"
     
+    @pytest.mark.unit
+    def test_log_sequences_reserved_in_blocks(self, mock_client):
+        """Allocation IDs come from a pooled block: one Config write per block."""
+        from shared.id_generator import LOG_ID_BLOCK_SIZE
+        
+        ids = [generate_next_allocation_id(mock_client) for _ in range(3)]
+        
+        assert ids == ["ALLOC-0001", "ALLOC-0002", "ALLOC-0003"]
+        assert SequenceGenerator(mock_client).current_value(ConfigKey.SEQ_ALLOCATION) == LOG_ID_BLOCK_SIZE
+    
     @pytest.mark.unit
     def test_generate_next_consumption_id(self, mock_client):
         """Test generate_next_consumption_id convenience function."""
@@ -145,6 +283,13 @@ class TestConvenienceFunctions:
         assert con_id.startswith("CON-")
         assert con_id == "CON-0001"
     
+    @pytest.mark.unit
+    def test_generate_next_consumption_ids(self, mock_client):
+        """Test batch consumption ID reservation."""
+        ids = generate_next_consumption_ids(mock_client, 2)
+        assert ids == ["CON-0001", "CON-0002"]
+        assert generate_next_consumption_id(mock_client) == "CON-0003"
+    
     @pytest.mark.unit
     def test_generate_next_delivery_id(self, mock_client):
         """Test generate_next_delivery_id convenience function."""
@@ -196,6 +196,24 @@ class TestLPOIngestRequest:
         assert len(all_files) == 2
         assert all_files[0].file_type == FileType.LPO  # Legacy converted
         assert all_files[1].file_type == FileType.COSTING
+        assert len(request.files) == 1  # files list left untouched
+    
+    def test_get_all_files_without_legacy_returns_files(self):
+        """Without legacy fields get_all_files hands back the files list as is."""
+        from shared.models import LPOIngestRequest, FileAttachment, FileType
+        
+        request = LPOIngestRequest(
+            sap_reference="PTE-185",
+            customer_name="Test",
+            project_name="Test",
+            brand="KIMMCO",
+            po_quantity_sqm=100.0,
+            price_per_sqm=150.0,
+            uploaded_by="user@company.com",
+            files=[FileAttachment(file_type=FileType.LPO, file_url="https://test.com/po.pdf")]
+        )
+        
+        assert request.get_all_files() is request.files
 
 
 @pytest.mark.unit
@@ -277,6 +295,22 @@ class TestComputeCombinedFileHash:
         
         assert hash1 == hash2
     
+    def test_parallel_hash_keeps_file_type_order(self):
+        """Concurrent hashing still combines hashes in sorted file_type order."""
+        from shared.helpers import compute_combined_file_hash, compute_file_hash
+        from shared.models import FileAttachment, FileType
+        
+        contents = {FileType.LPO: b"lpo", FileType.COSTING: b"costing", FileType.AMENDMENT: b"amendment"}
+        files = [
+            FileAttachment(file_type=ft, file_content=base64.b64encode(data).decode())
+            for ft, data in contents.items()
+        ]
+        
+        expected_parts = [compute_file_hash(contents[ft]) for ft in sorted(contents, key=lambda ft: ft.value)]
+        expected = hashlib.sha256("|".join(expected_parts).encode()).hexdigest()
+        
+        assert compute_combined_file_hash(files) == expected
+    
     def test_empty_files_returns_none(self):
         """Test that empty file list returns None."""
         from shared.helpers import compute_combined_file_hash
@@ -315,6 +349,13 @@ class TestSanitizeFolderName:
         invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', '#', '%']
         for char in invalid_chars:
             assert char not in result
+        assert result == "Test_Name"
+    
+    def test_strip_then_collapse_underscores(self):
+        """Edge dots/spaces are stripped and underscore runs collapsed."""
+        from shared.helpers import sanitize_folder_name
+        
+        assert sanitize_folder_name(" ..A::B__C.. ") == "A_B_C"
     
     def test_empty_returns_unknown(self):
         """Test empty string returns 'Unknown'."""
@@ -363,6 +404,18 @@ class TestGenerateLpoFolderPath:
         folder_name = result.split("LPOs/")[1]
         assert "/" not in folder_name
         assert ":" not in folder_name
+    
+    def test_folder_url_follows_env_after_caching(self, monkeypatch):
+        """Memoized URLs still pick up the current SHAREPOINT_BASE_URL."""
+        from shared.helpers import generate_lpo_folder_url
+        
+        monkeypatch.setenv("SHAREPOINT_BASE_URL", "https://a.example/Docs/")
+        first = generate_lpo_folder_url("PTE-185", "Acme Corp")
+        monkeypatch.setenv("SHAREPOINT_BASE_URL", "https://b.example/Docs")
+        second = generate_lpo_folder_url("PTE-185", "Acme Corp")
+        
+        assert first == "https://a.example/Docs/LPOs/PTE-185_Acme%20Corp"
+        assert second == "https://b.example/Docs/LPOs/PTE-185_Acme%20Corp"
 
 
 @pytest.mark.unit
@@ -390,6 +443,7 @@ class TestAuditModuleFunctions:
     def test_log_user_action_success(self, mock_storage):
         """Test log_user_action creates record."""
         from shared.audit import log_user_action
+        from shared.audit_queue import AuditQueue
         from shared.models import ActionType
         from tests.conftest import MockSmartsheetClient
         
@@ -405,7 +459,8 @@ class TestAuditModuleFunctions:
             trace_id="trace-test"
         )
         
-        # Verify action was logged
+        # Verify action was logged once the background queue drains
+        AuditQueue.instance().flush()
         actions = mock_storage.find_rows("98 User Action Log", "Action Type", "LPO_CREATED")
         assert len(actions) >= 1
 
@@ -0,0 +1,325 @@
+"""
+Unit Tests for LPO Service
+
+Tests centralized LPO helpers:
+- Quantity / status extraction via manifest column names
+- PO balance validation
+- Flexible LPO lookup
+- Request-scoped lookup cache
+"""
+
+import threading
+import time
+
+import pytest
+from dataclasses import FrozenInstanceError
+from unittest.mock import MagicMock, patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.lpo_service import (
+    LPOQuantities,
+    LPOValidationStatus,
+    find_lpo_by_sap_reference,
+    find_lpo_flexible,
+    invalidate_lpo_cache,
+    lpo_lookup_scope,
+    get_lpo_quantities,
+    get_lpo_quantities_bulk,
+    get_lpo_status,
+    validate_lpo_status,
+    validate_po_balance,
+)
+
+
+LPO_COLUMNS = {
+    "PO_QUANTITY_SQM": "PO Quantity (Sqm)",
+    "DELIVERED_QUANTITY_SQM": "Delivered Quantity (Sqm)",
+    "PLANNED_QUANTITY": "Planned Quantity",
+    "ALLOCATED_QUANTITY": "Allocated Quantity",
+    "LPO_STATUS": "LPO Status",
+    "SAP_REFERENCE": "SAP Reference",
+}
+
+
+@pytest.fixture
+def lpo_manifest():
+    """Manifest resolving LPO_MASTER logical names to physical ones."""
+    manifest = MagicMock()
+    manifest.get_column_name.side_effect = lambda sheet, col: LPO_COLUMNS.get(col)
+    with patch("shared.lpo_service.get_manifest", return_value=manifest):
+        yield manifest
+
+
+@pytest.fixture
+def sample_lpo():
+    """LPO row keyed by physical column names."""
+    return {
+        "PO Quantity (Sqm)": "1000",
+        "Delivered Quantity (Sqm)": 200,
+        "Planned Quantity": 300,
+        "Allocated Quantity": None,
+        "LPO Status": "Active",
+        "SAP Reference": "PTE-185",
+    }
+
+
+@pytest.mark.unit
+class TestExtraction:
+    """Tests for quantity and status extraction."""
+
+    def test_get_lpo_quantities(self, lpo_manifest, sample_lpo):
+        """Quantities are parsed as floats, blanks as 0."""
+        q = get_lpo_quantities(sample_lpo)
+
+        assert q.po_quantity == 1000.0
+        assert q.allocated_quantity == 0.0
+        assert q.available_balance == 500.0
+
+    def test_bulk_matches_single(self, lpo_manifest, sample_lpo):
+        """Bulk extraction gives the same result per row, in order."""
+        other = dict(sample_lpo, **{"PO Quantity (Sqm)": 10})
+
+        bulk = get_lpo_quantities_bulk([sample_lpo, other])
+
+        assert bulk == [get_lpo_quantities(sample_lpo), get_lpo_quantities(other)]
+        assert get_lpo_quantities_bulk([]) == []
+
+    def test_quantities_are_immutable(self):
+        """Derived totals are fixed at construction; fields cannot be reassigned."""
+        q = LPOQuantities(po_quantity=100, delivered_quantity=10, planned_quantity=20, allocated_quantity=5)
+
+        assert (q.total_committed, q.available_balance) == (35, 65)
+        with pytest.raises(FrozenInstanceError):
+            q.planned_quantity = 0
+
+    def test_get_lpo_status_lowercased(self, lpo_manifest, sample_lpo):
+        """Status is normalized to lowercase."""
+        assert get_lpo_status(sample_lpo) == "active"
+
+    def test_on_hold_blocks_any_case(self, lpo_manifest, sample_lpo):
+        """An 'On Hold' LPO fails status validation regardless of case."""
+        for raw in ("On Hold", "on hold", "ON HOLD"):
+            lpo = dict(sample_lpo, **{"LPO Status": raw})
+            assert validate_lpo_status(lpo).status == LPOValidationStatus.ON_HOLD
+
+        assert validate_lpo_status(sample_lpo).status == LPOValidationStatus.OK
+
+    def test_column_names_resolved_once_per_manifest(self, lpo_manifest, sample_lpo):
+        """Repeated extraction does not go back to the manifest."""
+        for _ in range(3):
+            get_lpo_quantities(sample_lpo)
+
+        assert lpo_manifest.get_column_name.call_count == 4
+
+
+@pytest.mark.unit
+class TestValidatePoBalance:
+    """Tests for validate_po_balance."""
+
+    def test_within_tolerance(self, lpo_manifest, sample_lpo):
+        """Requests within PO quantity + 5% are OK."""
+        result = validate_po_balance(sample_lpo, 540)
+
+        assert result.status == LPOValidationStatus.OK
+        assert result.quantities.total_committed == 500.0
+
+    def test_insufficient_balance(self, lpo_manifest, sample_lpo):
+        """Requests beyond the tolerance are rejected."""
+        result = validate_po_balance(sample_lpo, 600)
+
+        assert result.status == LPOValidationStatus.INSUFFICIENT_BALANCE
+        assert result.lpo is sample_lpo
+
+    def test_zero_request_short_circuits(self, sample_lpo):
+        """Nothing requested is OK without reading quantities."""
+        with patch("shared.lpo_service.get_lpo_quantities") as get_q:
+            result = validate_po_balance(sample_lpo, 0)
+
+        assert result.status == LPOValidationStatus.OK
+        assert result.quantities is None
+        get_q.assert_not_called()
+
+    def test_missing_lpo(self):
+        """A missing LPO is NOT_FOUND."""
+        assert validate_po_balance(None, 10).status == LPOValidationStatus.NOT_FOUND
+
+
+@pytest.mark.unit
+class TestFindLpoFlexible:
+    """Tests for find_lpo_flexible."""
+
+    def test_single_reference_uses_find_row(self):
+        """One reference is a plain find_row."""
+        client = MagicMock()
+
+        find_lpo_flexible(client, sap_ref="PTE-185")
+
+        client.find_row.assert_called_once()
+        client.find_first_row.assert_not_called()
+
+    def test_lpo_id_resolved_in_one_fetch(self):
+        """lpo_id tries SAP then Customer ref via a single find_first_row."""
+        client = MagicMock()
+
+        find_lpo_flexible(client, customer_ref="CUST-1", lpo_id="PTE-185")
+
+        client.find_row.assert_not_called()
+        criteria = client.find_first_row.call_args.args[1]
+        assert [v for _, v in criteria] == ["CUST-1", "PTE-185", "PTE-185"]
+
+    def test_no_reference(self):
+        """No reference means no lookup."""
+        client = MagicMock()
+
+        assert find_lpo_flexible(client) is None
+        client.find_row.assert_not_called()
+
+    def test_matches_with_mock_client(self, mock_client):
+        """End to end against the mock client: lpo_id matches by Customer ref."""
+        mock_client.add_row("LPO_MASTER", {"SAP_REFERENCE": "PTE-185", "CUSTOMER_LPO_REF": "CUST-9"})
+
+        lpo = find_lpo_flexible(mock_client, sap_ref="NOPE", lpo_id="CUST-9")
+
+        assert lpo is not None
+
+
+@pytest.mark.unit
+class TestLookupScope:
+    """Tests for the request-scoped LPO lookup cache."""
+
+    def test_no_caching_outside_scope(self):
+        """Without a scope every lookup hits the client."""
+        client = MagicMock()
+
+        find_lpo_by_sap_reference(client, "PTE-185")
+        find_lpo_by_sap_reference(client, "PTE-185")
+
+        assert client.find_row.call_count == 2
+
+    def test_repeated_lookup_cached_in_scope(self):
+        """Inside a scope the second lookup is served from memory."""
+        client = MagicMock()
+        client.find_row.return_value = {"row_id": 1}
+
+        with lpo_lookup_scope():
+            first = find_lpo_by_sap_reference(client, "PTE-185")
+            second = find_lpo_by_sap_reference(client, "PTE-185")
+
+        assert first is second
+        assert client.find_row.call_count == 1
+
+    def test_misses_not_cached(self):
+        """A not-found LPO is looked up again (it may have just been created)."""
+        client = MagicMock()
+        client.find_row.return_value = None
+
+        with lpo_lookup_scope():
+            find_lpo_by_sap_reference(client, "PTE-185")
+            find_lpo_by_sap_reference(client, "PTE-185")
+
+        assert client.find_row.call_count == 2
+
+    def test_invalidate_after_write(self, lpo_manifest, sample_lpo):
+        """invalidate_lpo_cache drops entries keyed by, or carrying, the reference."""
+        client = MagicMock()
+        client.find_row.return_value = sample_lpo
+
+        with lpo_lookup_scope():
+            find_lpo_flexible(client, customer_ref="CUST-1")
+            invalidate_lpo_cache(sap_ref="PTE-185")
+            find_lpo_flexible(client, customer_ref="CUST-1")
+
+        assert client.find_row.call_count == 2
+
+    def test_scope_cache_is_bounded(self):
+        """Past LPO_CACHE_MAXSIZE the least recently used lookup is evicted."""
+        client = MagicMock()
+        client.find_row.side_effect = lambda sheet, col, ref: {"ref": ref}
+
+        with patch("shared.lpo_service.LPO_CACHE_MAXSIZE", 2), lpo_lookup_scope():
+            find_lpo_by_sap_reference(client, "A")
+            find_lpo_by_sap_reference(client, "B")
+            find_lpo_by_sap_reference(client, "A")  # A is now most recent
+            find_lpo_by_sap_reference(client, "C")  # evicts B
+            find_lpo_by_sap_reference(client, "A")
+            find_lpo_by_sap_reference(client, "B")
+
+        refs = [c.args[2] for c in client.find_row.call_args_list]
+        assert refs == ["A", "B", "C", "B"]
+
+    def test_multi_criteria_result_cached_under_matched_key(self, lpo_manifest, sample_lpo):
+        """A find_first_row hit is cached under the criterion it matched."""
+        client = MagicMock()
+        client.find_first_row.return_value = sample_lpo
+
+        with lpo_lookup_scope():
+            first = find_lpo_flexible(client, sap_ref="NOPE", lpo_id="PTE-185")
+            by_sap = find_lpo_by_sap_reference(client, "PTE-185")
+            again = find_lpo_flexible(client, sap_ref="PTE-185", customer_ref="CUST-1")
+
+        assert first is by_sap is again is sample_lpo
+        client.find_first_row.assert_called_once()
+        client.find_row.assert_not_called()
+
+    def test_lower_priority_hit_not_reused_for_higher_criteria(self, lpo_manifest, sample_lpo):
+        """A cached lpo_id match does not answer a lookup whose first criterion differs."""
+        client = MagicMock()
+        client.find_first_row.return_value = sample_lpo
+
+        with lpo_lookup_scope():
+            find_lpo_flexible(client, sap_ref="NOPE", lpo_id="PTE-185")
+            find_lpo_flexible(client, sap_ref="NOPE", lpo_id="PTE-185")
+
+        assert client.find_first_row.call_count == 2
+
+    def test_invalidate_outside_scope_is_noop(self):
+        """Writers can call invalidate unconditionally."""
+        invalidate_lpo_cache(sap_ref="PTE-185")
+
+
+@pytest.mark.unit
+class TestSingleflight:
+    """Tests for coalescing concurrent identical lookups."""
+
+    def test_concurrent_lookups_share_one_request(self):
+        """Callers arriving while a lookup is in flight reuse its result."""
+        release = threading.Event()
+        started = threading.Event()
+        client = MagicMock()
+
+        def slow_find_row(*args):
+            started.set()
+            release.wait(5)
+            return {"row_id": 7}
+
+        client.find_row.side_effect = slow_find_row
+        results = []
+        owner = threading.Thread(target=lambda: results.append(find_lpo_by_sap_reference(client, "PTE-185")))
+        owner.start()
+        started.wait(5)
+        waiters = [
+            threading.Thread(target=lambda: results.append(find_lpo_by_sap_reference(client, "PTE-185")))
+            for _ in range(3)
+        ]
+        for t in waiters:
+            t.start()
+        time.sleep(0.2)  # Let the waiters join the in-flight lookup
+        release.set()
+        for t in [owner] + waiters:
+            t.join(5)
+
+        assert client.find_row.call_count == 1
+        assert results == [{"row_id": 7}] * 4
+
+    def test_errors_propagate_and_are_not_remembered(self):
+        """A failed lookup raises for the caller and the next call retries."""
+        client = MagicMock()
+        client.find_row.side_effect = [RuntimeError("boom"), {"row_id": 1}]
+
+        with pytest.raises(RuntimeError):
+            find_lpo_by_sap_reference(client, "PTE-185")
+
+        assert find_lpo_by_sap_reference(client, "PTE-185") == {"row_id": 1}
@@ -0,0 +1,377 @@
+"""
+Unit Tests for Workspace Manifest
+
+Tests WorkspaceManifest loading and lookups:
+- Sheet / column ID and name resolution
+- Builder methods keeping lookups in sync
+"""
+
+import json
+import stat
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from shared.manifest import ManifestError, ManifestNotFoundError, WorkspaceManifest, get_manifest, reset_manifest
+
+
+MANIFEST_DATA = {
+    "_meta": {"version": "1.0.0", "generated_at": "2026-01-01T00:00:00"},
+    "workspace": {"id": 1, "name": "Test Workspace"},
+    "folders": {"02_TAG_REGISTRY": {"id": 11, "name": "02. Tag Registry"}},
+    "sheets": {
+        "TAG_REGISTRY": {
+            "id": 222,
+            "name": "02 Tag Sheet Registry",
+            "folder": "02_TAG_REGISTRY",
+            "columns": {
+                "TAG_ID": {"id": 333, "name": "Tag ID", "type": "TEXT_NUMBER"},
+                "FILE_HASH": {"id": 444, "name": "File Hash", "type": "TEXT_NUMBER"},
+            },
+        },
+        "PENDING": {"id": None, "name": "Not Yet Created", "folder": None, "columns": {}},
+    },
+}
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    """Manifest JSON written to a temp file."""
+    path = tmp_path / "workspace_manifest.json"
+    path.write_text(json.dumps(MANIFEST_DATA), encoding="utf-8")
+    return str(path)
+
+
+@pytest.mark.unit
+class TestLookups:
+    """Tests for ID and name accessors on a loaded manifest."""
+
+    def test_sheet_lookups(self, manifest_path):
+        """Sheets resolve by logical name; sheets without an ID are absent."""
+        manifest = WorkspaceManifest.load(manifest_path)
+
+        assert manifest.get_sheet_id("TAG_REGISTRY") == 222
+        assert manifest.get_sheet_name("TAG_REGISTRY") == "02 Tag Sheet Registry"
+        assert manifest.has_sheet("TAG_REGISTRY")
+        assert not manifest.has_sheet("PENDING")
+        assert manifest.get_sheet_id("UNKNOWN") is None
+        assert manifest.get_all_sheet_ids() == {"TAG_REGISTRY": 222}
+
+    def test_column_lookups(self, manifest_path):
+        """Columns resolve by (sheet, column) logical names."""
+        manifest = WorkspaceManifest.load(manifest_path)
+
+        assert manifest.get_column_id("TAG_REGISTRY", "FILE_HASH") == 444
+        assert manifest.get_column_name("TAG_REGISTRY", "TAG_ID") == "Tag ID"
+        assert manifest.get_column_id("TAG_REGISTRY", "UNKNOWN") is None
+        assert manifest.get_column_id("UNKNOWN", "FILE_HASH") is None
+        assert manifest.get_all_column_ids("TAG_REGISTRY") == {"TAG_ID": 333, "FILE_HASH": 444}
+
+    def test_all_sheet_ids_is_a_copy(self, manifest_path):
+        """Mutating the returned dict does not affect the manifest."""
+        manifest = WorkspaceManifest.load(manifest_path)
+
+        manifest.get_all_sheet_ids()["TAG_REGISTRY"] = 0
+
+        assert manifest.get_sheet_id("TAG_REGISTRY") == 222
+
+    def test_empty_manifest(self, tmp_path):
+        """A missing file gives an empty, loaded manifest."""
+        manifest = WorkspaceManifest.load_or_empty(str(tmp_path / "missing.json"))
+
+        assert manifest.is_loaded()
+        assert manifest.is_empty()
+        assert manifest.get_sheet_id("TAG_REGISTRY") is None
+        assert manifest.get_all_sheet_ids() == {}
+
+    def test_lookup_keys_are_interned(self, manifest_path):
+        """Names parsed from JSON are interned, so code literals match by identity."""
+        manifest = WorkspaceManifest.load(manifest_path)
+        manifest.get_column_id("TAG_REGISTRY", "FILE_HASH")
+
+        sheet_key = next(k for k in manifest._sheet_ids if k == "TAG_REGISTRY")
+        column_key = next(k for k in manifest._column_ids if k == ("TAG_REGISTRY", "FILE_HASH"))
+        assert sheet_key is sys.intern("TAG_REGISTRY")
+        assert column_key[1] is sys.intern("FILE_HASH")
+
+    def test_unloaded_manifest_is_empty(self):
+        """A manifest that was never loaded answers lookups with None."""
+        manifest = WorkspaceManifest()
+
+        assert not manifest.is_loaded()
+        assert manifest.is_empty()
+        assert manifest.workspace_id is None
+        assert manifest.get_column_name("TAG_REGISTRY", "TAG_ID") is None
+        assert manifest.get_all_column_ids("TAG_REGISTRY") == {}
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Tests for reading and writing the manifest file."""
+
+    def test_invalid_json_raises_manifest_error(self, tmp_path):
+        """A corrupt manifest is reported as ManifestError."""
+        path = tmp_path / "workspace_manifest.json"
+        path.write_text("{not json", encoding="utf-8")
+
+        with pytest.raises(ManifestError):
+            WorkspaceManifest.load(str(path))
+
+    def test_stdlib_fallback_matches(self, manifest_path, tmp_path):
+        """Without orjson the manifest loads and saves to the same document."""
+        fast = WorkspaceManifest.load(manifest_path)
+        with patch("shared.manifest.orjson", None):
+            slow = WorkspaceManifest.load(manifest_path)
+            slow.save(str(tmp_path / "slow.json"))
+        fast.save(str(tmp_path / "fast.json"))
+
+        saved = [json.loads((tmp_path / name).read_text(encoding="utf-8")) for name in ("slow.json", "fast.json")]
+        for doc in saved:
+            doc["_meta"].pop("generated_at")  # Stamped at save time
+        assert saved[0] == saved[1]
+
+    def test_failed_save_keeps_existing_file(self, manifest_path):
+        """A write that fails midway leaves the previous manifest intact."""
+        before = open(manifest_path, encoding="utf-8").read()
+        manifest = WorkspaceManifest.load(manifest_path)
+
+        with patch("shared.manifest.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                manifest.save()
+
+        assert open(manifest_path, encoding="utf-8").read() == before
+        assert not os.path.exists(manifest_path + ".tmp")
+
+    def test_non_ascii_names_kept(self, tmp_path):
+        """Physical names are written as UTF-8, not escaped."""
+        manifest = WorkspaceManifest(str(tmp_path / "m.json"))
+        manifest.add_sheet("REMARKS", 1, "Remarks – Café")
+        manifest.save()
+
+        assert "Remarks – Café" in (tmp_path / "m.json").read_text(encoding="utf-8")
+
+
+@pytest.mark.unit
+class TestBuilder:
+    """Tests for the builder methods used by create_workspace.py."""
+
+    def test_added_sheets_and_columns_resolve(self):
+        """Builder additions are visible to the accessors immediately."""
+        manifest = WorkspaceManifest()
+        manifest.set_workspace(1, "WS")
+        manifest.add_sheet("TAG_REGISTRY", 222, "02 Tag Sheet Registry")
+        manifest.add_column("TAG_REGISTRY", "TAG_ID", 333, "Tag ID", "TEXT_NUMBER")
+
+        assert manifest.get_sheet_id("TAG_REGISTRY") == 222
+        assert manifest.get_column_id("TAG_REGISTRY", "TAG_ID") == 333
+        assert manifest.get_all_sheet_ids() == {"TAG_REGISTRY": 222}
+
+    def test_lookups_follow_later_additions(self, manifest_path):
+        """Columns and sheets added after a lookup are still resolved."""
+        manifest = WorkspaceManifest.load(manifest_path)
+        assert manifest.get_column_id("TAG_REGISTRY", "STATUS") is None
+
+        manifest.add_column("TAG_REGISTRY", "STATUS", 555, "Status", "PICKLIST")
+        manifest.add_sheet("LPO_MASTER", 666, "01 LPO Master")
+
+        assert manifest.get_column_id("TAG_REGISTRY", "STATUS") == 555
+        assert manifest.get_column_name("TAG_REGISTRY", "STATUS") == "Status"
+        assert manifest.get_sheet_name("LPO_MASTER") == "01 LPO Master"
+
+    def test_add_column_requires_sheet(self):
+        """Columns can only be added to known sheets."""
+        manifest = WorkspaceManifest()
+
+        with pytest.raises(ManifestError):
+            manifest.add_column("TAG_REGISTRY", "TAG_ID", 333, "Tag ID", "TEXT_NUMBER")
+
+    def test_save_round_trip(self, manifest_path, tmp_path):
+        """A saved manifest loads back with the same lookups."""
+        manifest = WorkspaceManifest.load(manifest_path)
+        manifest.add_sheet("LPO_MASTER", 555, "01 LPO Master")
+        out = str(tmp_path / "saved.json")
+
+        manifest.save(out)
+        reloaded = WorkspaceManifest.load(out)
+
+        assert reloaded.get_all_sheet_ids() == {"TAG_REGISTRY": 222, "LPO_MASTER": 555}
+        assert reloaded.get_column_id("TAG_REGISTRY", "FILE_HASH") == 444
+
+    def test_concurrent_saves_do_not_collide(self, manifest_path, tmp_path):
+        """Parallel saves to one path each use their own temp file."""
+        out = str(tmp_path / "saved.json")
+        errors = []
+
+        def save():
+            try:
+                WorkspaceManifest.load(manifest_path).save(out)
+            except Exception as e:  # pragma: no cover - failure path
+                errors.append(e)
+
+        threads = [threading.Thread(target=save) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(5)
+
+        assert errors == []
+        assert WorkspaceManifest.load(out).get_sheet_id("TAG_REGISTRY") == 222
+        assert sorted(os.listdir(tmp_path)) == ["saved.json", "workspace_manifest.json"]
+
+    @pytest.mark.skipif(os.name != "posix", reason="POSIX permission bits")
+    def test_save_keeps_file_permissions(self, manifest_path, tmp_path):
+        """An existing manifest keeps its mode; a new one gets 0o666 minus the umask."""
+        existing = tmp_path / "existing.json"
+        existing.write_text("{}", encoding="utf-8")
+        os.chmod(existing, 0o640)
+        new = tmp_path / "new.json"
+        umask = os.umask(0o022)
+        try:
+            WorkspaceManifest.load(manifest_path).save(str(existing))
+            WorkspaceManifest.load(manifest_path).save(str(new))
+        finally:
+            os.umask(umask)
+
+        assert stat.S_IMODE(os.stat(existing).st_mode) == 0o640
+        assert stat.S_IMODE(os.stat(new).st_mode) == 0o644
+
+    def test_failed_save_removes_temp_file(self, manifest_path, tmp_path):
+        """A failed swap leaves neither a temp file nor a changed target."""
+        out = tmp_path / "saved.json"
+        out.write_text("{}", encoding="utf-8")
+
+        with patch("shared.manifest.os.replace", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                WorkspaceManifest.load(manifest_path).save(str(out))
+
+        assert not [n for n in os.listdir(tmp_path) if n.endswith(".tmp")]
+        assert out.read_text(encoding="utf-8") == "{}"
+
+
+@pytest.mark.unit
+class TestPathResolution:
+    """Tests for locating the manifest file."""
+
+    @pytest.fixture(autouse=True)
+    def _forget_path(self):
+        reset_manifest()
+        yield
+        reset_manifest()
+
+    def test_env_path_found_once(self, manifest_path, monkeypatch):
+        """The located path is remembered; later loads do not probe again."""
+        monkeypatch.setenv(WorkspaceManifest.ENV_MANIFEST_PATH, manifest_path)
+        assert WorkspaceManifest.load().get_sheet_id("TAG_REGISTRY") == 222
+
+        with patch("shared.manifest.os.path.exists") as exists:
+            assert WorkspaceManifest.load().get_sheet_id("TAG_REGISTRY") == 222
+        exists.assert_not_called()
+
+    def test_env_change_searches_again(self, manifest_path, tmp_path, monkeypatch):
+        """A different override is not answered from the remembered path."""
+        monkeypatch.setenv(WorkspaceManifest.ENV_MANIFEST_PATH, manifest_path)
+        WorkspaceManifest.load()
+        other = tmp_path / "other.json"
+        other.write_text(json.dumps({"sheets": {"LPO_MASTER": {"id": 9, "columns": {}}}}), encoding="utf-8")
+        monkeypatch.setenv(WorkspaceManifest.ENV_MANIFEST_PATH, str(other))
+
+        assert WorkspaceManifest.load().get_sheet_id("LPO_MASTER") == 9
+
+    def test_each_location_probed_once(self, monkeypatch):
+        """Running from the functions directory does not probe the same file twice."""
+        monkeypatch.delenv(WorkspaceManifest.ENV_MANIFEST_PATH, raising=False)
+        monkeypatch.chdir(os.path.dirname(WorkspaceManifest._MODULE_CANDIDATES[1]))
+
+        candidates = list(WorkspaceManifest()._candidate_paths(None))
+
+        assert len(candidates) == len(set(candidates))
+
+    def test_removed_file_is_forgotten(self, manifest_path, monkeypatch):
+        """If the remembered file disappears, loading fails and the path is dropped."""
+        monkeypatch.setenv(WorkspaceManifest.ENV_MANIFEST_PATH, manifest_path)
+        WorkspaceManifest.load()
+        os.remove(manifest_path)
+
+        with pytest.raises(ManifestNotFoundError):
+            WorkspaceManifest.load()
+        assert WorkspaceManifest._resolved_path is None
+
+
+@pytest.mark.unit
+class TestSingleton:
+    """Tests for the get_manifest singleton."""
+
+    def test_concurrent_first_calls_load_once(self):
+        """Threads racing on a cold singleton share one load."""
+        reset_manifest()
+        real_load = WorkspaceManifest.load_or_empty
+
+        def slow_load(*args, **kwargs):
+            time.sleep(0.05)
+            return real_load(*args, **kwargs)
+
+        results = []
+        with patch.object(WorkspaceManifest, "load_or_empty", side_effect=slow_load) as load:
+            threads = [threading.Thread(target=lambda: results.append(get_manifest())) for _ in range(4)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join(5)
+
+        assert load.call_count == 1
+        assert len(results) == 4 and all(m is results[0] for m in results)
+        reset_manifest()
+
+    def test_force_reload_replaces_instance(self):
+        """force_reload loads a fresh manifest."""
+        first = get_manifest()
+
+        assert get_manifest() is first
+        assert get_manifest(force_reload=True) is not first
+        reset_manifest()
+
+    def test_module_attribute_is_singleton(self):
+        """shared.manifest.MANIFEST resolves to the get_manifest() instance."""
+        from shared import manifest as manifest_module
+        from shared.manifest import MANIFEST
+
+        assert MANIFEST is get_manifest()
+        assert manifest_module.MANIFEST is get_manifest()
+        with pytest.raises(AttributeError):
+            manifest_module.NOT_A_THING
+        reset_manifest()
+
+    def test_reset_clears_registered_caches(self):
+        """reset_manifest() clears every cache registered as manifest-derived."""
+        import functools
+        from shared import manifest as manifest_module
+        from shared.event_utils import _resolve_column_id
+        from shared.lpo_service import _lpo_col
+        from shared.atomic_update import _resolve_physical_col
+        from shared.manifest import register_derived_cache
+
+        calls = []
+
+        @register_derived_cache
+        @functools.lru_cache(maxsize=None)
+        def derived(key):
+            calls.append(key)
+            return key
+
+        try:
+            derived("a")
+            derived("a")
+            reset_manifest()
+            derived("a")
+
+            assert calls == ["a", "a"]
+            for cached in (_resolve_column_id, _lpo_col, _resolve_physical_col):
+                assert cached.cache_clear in manifest_module._derived_cache_clears
+        finally:
+            manifest_module._derived_cache_clears.remove(derived.cache_clear)
@@ -8,9 +8,11 @@ Tests all Pydantic models for:
 - Type coercion
 """
 
+import json
 import pytest
 import uuid
 from datetime import datetime
+from unittest.mock import patch
 from pydantic import ValidationError
 
 import sys
@@ -127,6 +129,8 @@ class TestTagIngestRequest:
         )
         # Each should have unique ID
         assert request1.client_request_id != request2.client_request_id
+        # Undashed UUID4 hex
+        assert uuid.UUID(request1.client_request_id).hex == request1.client_request_id
     
     @pytest.mark.unit
     def test_missing_required_field(self):
@@ -217,6 +221,27 @@ class TestTagIngestRequest:
             uploaded_by="user@test.com"
         )
         assert request.user_remarks is None
+    
+    @pytest.mark.unit
+    def test_validate_json_matches_dict(self):
+        """Parsing the raw HTTP body gives the same model as the decoded dict."""
+        body = {
+            "client_request_id": "req-1",
+            "required_area_m2": 50,
+            "requested_delivery_date": "2026-02-01",
+            "uploaded_by": "user@test.com",
+            "files": [{"file_type": "other", "file_content": "YWJj", "file_name": "a.xlsx"}],
+        }
+        
+        from_json = TagIngestRequest.model_validate_json(json.dumps(body).encode())
+        
+        assert from_json == TagIngestRequest(**body)
+    
+    @pytest.mark.unit
+    def test_validate_json_rejects_malformed_body(self):
+        """Malformed JSON is a ValidationError (a ValueError), handled as a 400."""
+        with pytest.raises(ValueError):
+            TagIngestRequest.model_validate_json(b"{not json")
 
 
 class TestTagIngestResponse:
@@ -273,6 +298,36 @@ class TestExceptionRecord:
         assert record.exception_id.startswith("EX-")
         assert len(record.exception_id) > 10
     
+    @pytest.mark.unit
+    def test_exception_id_suffix_is_upper_hex(self):
+        """exception_id is EX-<date>-<6 uppercase hex digits>."""
+        record = ExceptionRecord(
+            source=ExceptionSource.INGEST,
+            reason_code=ReasonCode.DUPLICATE_UPLOAD,
+            severity=ExceptionSeverity.MEDIUM
+        )
+        _, day, suffix = record.exception_id.split("-")
+        assert len(day) == 8 and day.isdigit()
+        assert len(suffix) == 6 and suffix == suffix.upper()
+        int(suffix, 16)
+    
+    @pytest.mark.unit
+    def test_exception_id_date_follows_utc_day(self):
+        """The cached date prefix rolls over when the UTC day changes."""
+        days = iter([datetime(2024, 3, 1, 23, 59), datetime(2024, 3, 2, 0, 1)])
+        with patch("shared.models.datetime") as dt:
+            dt.utcnow.side_effect = lambda: next(days)
+            first, second = (
+                ExceptionRecord(
+                    source=ExceptionSource.INGEST,
+                    reason_code=ReasonCode.DUPLICATE_UPLOAD,
+                    severity=ExceptionSeverity.MEDIUM
+                ).exception_id
+                for _ in range(2)
+            )
+        assert first.startswith("EX-20240301-")
+        assert second.startswith("EX-20240302-")
+    
     @pytest.mark.unit
     def test_created_at_default(self):
         """Test that created_at defaults to utcnow."""
@@ -229,6 +229,82 @@ class TestFnParseNestingIntegration:
         assert body['status'] == "SUCCESS"
         assert body['tag_id'] == "TAG-001"
 
+    @patch('fn_parse_nesting.trigger_nesting_complete_flow')
+    @patch('fn_parse_nesting.upload_nesting_json')
+    @patch('fn_parse_nesting.upload_content_blob')
+    @patch('fn_parse_nesting.atomic_increment')
+    @patch('fn_parse_nesting.get_lpo_details')
+    @patch('fn_parse_nesting.validate_tag_is_planned')
+    @patch('fn_parse_nesting.NestingFileParser')
+    @patch('fn_parse_nesting.create_exception')
+    def test_failed_excel_upload_keeps_json_url(
+        self,
+        mock_create_exception,
+        mock_parser_cls,
+        mock_validate_planned,
+        mock_lpo_details,
+        mock_atomic_increment,
+        mock_upload_content,
+        mock_upload_json,
+        mock_trigger_flow,
+        patched_client
+    ):
+        """Only the failed upload is reported; the other URL is still used."""
+        mock_parser = mock_parser_cls.return_value
+        mock_parser.parse.return_value.status = "SUCCESS"
+        mock_parser.parse.return_value.data = NestingExecutionRecord(
+            meta_data=MetaData(project_ref_id="TAG-001", source_file_name="f.xlsx"),
+            raw_material_panel=RawMaterialPanel(
+                material_spec_name="GI", thickness_mm=1,
+                inventory_impact={'utilized_sheets_count': 1, 'gross_area_m2': 10}
+            )
+        )
+        mock_parser.parse.return_value.processing_time_ms = 100
+        mock_validate_planned.return_value = ValidationResult(
+            is_valid=True, planning_row_id=100, planned_date="2026-02-04"
+        )
+        mock_lpo_details.return_value = ValidationResult(
+            is_valid=True, lpo_row_id=200, brand="DUCTMATE", area_type="External"
+        )
+        mock_atomic_increment.return_value = MagicMock(
+            success=True, old_value=10.0, new_value=20.0, retries_used=0
+        )
+        mock_upload_json.return_value = "https://blob.storage/json"
+        mock_upload_content.side_effect = RuntimeError("excel upload refused")
+        mock_trigger_flow.return_value = MagicMock(
+            to_dict=lambda: {"status": "triggered", "fire_and_forget": True}
+        )
+        
+        patched_client.add_row(
+            Sheet.TAG_REGISTRY,
+            {Column.TAG_REGISTRY.TAG_ID: "TAG-001", Column.TAG_REGISTRY.LPO_SAP_REFERENCE: "PTE-185"}
+        )
+        
+        req = MagicMock()
+        req.headers = {}
+        req.files = {}
+        req.get_json.return_value = {
+            "client_request_id": "req-upload-001",
+            "file_content_base64": base64.b64encode(b"dummy_content").decode(),
+            "filename": "nesting.xlsx",
+            "sap_lpo_reference": "PTE-185",
+            "uploaded_by": "user@test.com"
+        }
+        
+        resp = main(req)
+        
+        assert resp.status_code == 200
+        body = json.loads(resp.get_body())
+        assert body["json_blob_url"] == "https://blob.storage/json"
+        assert "excel_blob_url" not in body
+        assert mock_trigger_flow.call_args.kwargs["json_blob_url"] == "https://blob.storage/json"
+        
+        upload_errors = [
+            c.kwargs["message"] for c in mock_create_exception.call_args_list
+            if "blob storage" in c.kwargs.get("message", "")
+        ]
+        assert upload_errors == ["Failed to upload excel file to blob storage: excel upload refused"]
+
     def test_main_missing_file(self):
         """Test returning 400 when file content is missing."""
         req = MagicMock()
@@ -0,0 +1,84 @@
+"""
+Unit Tests for the shared package surface
+
+Tests that:
+- Heavy HTTP-backed modules and the record models are not imported with the package
+- Lazily imported names still resolve via `from shared import ...`
+- __all__ is generated without duplicates
+"""
+
+import pytest
+import subprocess
+import sys
+import os
+
+FUNCTIONS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, FUNCTIONS_DIR)
+
+import shared
+
+
+LAZY_MODULES = (
+    "shared.smartsheet_client",
+    "shared.power_automate",
+    "shared.lpo_service",
+    "shared.record_models",
+)
+
+
+class TestLazyImports:
+    """Tests for PEP 562 lazy loading in shared/__init__.py."""
+
+    @pytest.mark.unit
+    def test_import_does_not_load_http_modules(self):
+        """`import shared` in a fresh interpreter leaves lazy modules unloaded."""
+        code = (
+            "import sys, shared; "
+            f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            cwd=FUNCTIONS_DIR, capture_output=True, text=True, check=True,
+        )
+        assert result.stdout.strip() == ""
+
+    @pytest.mark.unit
+    def test_lazy_names_resolve(self):
+        """Every lazily exported name is importable from the package."""
+        for name in shared._LAZY_IMPORTS:
+            assert getattr(shared, name) is not None
+
+    @pytest.mark.unit
+    def test_record_models_resolve_from_models_module(self):
+        """Record models moved out of shared.models are still reachable there."""
+        from shared.models import LPORecord
+
+        assert LPORecord is shared.LPORecord
+        with pytest.raises(AttributeError):
+            shared.models.NotAModel
+
+    @pytest.mark.unit
+    def test_unknown_name_raises_attribute_error(self):
+        """Unknown names still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            shared.does_not_exist
+
+
+class TestExports:
+    """Tests for the generated __all__."""
+
+    @pytest.mark.unit
+    def test_all_has_no_duplicates(self):
+        """__all__ lists each name once."""
+        assert len(shared.__all__) == len(set(shared.__all__))
+
+    @pytest.mark.unit
+    def test_all_includes_lazy_names(self):
+        """Lazy names are exported without a second registration."""
+        assert set(shared._LAZY_IMPORTS) <= set(shared.__all__)
+
+    @pytest.mark.unit
+    def test_all_names_resolve(self):
+        """Every exported name resolves on the package."""
+        for name in shared.__all__:
+            assert hasattr(shared, name), name
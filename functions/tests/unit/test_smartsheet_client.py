@@ -5,6 +5,7 @@ Tests for new client methods:
 - get_row_attachments: listing attachments for a specific row
 - get_user_email: resolving user ID to email with caching
 - get_row: single row fetching
+- find_first_row: prioritized multi-criteria lookup
 """
 
 import pytest
@@ -207,3 +208,51 @@ class TestGetRow:
         # Verify URL
         args, kwargs = mock_request.call_args
         assert "/sheets/123456789/rows/888" in kwargs.get("url", "")
+
+
+@pytest.mark.unit
+class TestFindFirstRow:
+    """Tests for find_first_row (several criteria, one sheet fetch)."""
+
+    SHEET = {
+        "id": 123456789,
+        "columns": [{"id": 1, "title": "SAP Reference"}, {"id": 2, "title": "Customer LPO Ref"}],
+        "rows": [
+            {"id": 10, "cells": [{"columnId": 1, "value": "OTHER"}, {"columnId": 2, "value": "PTE-185"}]},
+            {"id": 20, "cells": [{"columnId": 1, "value": 185.0}, {"columnId": 2, "value": "X"}]},
+        ],
+    }
+
+    def test_priority_order_wins_over_row_order(self, client):
+        """A later row matching an earlier criterion beats an earlier row."""
+        with patch.object(client, "get_sheet", return_value=self.SHEET) as get_sheet:
+            row = client.find_first_row(
+                "LPO_MASTER", [("SAP Reference", "185"), ("Customer LPO Ref", "PTE-185")]
+            )
+
+        assert row["row_id"] == 20
+        get_sheet.assert_called_once()
+
+    def test_falls_back_to_later_criteria(self, client):
+        """Later criteria are used when earlier ones match nothing."""
+        with patch.object(client, "get_sheet", return_value=self.SHEET):
+            row = client.find_first_row(
+                "LPO_MASTER", [("SAP Reference", "PTE-185"), ("Customer LPO Ref", "PTE-185")]
+            )
+            missing = client.find_first_row("LPO_MASTER", [("SAP Reference", "NOPE")])
+
+        assert row["row_id"] == 10
+        assert missing is None
+
+    def test_unresolvable_column_skipped(self, client):
+        """A criterion on a column the sheet lacks is skipped, not fatal."""
+        from shared.smartsheet_client import SmartsheetNotFoundError
+
+        with patch.object(client, "get_sheet", return_value=self.SHEET):
+            row = client.find_first_row(
+                "LPO_MASTER", [("Renamed Column", "185"), ("Customer LPO Ref", "PTE-185")]
+            )
+            with pytest.raises(SmartsheetNotFoundError):
+                client.find_first_row("LPO_MASTER", [("Renamed Column", "185")])
+
+        assert row["row_id"] == 10